@@ -0,0 +1,301 @@
+"""Aggregate logged answers into confusion, accuracy and time-to-answer summaries.
+
+    python -m Chords.analytics [--db progress.sqlite3 ...] [--log answers.jsonl ...]
+                               [--mode identify|play|ear] [--all-answers] [--output PATH]
+
+Answers are streamed in fixed-size chunks, so memory stays bounded however
+large the logs are. Answers that ProgressStore.compact() folded into day
+totals are counted too. The summary is a small .npz the app loads on startup.
+"""
+import argparse
+import itertools
+import json
+import os
+import sqlite3
+import zipfile
+
+import numpy as np
+
+from Chords.chords import CHORDS
+from Chords.model import COMPILED_CHORDS
+from Chords.progress import DEFAULT_PROGRESS_DB
+from Chords.quiz import EAR_MODE, IDENTIFY_MODE, PLAY_MODE
+
+DEFAULT_ANALYTICS_SUMMARY = os.path.join(os.path.dirname(DEFAULT_PROGRESS_DB), "analytics.npz")
+ANALYTICS_ENV_VAR = "CHORD_TRAINER_ANALYTICS"
+CHUNK_SIZE = 65536
+# Time-to-answer histogram bin edges in milliseconds; the last bin is open-ended.
+TIME_BINS_MS = np.array([0, 500, 1000, 1500, 2000, 3000, 4000, 6000, 8000, 12000, 16000, 30000, 60000])
+MODES = {"identify": IDENTIFY_MODE, "play": PLAY_MODE, "ear": EAR_MODE}
+
+
+def _connect_ro(path):
+    return sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+
+def _has_table(conn, name):
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)).fetchone() is not None
+
+
+# --- Sources: each yields (mode, chord, answer, correct, first, elapsed_ms) ---
+def iter_progress_db(path, chunk_size=CHUNK_SIZE):
+    """Answers from a ProgressStore database, read with a cursor so rows are never all in memory.
+
+    Only answers not yet compacted; see iter_compacted_totals() for the rest.
+    """
+    conn = _connect_ro(path)
+    try:
+        cursor = conn.execute("SELECT mode, chord, answer, correct, first, elapsed_ms FROM answers")
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            yield from rows
+    finally:
+        conn.close()
+
+
+def iter_answer_log(path):
+    """Answers from a JSON-lines export, one object per line with the ProgressStore column names."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                yield (row["mode"], row["chord"], row["answer"], int(row["correct"]), int(row.get("first", 1)),
+                       int(row["elapsed_ms"]))
+
+
+# --- Compacted sources: one row per (mode, chord), or (mode, chord, answer), so they are small ---
+def iter_compacted_totals(path):
+    """(mode, chord, answered, correct, elapsed_ms) summed over a database's compacted first answers."""
+    conn = _connect_ro(path)
+    try:
+        if _has_table(conn, "chord_days"):
+            yield from conn.execute(
+                "SELECT mode, chord, SUM(answered), SUM(correct), SUM(elapsed_ms) FROM chord_days GROUP BY mode, chord")
+    finally:
+        conn.close()
+
+
+def iter_compacted_confusions(path):
+    """(mode, chord, wrong answer, count) summed over a database's compacted first answers."""
+    conn = _connect_ro(path)
+    try:
+        if _has_table(conn, "confusion_days"):
+            yield from conn.execute(
+                "SELECT mode, chord, answer, SUM(answered) FROM confusion_days GROUP BY mode, chord, answer")
+    finally:
+        conn.close()
+
+
+def chunked(rows, size=CHUNK_SIZE):
+    rows = iter(rows)
+    while True:
+        chunk = list(itertools.islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class AnswerStats:
+    """Confusion matrix, accuracy and time-to-answer over CHORDS names.
+
+    confusion[i, j] counts questions on names[i] answered with names[j], so the
+    diagonal holds correct answers. Only first answers count unless
+    first_only is False: retries after a wrong click are not fresh recall.
+    Answers naming chords outside CHORDS are counted in skipped.
+
+    Compacted answers (update_compacted) add to the totals, mean times and
+    confusions; their individual times are gone, so time_histogram and
+    median_seconds() cover uncompacted answers only. answered and correct
+    are kept alongside confusion, since a database compacted before
+    confusion_days existed has totals but no confusion rows.
+    """
+
+    def __init__(self, names=None, mode=None, first_only=True):
+        self.names = tuple(names if names is not None else CHORDS)
+        self.mode = mode
+        self.first_only = first_only
+        self._index = {name: i for i, name in enumerate(self.names)}
+        n = len(self.names)
+        self.confusion = np.zeros((n, n), dtype=np.int64)
+        self.answered = np.zeros(n, dtype=np.int64)
+        self.correct = np.zeros(n, dtype=np.int64)
+        self.elapsed_ms = np.zeros(n, dtype=np.int64)
+        self.time_histogram = np.zeros((n, len(TIME_BINS_MS)), dtype=np.int64)
+        self.skipped = 0
+
+    # --- Aggregation ---
+    def update(self, rows, chunk_size=CHUNK_SIZE):
+        """Consume an iterable of answer rows chunk by chunk; returns self."""
+        index = self._index
+        for chunk in chunked(rows, chunk_size):
+            questions, answers, times = [], [], []
+            for mode, chord, answer, _correct, first, elapsed_ms in chunk:
+                if (self.first_only and not first) or (self.mode is not None and mode != self.mode):
+                    continue
+                q = index.get(chord)
+                a = index.get(answer)
+                if q is None or a is None:
+                    self.skipped += 1
+                    continue
+                questions.append(q)
+                answers.append(a)
+                times.append(elapsed_ms)
+            if not questions:
+                continue
+            q = np.array(questions, dtype=np.intp)
+            a = np.array(answers, dtype=np.intp)
+            np.add.at(self.confusion, (q, a), 1)
+            np.add.at(self.answered, q, 1)
+            np.add.at(self.correct, q[q == a], 1)
+            t = np.array(times, dtype=np.int64)
+            np.add.at(self.elapsed_ms, q, t)
+            np.add.at(self.time_histogram, (q, np.searchsorted(TIME_BINS_MS, t, side="right") - 1), 1)
+        return self
+
+    def update_compacted(self, totals, confusions):
+        """Add compacted first answers: rows from iter_compacted_totals() and iter_compacted_confusions()."""
+        index = self._index
+        for mode, chord, answered, correct, elapsed_ms in totals:
+            q = index.get(chord)
+            if self.mode is not None and mode != self.mode:
+                continue
+            if q is None:
+                self.skipped += answered
+                continue
+            self.answered[q] += answered
+            self.correct[q] += correct
+            self.confusion[q, q] += correct
+            self.elapsed_ms[q] += elapsed_ms
+        for mode, chord, answer, count in confusions:
+            q = index.get(chord)
+            a = index.get(answer)
+            if (self.mode is not None and mode != self.mode) or q is None or a is None:
+                continue
+            self.confusion[q, a] += count
+        return self
+
+    # --- Per-chord views ---
+    def chord_accuracy(self):
+        """{chord: (answered, correct, mean seconds to answer)} for chords with answers."""
+        answered, correct = self.answered, self.correct
+        return {
+            self.names[i]: (int(answered[i]), int(correct[i]), self.elapsed_ms[i] / answered[i] / 1000)
+            for i in np.flatnonzero(answered)
+        }
+
+    def median_seconds(self, name):
+        """Median time to answer, to the resolution of TIME_BINS_MS, or None without answers."""
+        histogram = self.time_histogram[self._index[name]]
+        total = histogram.sum()
+        if not total:
+            return None
+        return TIME_BINS_MS[np.searchsorted(np.cumsum(histogram), (total + 1) // 2)] / 1000
+
+    def by_attribute(self, attr):
+        """Accuracy grouped by a Chord attribute such as "quality" or "inversion".
+
+        Names no longer in the chord library (a summary older than the library) are left out.
+        """
+        answered, correct = self.answered, self.correct
+        groups = {}
+        for i in np.flatnonzero(answered):
+            chord = COMPILED_CHORDS.get(self.names[i])
+            if chord is None:
+                continue
+            key = getattr(chord, attr)
+            n, c, ms = groups.get(key, (0, 0, 0))
+            groups[key] = (n + int(answered[i]), c + int(correct[i]), ms + int(self.elapsed_ms[i]))
+        return {key: (n, c, ms / n / 1000) for key, (n, c, ms) in groups.items()}
+
+    def top_confusions(self, k=10, among=None):
+        """The k most frequent (chord, wrong answer, count), optionally only between names in among."""
+        confusion = self.confusion.copy()
+        np.fill_diagonal(confusion, 0)
+        if among is not None:
+            keep = np.zeros(len(self.names), dtype=bool)
+            keep[[self._index[name] for name in among if name in self._index]] = True
+            confusion[~keep, :] = 0
+            confusion[:, ~keep] = 0
+        flat = np.argsort(confusion, axis=None)[::-1][:k]
+        rows, cols = np.unravel_index(flat, confusion.shape)
+        return [(self.names[i], self.names[j], int(confusion[i, j])) for i, j in zip(rows, cols) if confusion[i, j]]
+
+    # --- Columnar summary file ---
+    def save(self, path):
+        """Write a compressed .npz; the confusion matrix is stored sparse (it is mostly zeros)."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        rows, cols = np.nonzero(self.confusion)
+        tmp = path + ".tmp.npz"
+        np.savez_compressed(
+            tmp,
+            names=np.array(self.names),
+            confusion_rows=rows.astype(np.int32),
+            confusion_cols=cols.astype(np.int32),
+            confusion_counts=self.confusion[rows, cols],
+            answered=self.answered,
+            correct=self.correct,
+            elapsed_ms=self.elapsed_ms,
+            time_histogram=self.time_histogram,
+            time_bins_ms=TIME_BINS_MS,
+            skipped=np.array(self.skipped),
+            mode=np.array(self.mode or ""),
+            first_only=np.array(self.first_only),
+        )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        """Read a save() file; ValueError if it is not one or was written with other time bins."""
+        try:
+            return cls._load(path)
+        except (KeyError, EOFError, zipfile.BadZipFile) as e:
+            raise ValueError(f"{path} is not an analytics summary ({e}); rebuild it") from e
+
+    @classmethod
+    def _load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            if not np.array_equal(data["time_bins_ms"], TIME_BINS_MS):
+                raise ValueError(f"{path} was written with different time bins; rebuild it")
+            stats = cls(data["names"].tolist(), str(data["mode"]) or None, bool(data["first_only"]))
+            stats.confusion[data["confusion_rows"], data["confusion_cols"]] = data["confusion_counts"]
+            if "answered" in data:
+                stats.answered[:] = data["answered"]
+                stats.correct[:] = data["correct"]
+            else:  # written before the totals were stored separately
+                stats.answered[:] = stats.confusion.sum(axis=1)
+                stats.correct[:] = np.diagonal(stats.confusion)
+            stats.elapsed_ms[:] = data["elapsed_ms"]
+            stats.time_histogram[:] = data["time_histogram"]
+            stats.skipped = int(data["skipped"])
+        return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", action="append", default=[], help="ProgressStore database (repeatable)")
+    parser.add_argument("--log", action="append", default=[], help="JSON-lines answer log (repeatable)")
+    parser.add_argument("--mode", choices=sorted(MODES))
+    parser.add_argument("--all-answers", action="store_true", help="count retries, not only first answers")
+    parser.add_argument("--output", default=DEFAULT_ANALYTICS_SUMMARY)
+    args = parser.parse_args(argv)
+    if not args.db and not args.log:
+        args.db = [DEFAULT_PROGRESS_DB]
+
+    stats = AnswerStats(mode=MODES.get(args.mode), first_only=not args.all_answers)
+    sources = [iter_progress_db(path) for path in args.db] + [iter_answer_log(path) for path in args.log]
+    stats.update(itertools.chain.from_iterable(sources))
+    for path in args.db:
+        stats.update_compacted(iter_compacted_totals(path), iter_compacted_confusions(path))
+    stats.save(args.output)
+
+    answered = stats.answered
+    print(f"{int(answered.sum())} answers over {np.count_nonzero(answered)} chords "
+          f"({stats.skipped} skipped) -> {args.output}")
+    for chord, answer, count in stats.top_confusions(5):
+        print(f"  {chord} -> {answer}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import json
+import mmap
+import os
+import struct
+
+# File layout: MAGIC | u32 little-endian index length | JSON index | data blob.
+# The index maps each key to [offset, length] within the data blob.
+MAGIC = b"CTATLAS1"
+_HEADER = struct.Struct("<I")
+
+DEFAULT_DIAGRAM_ATLAS = os.path.join(os.path.dirname(__file__), "assets", "diagrams.atlas")
+DEFAULT_AUDIO_BANK = os.path.join(os.path.dirname(__file__), "assets", "audio.atlas")
+
+
+def diagram_asset_key(chord_name, low_note, high_note, theme, fmt):
+    return f"{theme}/{low_note}-{high_note}/{fmt}/{chord_name}"
+
+
+def audio_asset_key(chord_name):
+    return f"wav/{chord_name}"
+
+
+def write_atlas(path, items, meta=None):
+    """Pack (key, bytes) pairs into a single atlas file, replacing it atomically."""
+    index = {}
+    blobs = []
+    offset = 0
+    for key, data in items:
+        if key in index:
+            raise ValueError(f"Duplicate atlas key: {key!r}")
+        index[key] = [offset, len(data)]
+        blobs.append(data)
+        offset += len(data)
+    header = json.dumps({"meta": meta or {}, "index": index}, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_HEADER.pack(len(header)))
+        f.write(header)
+        for data in blobs:
+            f.write(data)
+    os.replace(tmp_path, path)
+    return len(index)
+
+
+class Atlas:
+    """Read-only, memory-mapped view of an atlas file.
+
+    get() returns a memoryview slice of the mapping, so lookups never copy or
+    decode asset bytes.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        if view[:len(MAGIC)] != MAGIC:
+            view.release()
+            self._mmap.close()
+            raise ValueError(f"Not an atlas file: {path}")
+        (header_len,) = _HEADER.unpack_from(view, len(MAGIC))
+        header_start = len(MAGIC) + _HEADER.size
+        header = json.loads(bytes(view[header_start:header_start + header_len]))
+        self.meta = header["meta"]
+        self._index = header["index"]
+        self._data = view[header_start + header_len:]
+
+    def get(self, key, default=None):
+        entry = self._index.get(key)
+        if entry is None:
+            return default
+        offset, length = entry
+        return self._data[offset:offset + length]
+
+    def __getitem__(self, key):
+        data = self.get(key)
+        if data is None:
+            raise KeyError(key)
+        return data
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def keys(self):
+        return self._index.keys()
+
+    def close(self):
+        self._data.release()
+        self._mmap.close()
+
+
+def load_atlas(path):
+    """Open the atlas at path, or return None if it has not been built."""
+    if not os.path.exists(path):
+        return None
+    return Atlas(path)
@@ -0,0 +1,110 @@
+import functools
+import io
+import wave
+
+import numpy as np
+
+from Chords.lru import ByteLRU
+from Chords.pitch import to_midi_set
+
+SAMPLE_RATE = 22050
+DEFAULT_DURATION = 1.5
+DEFAULT_STRUM = 0.03
+# Relative strength of the first partials: a soft, piano-like tone.
+HARMONICS = np.array([1.0, 0.5, 0.3, 0.18, 0.1, 0.06])
+# A 1.5 s mono 16-bit clip at 22.05 kHz is ~66 KB, so the whole library fits comfortably.
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def midi_to_hz(midi):
+    return 440.0 * 2.0 ** ((np.asarray(midi, dtype=np.float64) - 69) / 12)
+
+
+@functools.lru_cache(maxsize=128)
+def note_samples(midi, duration=DEFAULT_DURATION, sample_rate=SAMPLE_RATE):
+    """One note's decaying tone: every partial computed in a single (partials, samples) broadcast.
+
+    Cached per note, so a chord is only a sum of shifted rows. The array is
+    shared and read-only.
+    """
+    t = np.arange(int(duration * sample_rate), dtype=np.float64) / sample_rate
+    partials = np.arange(1, len(HARMONICS) + 1)[:, None]
+    # Higher partials decay faster, which is what makes the tone sound struck rather than organ-like.
+    tone = np.sin(2 * np.pi * midi_to_hz(midi) * partials * t) * np.exp(-(1.5 + 0.8 * partials) * t)
+    samples = HARMONICS @ tone
+    attack = min(len(t), int(0.005 * sample_rate))
+    samples[:attack] *= np.linspace(0.0, 1.0, attack, endpoint=False)
+    samples.flags.writeable = False
+    return samples
+
+
+def synthesize(midi_notes, duration=DEFAULT_DURATION, sample_rate=SAMPLE_RATE, strum=DEFAULT_STRUM):
+    """A voicing as float32 samples in [-1, 1]: notes enter strum seconds apart from the lowest up."""
+    length = int(duration * sample_rate)
+    signal = np.zeros(length)
+    for i, midi in enumerate(sorted(midi_notes)):
+        offset = min(length, round(i * strum * sample_rate))
+        signal[offset:] += note_samples(midi, duration, sample_rate)[:length - offset]
+    release = min(length, int(0.05 * sample_rate))
+    signal[length - release:] *= np.linspace(1.0, 0.0, release)
+    peak = np.abs(signal).max()
+    return (signal * (0.8 / peak) if peak else signal).astype(np.float32)
+
+
+def encode_wav(samples, sample_rate=SAMPLE_RATE):
+    """16-bit mono WAV bytes for float samples in [-1, 1]."""
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2")
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm.tobytes())
+    return buf.getvalue()
+
+
+def render_voicing_wav(midi_notes, duration=DEFAULT_DURATION, sample_rate=SAMPLE_RATE, strum=DEFAULT_STRUM):
+    return encode_wav(synthesize(midi_notes, duration, sample_rate, strum), sample_rate)
+
+
+def audio_key(notes, duration=DEFAULT_DURATION, sample_rate=SAMPLE_RATE, strum=DEFAULT_STRUM):
+    """Content address of a clip: the MIDI notes (spelling and order do not matter) and synthesis settings."""
+    return tuple(sorted(to_midi_set(notes))), duration, sample_rate, strum
+
+
+class AudioCache:
+    """Process-wide LRU cache of encoded WAV clips, bounded by bytes held."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, render=render_voicing_wav):
+        self._render = render
+        self._clips = ByteLRU(max_bytes)
+
+    def get(self, notes, duration=DEFAULT_DURATION, sample_rate=SAMPLE_RATE, strum=DEFAULT_STRUM):
+        key = audio_key(notes, duration, sample_rate, strum)
+        data = self._clips.get(key)
+        if data is None:
+            # Synthesize outside the lock; a concurrent miss on the same key just renders twice.
+            data = self._render(*key)
+            self._clips.put(key, data)
+        return data
+
+    def warm_up(self, voicings, duration=DEFAULT_DURATION, sample_rate=SAMPLE_RATE, strum=DEFAULT_STRUM):
+        """Synthesize every voicing in a {name: notes or MIDI numbers} mapping ahead of the first request."""
+        for notes in voicings.values():
+            self.get(notes, duration, sample_rate, strum)
+
+    @property
+    def max_bytes(self):
+        return self._clips.max_bytes
+
+    def clear(self):
+        self._clips.clear()
+
+    def stats(self):
+        return self._clips.stats()
+
+    def __len__(self):
+        return len(self._clips)
+
+
+AUDIO_CACHE = AudioCache()
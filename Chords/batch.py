@@ -0,0 +1,50 @@
+import os
+
+from Chords.encoding import check_format, encode_diagram, encode_png, encode_webp
+from Chords.keyboard import DEFAULT_HIGH_NOTE, DEFAULT_LOW_NOTE, DEFAULT_SIZE
+from Chords.renderer import RENDERER
+
+# Below this many diagrams per worker, process start-up and pickling cost more than they save.
+MIN_CHUNK_SIZE = 16
+# Raster formats, encoded from the batch-composited images; svg is drawn directly.
+_RASTER_ENCODERS = {"png": encode_png, "webp": encode_webp}
+
+
+def _encode_chunk(job):
+    voicings, fmt, low_note, high_note, size, theme = job
+    if check_format(fmt) == "svg":
+        return [encode_diagram(v, fmt, low_note, high_note, size, theme) for v in voicings]
+    encode = _RASTER_ENCODERS[fmt]
+    return [encode(img) for img in RENDERER.render_batch(voicings, low_note, high_note, size, theme)]
+
+
+def _chunks(items, chunk_size):
+    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+def render_batch_parallel(voicings, fmt="png", low_note=DEFAULT_LOW_NOTE, high_note=DEFAULT_HIGH_NOTE,
+                          size=DEFAULT_SIZE, theme="light", workers=None, chunk_size=None):
+    """Encode many diagrams across a process pool, returning bytes in input order.
+
+    voicings are MIDI tuples (or spelled notes). Each worker renders its chunk
+    through the batch compositing path, so the base layer is built once per
+    worker rather than once per diagram. workers=1 runs in-process.
+    """
+    check_format(fmt)  # here, not in a worker, so a bad format fails before the pool starts
+    voicings = [tuple(v) for v in voicings]
+    if not voicings:
+        return []
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        # Roughly four chunks per worker keeps the pool busy when chunks finish unevenly.
+        chunk_size = max(MIN_CHUNK_SIZE, -(-len(voicings) // (workers * 4)))
+    jobs = [(chunk, fmt, low_note, high_note, tuple(size), theme) for chunk in _chunks(voicings, chunk_size)]
+
+    if workers == 1 or len(jobs) == 1:
+        results = map(_encode_chunk, jobs)
+        return [data for chunk in results for data in chunk]
+    # Imported here: pulling in multiprocessing costs ~50 ms of app start-up otherwise.
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        return [data for chunk in pool.map(_encode_chunk, jobs) for data in chunk]
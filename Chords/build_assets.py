@@ -0,0 +1,131 @@
+"""Pre-render every voicing diagram (and optionally audio clip) into packed, memory-mappable atlases.
+
+    python -m Chords.build_assets [--output PATH] [--format png] [--theme light --theme dark]
+                                  [--range auto --range C3-C6] [--workers N]
+                                  [--audio [--audio-output PATH]]
+"""
+import argparse
+import hashlib
+import time
+
+from Chords.atlas import (
+    DEFAULT_AUDIO_BANK,
+    DEFAULT_DIAGRAM_ATLAS,
+    audio_asset_key,
+    diagram_asset_key,
+    load_atlas,
+    write_atlas,
+)
+from Chords.audio import DEFAULT_DURATION, DEFAULT_STRUM, SAMPLE_RATE, AudioCache
+from Chords.batch import render_batch_parallel
+from Chords.encoding import MIME_TYPES
+from Chords.keyboard import AUTO_RANGE, DEFAULT_SIZE, group_by_range, parse_keyboard_range
+from Chords.model import VOICED_CHORDS
+from Chords.renderer import THEMES
+
+# Keyboard range settings, as the app's CHORD_TRAINER_KEYBOARD_RANGE: "auto" or (low_note, high_note).
+SUPPORTED_RANGES = (AUTO_RANGE,)
+
+
+def parse_range(text):
+    try:
+        return parse_keyboard_range(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def voicings_fingerprint(chords=VOICED_CHORDS):
+    """Hash of the voicing library, stored in the atlas so stale builds can be detected."""
+    digest = hashlib.sha256()
+    for name in sorted(chords):
+        digest.update(f"{name}:{chords[name].midi}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_current_atlas(path):
+    """Open a built atlas, or return None if it is missing or was built from an older voicing library."""
+    atlas = load_atlas(path)
+    if atlas is not None and atlas.meta.get("fingerprint") != voicings_fingerprint():
+        atlas.close()
+        return None
+    return atlas
+
+
+def iter_diagrams(chords, ranges, themes, fmt, size=DEFAULT_SIZE, workers=None):
+    voicings = {name: chord.midi for name, chord in chords.items()}
+    for theme in themes:
+        # Range settings can resolve a voicing to the same keys ("auto" and the range it fits), so skip repeats.
+        seen = set()
+        for keyboard_range in ranges:
+            for (low_note, high_note), group in group_by_range(voicings, keyboard_range).items():
+                names = [name for name in group if (name, low_note, high_note) not in seen]
+                seen.update((name, low_note, high_note) for name in names)
+                encoded = render_batch_parallel([group[name] for name in names], fmt, low_note, high_note, size,
+                                                theme, workers=workers)
+                for name, data in zip(names, encoded):
+                    yield diagram_asset_key(name, low_note, high_note, theme, fmt), data
+
+
+def build_diagram_atlas(path, ranges=SUPPORTED_RANGES, themes=tuple(THEMES), fmt="png", size=DEFAULT_SIZE,
+                        chords=VOICED_CHORDS, workers=None):
+    meta = {
+        "kind": "diagrams",
+        "format": fmt,
+        "mime_type": MIME_TYPES[fmt],
+        "ranges": [r if r == AUTO_RANGE else list(r) for r in ranges],
+        "themes": list(themes),
+        "size": list(size),
+        "fingerprint": voicings_fingerprint(chords),
+    }
+    return write_atlas(path, iter_diagrams(chords, ranges, themes, fmt, size, workers), meta)
+
+
+def iter_audio(chords, duration=DEFAULT_DURATION, sample_rate=SAMPLE_RATE, strum=DEFAULT_STRUM):
+    # A private cache, so voicings sharing their MIDI notes are synthesized once.
+    cache = AudioCache()
+    for name, chord in chords.items():
+        yield audio_asset_key(name), cache.get(chord.midi, duration, sample_rate, strum)
+
+
+def build_audio_bank(path, chords=VOICED_CHORDS, duration=DEFAULT_DURATION, sample_rate=SAMPLE_RATE,
+                     strum=DEFAULT_STRUM):
+    meta = {
+        "kind": "audio",
+        "format": "wav",
+        "mime_type": "audio/wav",
+        "sample_rate": sample_rate,
+        "duration": duration,
+        "strum": strum,
+        "fingerprint": voicings_fingerprint(chords),
+    }
+    return write_atlas(path, iter_audio(chords, duration, sample_rate, strum), meta)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default=DEFAULT_DIAGRAM_ATLAS)
+    parser.add_argument("--format", choices=sorted(MIME_TYPES), default="png")
+    parser.add_argument("--theme", action="append", choices=sorted(THEMES), dest="themes")
+    parser.add_argument("--range", action="append", type=parse_range, dest="ranges")
+    parser.add_argument("--workers", type=int, default=None, help="render processes (default: CPU count)")
+    parser.add_argument("--audio", action="store_true", help="also build the ear-training audio bank")
+    parser.add_argument("--audio-output", default=DEFAULT_AUDIO_BANK)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    count = build_diagram_atlas(
+        args.output,
+        ranges=tuple(args.ranges or SUPPORTED_RANGES),
+        themes=tuple(args.themes or THEMES),
+        fmt=args.format,
+        workers=args.workers,
+    )
+    print(f"Wrote {count} diagrams to {args.output} in {time.perf_counter() - start:.2f}s")
+    if args.audio:
+        start = time.perf_counter()
+        count = build_audio_bank(args.audio_output)
+        print(f"Wrote {count} audio clips to {args.audio_output} in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import functools
+from types import MappingProxyType
+
+from Chords.chords import CHORDS
+from Chords.model import COMPILED_CHORDS
+
+CATEGORIES = ("Major", "Minor", "Diminished", "Sevenths & Extensions")
+DEFAULT_BASES = ("C major", "A minor", "E minor", "G major")
+
+
+def base_name(chord_name):
+    """Sidebar group a chord belongs to, e.g. 'C major seventh root' -> 'C major seventh'."""
+    words = chord_name.split()
+    if "major" in words or "minor" in words or "diminished" in words:
+        if "seventh" in chord_name or "flat five" in chord_name or "dominant" in chord_name:
+            return " ".join(words[:3])
+        return " ".join(words[:2])
+    return " ".join(words[:2])
+
+
+def category_name(base):
+    """Sidebar expander a base group is listed under."""
+    if "major" in base and "seventh" not in base:
+        return "Major"
+    if "minor" in base and "seventh" not in base:
+        return "Minor"
+    if "diminished" in base:
+        return "Diminished"
+    return "Sevenths & Extensions"
+
+
+class Catalogue:
+    """Read-only grouped and categorised views of the chord library, built once.
+
+    names:      every chord name, in CHORDS order
+    ids:        chord name -> index into names, so per-session state can hold small ints
+    grouped:    base -> chord names, in CHORDS order
+    categories: category -> sorted base names
+    options:    base -> chord names with the root position first, then the rest sorted
+    """
+
+    def __init__(self, chords, compiled):
+        all_names = tuple(chords)
+        grouped = {}
+        for chord_name in all_names:
+            grouped.setdefault(base_name(chord_name), []).append(chord_name)
+
+        categories = {cat: [] for cat in CATEGORIES}
+        for base in grouped:
+            categories[category_name(base)].append(base)
+
+        options = {}
+        for base, names in grouped.items():
+            roots = [n for n in names if compiled[n].inversion == 0]
+            others = sorted(n for n in names if compiled[n].inversion != 0)
+            options[base] = tuple(roots + others)
+
+        self.names = all_names
+        self.ids = MappingProxyType({name: i for i, name in enumerate(all_names)})
+        self.grouped = MappingProxyType({base: tuple(names) for base, names in grouped.items()})
+        self.categories = MappingProxyType({cat: tuple(sorted(bases)) for cat, bases in categories.items()})
+        self.options = MappingProxyType(options)
+
+    def selected_chords(self, bases):
+        """All chord names in the given base groups, in the order the bases are given."""
+        grouped = self.grouped
+        return tuple(name for base in bases for name in grouped[base])
+
+
+@functools.lru_cache(maxsize=None)
+def get_catalogue():
+    return Catalogue(CHORDS, COMPILED_CHORDS)
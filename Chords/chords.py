@@ -1,316 +1,5 @@
-CHORDS = {
-    # Major triads
-    "C major root": ["C", "E", "G"],
-    "C major 1st inversion": ["E", "G", "C"],
-    "C major 2nd inversion": ["G", "C", "E"],
-    "C# major root": ["C#", "E#", "G#"],
-    "C# major 1st inversion": ["E#", "G#", "C#"],
-    "C# major 2nd inversion": ["G#", "C#", "E#"],
-    "D major root": ["D", "F#", "A"],
-    "D major 1st inversion": ["F#", "A", "D"],
-    "D major 2nd inversion": ["A", "D", "F#"],
-    "Eb major root": ["Eb", "G", "Bb"],
-    "Eb major 1st inversion": ["G", "Bb", "Eb"],
-    "Eb major 2nd inversion": ["Bb", "Eb", "G"],
-    "E major root": ["E", "G#", "B"],
-    "E major 1st inversion": ["G#", "B", "E"],
-    "E major 2nd inversion": ["B", "E", "G#"],
-    "F major root": ["F", "A", "C"],
-    "F major 1st inversion": ["A", "C", "F"],
-    "F major 2nd inversion": ["C", "F", "A"],
-    "F# major root": ["F#", "A#", "C#"],
-    "F# major 1st inversion": ["A#", "C#", "F#"],
-    "F# major 2nd inversion": ["C#", "F#", "A#"],
-    "G major root": ["G", "B", "D"],
-    "G major 1st inversion": ["B", "D", "G"],
-    "G major 2nd inversion": ["D", "G", "B"],
-    "Ab major root": ["Ab", "C", "Eb"],
-    "Ab major 1st inversion": ["C", "Eb", "Ab"],
-    "Ab major 2nd inversion": ["Eb", "Ab", "C"],
-    "A major root": ["A", "C#", "E"],
-    "A major 1st inversion": ["C#", "E", "A"],
-    "A major 2nd inversion": ["E", "A", "C#"],
-    "Bb major root": ["Bb", "D", "F"],
-    "Bb major 1st inversion": ["D", "F", "Bb"],
-    "Bb major 2nd inversion": ["F", "Bb", "D"],
-    "B major root": ["B", "D#", "F#"],
-    "B major 1st inversion": ["D#", "F#", "B"],
-    "B major 2nd inversion": ["F#", "B", "D#"],
+from Chords.generator import LEGACY_QUALITIES, ChordLibrary
 
-    # Minor triads
-    "C minor root": ["C", "Eb", "G"],
-    "C minor 1st inversion": ["Eb", "G", "C"],
-    "C minor 2nd inversion": ["G", "C", "Eb"],
-    "C# minor root": ["C#", "E", "G#"],
-    "C# minor 1st inversion": ["E", "G#", "C#"],
-    "C# minor 2nd inversion": ["G#", "C#", "E"],
-    "D minor root": ["D", "F", "A"],
-    "D minor 1st inversion": ["F", "A", "D"],
-    "D minor 2nd inversion": ["A", "D", "F"],
-    "Eb minor root": ["Eb", "Gb", "Bb"],
-    "Eb minor 1st inversion": ["Gb", "Bb", "Eb"],
-    "Eb minor 2nd inversion": ["Bb", "Eb", "Gb"],
-    "E minor root": ["E", "G", "B"],
-    "E minor 1st inversion": ["G", "B", "E"],
-    "E minor 2nd inversion": ["B", "E", "G"],
-    "F minor root": ["F", "Ab", "C"],
-    "F minor 1st inversion": ["Ab", "C", "F"],
-    "F minor 2nd inversion": ["C", "F", "Ab"],
-    "F# minor root": ["F#", "A", "C#"],
-    "F# minor 1st inversion": ["A", "C#", "F#"],
-    "F# minor 2nd inversion": ["C#", "F#", "A"],
-    "G minor root": ["G", "Bb", "D"],
-    "G minor 1st inversion": ["Bb", "D", "G"],
-    "G minor 2nd inversion": ["D", "G", "Bb"],
-    "Ab minor root": ["Ab", "Cb", "Eb"],
-    "Ab minor 1st inversion": ["Cb", "Eb", "Ab"],
-    "Ab minor 2nd inversion": ["Eb", "Ab", "Cb"],
-    "A minor root": ["A", "C", "E"],
-    "A minor 1st inversion": ["C", "E", "A"],
-    "A minor 2nd inversion": ["E", "A", "C"],
-    "Bb minor root": ["Bb", "Db", "F"],
-    "Bb minor 1st inversion": ["Db", "F", "Bb"],
-    "Bb minor 2nd inversion": ["F", "Bb", "Db"],
-    "B minor root": ["B", "D", "F#"],
-    "B minor 1st inversion": ["D", "F#", "B"],
-    "B minor 2nd inversion": ["F#", "B", "D"],
-
-    # Diminished triads
-    "C diminished root": ["C", "Eb", "Gb"],
-    "C diminished 1st inversion": ["Eb", "Gb", "C"],
-    "C diminished 2nd inversion": ["Gb", "C", "Eb"],
-    "C# diminished root": ["C#", "E", "G"],
-    "C# diminished 1st inversion": ["E", "G", "C#"],
-    "C# diminished 2nd inversion": ["G", "C#", "E"],
-    "D diminished root": ["D", "F", "Ab"],
-    "D diminished 1st inversion": ["F", "Ab", "D"],
-    "D diminished 2nd inversion": ["Ab", "D", "F"],
-    "Eb diminished root": ["Eb", "Gb", "Bb"],
-    "Eb diminished 1st inversion": ["Gb", "Bb", "Eb"],
-    "Eb diminished 2nd inversion": ["Bb", "Eb", "Gb"],
-    "E diminished root": ["E", "G", "Bb"],
-    "E diminished 1st inversion": ["G", "Bb", "E"],
-    "E diminished 2nd inversion": ["Bb", "E", "G"],
-    "F diminished root": ["F", "Ab", "Cb"],
-    "F diminished 1st inversion": ["Ab", "Cb", "F"],
-    "F diminished 2nd inversion": ["Cb", "F", "Ab"],
-    "F# diminished root": ["F#", "A", "C"],
-    "F# diminished 1st inversion": ["A", "C", "F#"],
-    "F# diminished 2nd inversion": ["C", "F#", "A"],
-    "G diminished root": ["G", "Bb", "Db"],
-    "G diminished 1st inversion": ["Bb", "Db", "G"],
-    "G diminished 2nd inversion": ["Db", "G", "Bb"],
-    "Ab diminished root": ["Ab", "Cb", "Eb"],
-    "Ab diminished 1st inversion": ["Cb", "Eb", "Ab"],
-    "Ab diminished 2nd inversion": ["Eb", "Ab", "Cb"],
-    "A diminished root": ["A", "C", "Eb"],
-    "A diminished 1st inversion": ["C", "Eb", "A"],
-    "A diminished 2nd inversion": ["Eb", "A", "C"],
-    "Bb diminished root": ["Bb", "Db", "Fb"],
-    "Bb diminished 1st inversion": ["Db", "Fb", "Bb"],
-    "Bb diminished 2nd inversion": ["Fb", "Bb", "Db"],
-    "B diminished root": ["B", "D", "F"],
-    "B diminished 1st inversion": ["D", "F", "B"],
-    "B diminished 2nd inversion": ["F", "B", "D"],
-
-    # Major sevenths
-    "C major seventh root": ["C", "E", "G", "B"],
-    "C major seventh 1st inversion": ["E", "G", "B", "C"],
-    "C major seventh 2nd inversion": ["G", "B", "C", "E"],
-    "C major seventh 3rd inversion": ["B", "C", "E", "G"],
-    "C# major seventh root": ["C#", "E#", "G#", "B#"],
-    "C# major seventh 1st inversion": ["E#", "G#", "B#", "C#"],
-    "C# major seventh 2nd inversion": ["G#", "B#", "C#", "E#"],
-    "C# major seventh 3rd inversion": ["B#", "C#", "E#", "G#"],
-    "D major seventh root": ["D", "F#", "A", "C#"],
-    "D major seventh 1st inversion": ["F#", "A", "C#", "D"],
-    "D major seventh 2nd inversion": ["A", "C#", "D", "F#"],
-    "D major seventh 3rd inversion": ["C#", "D", "F#", "A"],
-    "Eb major seventh root": ["Eb", "G", "Bb", "D"],
-    "Eb major seventh 1st inversion": ["G", "Bb", "D", "Eb"],
-    "Eb major seventh 2nd inversion": ["Bb", "D", "Eb", "G"],
-    "Eb major seventh 3rd inversion": ["D", "Eb", "G", "Bb"],
-    "E major seventh root": ["E", "G#", "B", "D#"],
-    "E major seventh 1st inversion": ["G#", "B", "D#", "E"],
-    "E major seventh 2nd inversion": ["B", "D#", "E", "G#"],
-    "E major seventh 3rd inversion": ["D#", "E", "G#", "B"],
-    "F major seventh root": ["F", "A", "C", "E"],
-    "F major seventh 1st inversion": ["A", "C", "E", "F"],
-    "F major seventh 2nd inversion": ["C", "E", "F", "A"],
-    "F major seventh 3rd inversion": ["E", "F", "A", "C"],
-    "F# major seventh root": ["F#", "A#", "C#", "E#"],
-    "F# major seventh 1st inversion": ["A#", "C#", "E#", "F#"],
-    "F# major seventh 2nd inversion": ["C#", "E#", "F#", "A#"],
-    "F# major seventh 3rd inversion": ["E#", "F#", "A#", "C#"],
-    "G major seventh root": ["G", "B", "D", "F#"],
-    "G major seventh 1st inversion": ["B", "D", "F#", "G"],
-    "G major seventh 2nd inversion": ["D", "F#", "G", "B"],
-    "G major seventh 3rd inversion": ["F#", "G", "B", "D"],
-    "Ab major seventh root": ["Ab", "C", "Eb", "G"],
-    "Ab major seventh 1st inversion": ["C", "Eb", "G", "Ab"],
-    "Ab major seventh 2nd inversion": ["Eb", "G", "Ab", "C"],
-    "Ab major seventh 3rd inversion": ["G", "Ab", "C", "Eb"],
-    "A major seventh root": ["A", "C#", "E", "G#"],
-    "A major seventh 1st inversion": ["C#", "E", "G#", "A"],
-    "A major seventh 2nd inversion": ["E", "G#", "A", "C#"],
-    "A major seventh 3rd inversion": ["G#", "A", "C#", "E"],
-    "Bb major seventh root": ["Bb", "D", "F", "A"],
-    "Bb major seventh 1st inversion": ["D", "F", "A", "Bb"],
-    "Bb major seventh 2nd inversion": ["F", "A", "Bb", "D"],
-    "Bb major seventh 3rd inversion": ["A", "Bb", "D", "F"],
-    "B major seventh root": ["B", "D#", "F#", "A#"],
-    "B major seventh 1st inversion": ["D#", "F#", "A#", "B"],
-    "B major seventh 2nd inversion": ["F#", "A#", "B", "D#"],
-    "B major seventh 3rd inversion": ["A#", "B", "D#", "F#"],
-
-    # Dominant sevenths
-    "C dominant seventh root": ["C", "E", "G", "Bb"],
-    "C dominant seventh 1st inversion": ["E", "G", "Bb", "C"],
-    "C dominant seventh 2nd inversion": ["G", "Bb", "C", "E"],
-    "C dominant seventh 3rd inversion": ["Bb", "C", "E", "G"],
-    "C# dominant seventh root": ["C#", "E#", "G#", "B"],
-    "C# dominant seventh 1st inversion": ["E#", "G#", "B", "C#"],
-    "C# dominant seventh 2nd inversion": ["G#", "B", "C#", "E#"],
-    "C# dominant seventh 3rd inversion": ["B", "C#", "E#", "G#"],
-    "D dominant seventh root": ["D", "F#", "A", "C"],
-    "D dominant seventh 1st inversion": ["F#", "A", "C", "D"],
-    "D dominant seventh 2nd inversion": ["A", "C", "D", "F#"],
-    "D dominant seventh 3rd inversion": ["C", "D", "F#", "A"],
-    "Eb dominant seventh root": ["Eb", "G", "Bb", "Db"],
-    "Eb dominant seventh 1st inversion": ["G", "Bb", "Db", "Eb"],
-    "Eb dominant seventh 2nd inversion": ["Bb", "Db", "Eb", "G"],
-    "Eb dominant seventh 3rd inversion": ["Db", "Eb", "G", "Bb"],
-    "E dominant seventh root": ["E", "G#", "B", "D"],
-    "E dominant seventh 1st inversion": ["G#", "B", "D", "E"],
-    "E dominant seventh 2nd inversion": ["B", "D", "E", "G#"],
-    "E dominant seventh 3rd inversion": ["D", "E", "G#", "B"],
-    "F dominant seventh root": ["F", "A", "C", "Eb"],
-    "F dominant seventh 1st inversion": ["A", "C", "Eb", "F"],
-    "F dominant seventh 2nd inversion": ["C", "Eb", "F", "A"],
-    "F dominant seventh 3rd inversion": ["Eb", "F", "A", "C"],
-    "F# dominant seventh root": ["F#", "A#", "C#", "E"],
-    "F# dominant seventh 1st inversion": ["A#", "C#", "E", "F#"],
-    "F# dominant seventh 2nd inversion": ["C#", "E", "F#", "A#"],
-    "F# dominant seventh 3rd inversion": ["E", "F#", "A#", "C#"],
-    "G dominant seventh root": ["G", "B", "D", "F"],
-    "G dominant seventh 1st inversion": ["B", "D", "F", "G"],
-    "G dominant seventh 2nd inversion": ["D", "F", "G", "B"],
-    "G dominant seventh 3rd inversion": ["F", "G", "B", "D"],
-    "Ab dominant seventh root": ["Ab", "C", "Eb", "Gb"],
-    "Ab dominant seventh 1st inversion": ["C", "Eb", "Gb", "Ab"],
-    "Ab dominant seventh 2nd inversion": ["Eb", "Gb", "Ab", "C"],
-    "Ab dominant seventh 3rd inversion": ["Gb", "Ab", "C", "Eb"],
-    "A dominant seventh root": ["A", "C#", "E", "G"],
-    "A dominant seventh 1st inversion": ["C#", "E", "G", "A"],
-    "A dominant seventh 2nd inversion": ["E", "G", "A", "C#"],
-    "A dominant seventh 3rd inversion": ["G", "A", "C#", "E"],
-    "Bb dominant seventh root": ["Bb", "D", "F", "Ab"],
-    "Bb dominant seventh 1st inversion": ["D", "F", "Ab", "Bb"],
-    "Bb dominant seventh 2nd inversion": ["F", "Ab", "Bb", "D"],
-    "Bb dominant seventh 3rd inversion": ["Ab", "Bb", "D", "F"],
-    "B dominant seventh root": ["B", "D#", "F#", "A"],
-    "B dominant seventh 1st inversion": ["D#", "F#", "A", "B"],
-    "B dominant seventh 2nd inversion": ["F#", "A", "B", "D#"],
-    "B dominant seventh 3rd inversion": ["A", "B", "D#", "F#"],
-
-    # Minor sevenths
-    "C minor seventh root": ["C", "Eb", "G", "Bb"],
-    "C minor seventh 1st inversion": ["Eb", "G", "Bb", "C"],
-    "C minor seventh 2nd inversion": ["G", "Bb", "C", "Eb"],
-    "C minor seventh 3rd inversion": ["Bb", "C", "Eb", "G"],
-    "C# minor seventh root": ["C#", "E", "G#", "B"],
-    "C# minor seventh 1st inversion": ["E", "G#", "B", "C#"],
-    "C# minor seventh 2nd inversion": ["G#", "B", "C#", "E"],
-    "C# minor seventh 3rd inversion": ["B", "C#", "E", "G#"],
-    "D minor seventh root": ["D", "F", "A", "C"],
-    "D minor seventh 1st inversion": ["F", "A", "C", "D"],
-    "D minor seventh 2nd inversion": ["A", "C", "D", "F"],
-    "D minor seventh 3rd inversion": ["C", "D", "F", "A"],
-    "Eb minor seventh root": ["Eb", "Gb", "Bb", "Db"],
-    "Eb minor seventh 1st inversion": ["Gb", "Bb", "Db", "Eb"],
-    "Eb minor seventh 2nd inversion": ["Bb", "Db", "Eb", "Gb"],
-    "Eb minor seventh 3rd inversion": ["Db", "Eb", "Gb", "Bb"],
-    "E minor seventh root": ["E", "G", "B", "D"],
-    "E minor seventh 1st inversion": ["G", "B", "D", "E"],
-    "E minor seventh 2nd inversion": ["B", "D", "E", "G"],
-    "E minor seventh 3rd inversion": ["D", "E", "G", "B"],
-    "F minor seventh root": ["F", "Ab", "C", "Eb"],
-    "F minor seventh 1st inversion": ["Ab", "C", "Eb", "F"],
-    "F minor seventh 2nd inversion": ["C", "Eb", "F", "Ab"],
-    "F minor seventh 3rd inversion": ["Eb", "F", "Ab", "C"],
-    "F# minor seventh root": ["F#", "A", "C#", "E"],
-    "F# minor seventh 1st inversion": ["A", "C#", "E", "F#"],
-    "F# minor seventh 2nd inversion": ["C#", "E", "F#", "A"],
-    "F# minor seventh 3rd inversion": ["E", "F#", "A", "C#"],
-    "G minor seventh root": ["G", "Bb", "D", "F"],
-    "G minor seventh 1st inversion": ["Bb", "D", "F", "G"],
-    "G minor seventh 2nd inversion": ["D", "F", "G", "Bb"],
-    "G minor seventh 3rd inversion": ["F", "G", "Bb", "D"],
-    "Ab minor seventh root": ["Ab", "Cb", "Eb", "Gb"],
-    "Ab minor seventh 1st inversion": ["Cb", "Eb", "Gb", "Ab"],
-    "Ab minor seventh 2nd inversion": ["Eb", "Gb", "Ab", "Cb"],
-    "Ab minor seventh 3rd inversion": ["Gb", "Ab", "Cb", "Eb"],
-    "A minor seventh root": ["A", "C", "E", "G"],
-    "A minor seventh 1st inversion": ["C", "E", "G", "A"],
-    "A minor seventh 2nd inversion": ["E", "G", "A", "C"],
-    "A minor seventh 3rd inversion": ["G", "A", "C", "E"],
-    "Bb minor seventh root": ["Bb", "Db", "F", "Ab"],
-    "Bb minor seventh 1st inversion": ["Db", "F", "Ab", "Bb"],
-    "Bb minor seventh 2nd inversion": ["F", "Ab", "Bb", "Db"],
-    "Bb minor seventh 3rd inversion": ["Ab", "Bb", "Db", "F"],
-    "B minor seventh root": ["B", "D", "F#", "A"],
-    "B minor seventh 1st inversion": ["D", "F#", "A", "B"],
-    "B minor seventh 2nd inversion": ["F#", "A", "B", "D"],
-    "B minor seventh 3rd inversion": ["A", "B", "D", "F#"],
-
-    # Minor seventh flat five (half-diminished)
-    "C minor seventh flat five root": ["C", "Eb", "Gb", "Bb"],
-    "C minor seventh flat five 1st inversion": ["Eb", "Gb", "Bb", "C"],
-    "C minor seventh flat five 2nd inversion": ["Gb", "Bb", "C", "Eb"],
-    "C minor seventh flat five 3rd inversion": ["Bb", "C", "Eb", "Gb"],
-    "C# minor seventh flat five root": ["C#", "E", "G", "B"],
-    "C# minor seventh flat five 1st inversion": ["E", "G", "B", "C#"],
-    "C# minor seventh flat five 2nd inversion": ["G", "B", "C#", "E"],
-    "C# minor seventh flat five 3rd inversion": ["B", "C#", "E", "G"],
-    "D minor seventh flat five root": ["D", "F", "Ab", "C"],
-    "D minor seventh flat five 1st inversion": ["F", "Ab", "C", "D"],
-    "D minor seventh flat five 2nd inversion": ["Ab", "C", "D", "F"],
-    "D minor seventh flat five 3rd inversion": ["C", "D", "F", "Ab"],
-    "Eb minor seventh flat five root": ["Eb", "Gb", "Bb", "Db"],
-    "Eb minor seventh flat five 1st inversion": ["Gb", "Bb", "Db", "Eb"],
-    "Eb minor seventh flat five 2nd inversion": ["Bb", "Db", "Eb", "Gb"],
-    "Eb minor seventh flat five 3rd inversion": ["Db", "Eb", "Gb", "Bb"],
-    "E minor seventh flat five root": ["E", "G", "Bb", "D"],
-    "E minor seventh flat five 1st inversion": ["G", "Bb", "D", "E"],
-    "E minor seventh flat five 2nd inversion": ["Bb", "D", "E", "G"],
-    "E minor seventh flat five 3rd inversion": ["D", "E", "G", "Bb"],
-    "F minor seventh flat five root": ["F", "Ab", "Cb", "Eb"],
-    "F minor seventh flat five 1st inversion": ["Ab", "Cb", "Eb", "F"],
-    "F minor seventh flat five 2nd inversion": ["Cb", "Eb", "F", "Ab"],
-    "F minor seventh flat five 3rd inversion": ["Eb", "F", "Ab", "Cb"],
-    "F# minor seventh flat five root": ["F#", "A", "C", "E"],
-    "F# minor seventh flat five 1st inversion": ["A", "C", "E", "F#"],
-    "F# minor seventh flat five 2nd inversion": ["C", "E", "F#", "A"],
-    "F# minor seventh flat five 3rd inversion": ["E", "F#", "A", "C"],
-    "G minor seventh flat five root": ["G", "Bb", "Db", "F"],
-    "G minor seventh flat five 1st inversion": ["Bb", "Db", "F", "G"],
-    "G minor seventh flat five 2nd inversion": ["Db", "F", "G", "Bb"],
-    "G minor seventh flat five 3rd inversion": ["F", "G", "Bb", "Db"],
-    "Ab minor seventh flat five root": ["Ab", "Cb", "Eb", "Gb"],
-    "Ab minor seventh flat five 1st inversion": ["Cb", "Eb", "Gb", "Ab"],
-    "Ab minor seventh flat five 2nd inversion": ["Eb", "Gb", "Ab", "Cb"],
-    "Ab minor seventh flat five 3rd inversion": ["Gb", "Ab", "Cb", "Eb"],
-    "A minor seventh flat five root": ["A", "C", "Eb", "G"],
-    "A minor seventh flat five 1st inversion": ["C", "Eb", "G", "A"],
-    "A minor seventh flat five 2nd inversion": ["Eb", "G", "A", "C"],
-    "A minor seventh flat five 3rd inversion": ["G", "A", "C", "Eb"],
-    "Bb minor seventh flat five root": ["Bb", "Db", "Fb", "Ab"],
-    "Bb minor seventh flat five 1st inversion": ["Db", "Fb", "Ab", "Bb"],
-    "Bb minor seventh flat five 2nd inversion": ["Fb", "Ab", "Bb", "Db"],
-    "Bb minor seventh flat five 3rd inversion": ["Ab", "Bb", "Db", "Fb"],
-    "B minor seventh flat five root": ["B", "D", "F", "A"],
-    "B minor seventh flat five 1st inversion": ["D", "F", "A", "B"],
-    "B minor seventh flat five 2nd inversion": ["F", "A", "B", "D"],
-    "B minor seventh flat five 3rd inversion": ["A", "B", "D", "F"],
-    # ... (add all diminished chords similarly)
-}
+# {chord name: spelled notes, bass first} for the original seven qualities, generated
+# from interval formulas on lookup. Chords.generator.CHORD_LIBRARY has every quality.
+CHORDS = ChordLibrary(LEGACY_QUALITIES)
@@ -0,0 +1,99 @@
+from Chords.batch import render_batch_parallel
+from Chords.encoding import encode_diagram
+from Chords.keyboard import (
+    DEFAULT_HIGH_NOTE,
+    DEFAULT_LOW_NOTE,
+    DEFAULT_SIZE,
+)
+from Chords.lru import ByteLRU
+from Chords.pitch import to_midi_set
+from Chords.renderer import RENDERER
+
+# Diagrams are palette images (one byte per pixel), so a 700x150 image costs ~105 KB;
+# encoded PNG/WebP/SVG entries are well under 1 KB.
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+
+
+def diagram_key(highlight_notes, low_note=DEFAULT_LOW_NOTE, high_note=DEFAULT_HIGH_NOTE, size=DEFAULT_SIZE):
+    """Content address of a diagram: the keys it lights up, its range and its size.
+
+    highlight_notes may be MIDI numbers or spelled notes; enharmonic spellings
+    ('Eb4' / 'D#4' / 63) and note order all collapse to the same key.
+    """
+    highlights = tuple(sorted(to_midi_set(highlight_notes)))
+    return highlights, low_note, high_note, tuple(size)
+
+
+class DiagramCache:
+    """Process-wide LRU cache of keyboard diagrams, bounded by bytes held.
+
+    get() caches PIL images; get_encoded() caches PNG/WebP/SVG bytes, encoded
+    once per distinct diagram. Cached images are shared between sessions and
+    must not be mutated by callers.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, render=RENDERER.render, encode=encode_diagram):
+        self._render = render
+        self._encode = encode
+        self._entries = ByteLRU(max_bytes, _sizeof)
+
+    def get(self, highlight_notes, low_note=DEFAULT_LOW_NOTE, high_note=DEFAULT_HIGH_NOTE, size=DEFAULT_SIZE):
+        key = diagram_key(highlight_notes, low_note, high_note, size)
+        img = self._entries.get(key)
+        if img is None:
+            # Render outside the lock; a concurrent miss on the same key just renders twice.
+            img = self._render(key[0], low_note, high_note, size)
+            self._entries.put(key, img)
+        return img
+
+    def get_encoded(self, highlight_notes, fmt="png", low_note=DEFAULT_LOW_NOTE, high_note=DEFAULT_HIGH_NOTE,
+                    size=DEFAULT_SIZE, theme="light"):
+        """Encoded diagram bytes in fmt ('png', 'webp' or 'svg')."""
+        diagram = diagram_key(highlight_notes, low_note, high_note, size)
+        key = diagram + (fmt, theme)
+        data = self._entries.get(key)
+        if data is None:
+            data = self._encode(diagram[0], fmt, low_note, high_note, size, theme)
+            self._entries.put(key, data)
+        return data
+
+    def warm_up(self, voicings, low_note=DEFAULT_LOW_NOTE, high_note=DEFAULT_HIGH_NOTE, size=DEFAULT_SIZE,
+                fmt=None, theme="light", workers=1):
+        """Render every voicing in a {name: notes or MIDI numbers} mapping ahead of the first request.
+
+        With fmt set, only the encoded bytes are cached, not the images, and
+        workers > 1 encodes them across a process pool.
+        """
+        if fmt is None:
+            for notes in voicings.values():
+                self.get(notes, low_note, high_note, size)
+            return
+        keys = {}
+        for notes in voicings.values():
+            diagram = diagram_key(notes, low_note, high_note, size)
+            keys.setdefault(diagram + (fmt, theme), diagram[0])
+        encoded = render_batch_parallel(list(keys.values()), fmt, low_note, high_note, size, theme, workers=workers)
+        for key, data in zip(keys, encoded):
+            self._entries.put(key, data)
+
+    @property
+    def max_bytes(self):
+        return self._entries.max_bytes
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        return self._entries.stats()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def _sizeof(value):
+    if isinstance(value, bytes):
+        return len(value)
+    return value.width * value.height * len(value.getbands())
+
+
+DIAGRAM_CACHE = DiagramCache()
@@ -0,0 +1,73 @@
+import io
+
+from Chords.keyboard import DEFAULT_HIGH_NOTE, DEFAULT_LOW_NOTE, DEFAULT_SIZE, DIAGRAM_SECONDS, keyboard_layout
+from Chords.metrics import METRICS
+from Chords.pitch import midi_to_name, to_midi_set
+from Chords.renderer import BLACK, HIGHLIGHT, RENDERER, THEMES, WHITE
+
+MIME_TYPES = {"png": "image/png", "webp": "image/webp", "svg": "image/svg+xml"}
+
+
+def check_format(fmt):
+    """fmt if it is a served diagram format (a key of MIME_TYPES); ValueError otherwise."""
+    if fmt not in MIME_TYPES:
+        raise ValueError(f"Unsupported diagram format: {fmt!r} (expected one of {', '.join(sorted(MIME_TYPES))})")
+    return fmt
+
+
+def encode_png(img):
+    """Palette PNG; the three-colour diagrams compress to a few hundred bytes."""
+    buf = io.BytesIO()
+    img.save(buf, format="PNG", optimize=True)
+    return buf.getvalue()
+
+
+def encode_webp(img):
+    buf = io.BytesIO()
+    img.save(buf, format="WEBP", lossless=True, method=1)  # higher methods are slower with no size gain here
+    return buf.getvalue()
+
+
+def _hex(theme, index):
+    return "#%02x%02x%02x" % THEMES[theme][index]
+
+
+def _num(value):
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+def render_svg(highlight_notes, low_note=DEFAULT_LOW_NOTE, high_note=DEFAULT_HIGH_NOTE, size=DEFAULT_SIZE,
+               theme="light"):
+    """Keyboard diagram as SVG markup, one <rect> per key, using the raster geometry."""
+    highlights = {midi_to_name(m) for m in to_midi_set(highlight_notes)}
+    width, height = size
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" shape-rendering="crispEdges">',
+        f'<g stroke="{_hex(theme, BLACK)}">',
+    ]
+    for note, is_black, (x0, y0, x1, y1) in keyboard_layout(low_note, high_note, size):
+        if note in highlights:
+            fill = HIGHLIGHT
+        else:
+            fill = BLACK if is_black else WHITE
+        parts.append(
+            f'<rect x="{_num(x0)}" y="{_num(y0)}" width="{_num(x1 - x0)}" height="{_num(y1 - y0)}" '
+            f'fill="{_hex(theme, fill)}"/>'
+        )
+    parts.append("</g></svg>")
+    return "".join(parts).encode("utf-8")
+
+
+@METRICS.timed(DIAGRAM_SECONDS, "encode")
+def encode_diagram(highlight_notes, fmt="png", low_note=DEFAULT_LOW_NOTE, high_note=DEFAULT_HIGH_NOTE,
+                   size=DEFAULT_SIZE, theme="light", renderer=RENDERER):
+    """Encoded diagram bytes; identical input always yields identical bytes."""
+    if fmt == "svg":
+        return render_svg(highlight_notes, low_note, high_note, size, theme)
+    img = renderer.render(highlight_notes, low_note, high_note, size, theme)
+    if fmt == "png":
+        return encode_png(img)
+    if fmt == "webp":
+        return encode_webp(img)
+    raise ValueError(f"Unsupported diagram format: {fmt!r}")
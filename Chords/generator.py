@@ -0,0 +1,150 @@
+import functools
+from collections.abc import Mapping
+
+from Chords.names import parse_chord_name
+from Chords.pitch import ACCIDENTALS, NATURAL_PITCH_CLASSES
+
+LETTERS = "CDEFGAB"
+ROOTS = ("C", "C#", "D", "Eb", "E", "F", "F#", "G", "Ab", "A", "Bb", "B")
+ORDINALS = {1: "1st", 2: "2nd", 3: "3rd"}
+ACCIDENTAL_NAMES = {-2: "bb", -1: "b", 0: "", 1: "#", 2: "##"}
+ROOT_OCTAVE = 4
+
+# Interval formulas: (semitones, letter steps) above the root for each chord tone, bass first
+# in root position. The letter steps are what make the spelling come out right, e.g. the
+# diminished fifth of F is Cb (4 letters up), not B.
+QUALITIES = {
+    "major": ((0, 0), (4, 2), (7, 4)),
+    "minor": ((0, 0), (3, 2), (7, 4)),
+    "diminished": ((0, 0), (3, 2), (6, 4)),
+    "major seventh": ((0, 0), (4, 2), (7, 4), (11, 6)),
+    "dominant seventh": ((0, 0), (4, 2), (7, 4), (10, 6)),
+    "minor seventh": ((0, 0), (3, 2), (7, 4), (10, 6)),
+    "minor seventh flat five": ((0, 0), (3, 2), (6, 4), (10, 6)),
+    "augmented": ((0, 0), (4, 2), (8, 4)),
+    "suspended second": ((0, 0), (2, 1), (7, 4)),
+    "suspended fourth": ((0, 0), (5, 3), (7, 4)),
+    "diminished seventh": ((0, 0), (3, 2), (6, 4), (9, 6)),
+    "minor major seventh": ((0, 0), (3, 2), (7, 4), (11, 6)),
+    "major sixth": ((0, 0), (4, 2), (7, 4), (9, 5)),
+    "minor sixth": ((0, 0), (3, 2), (7, 4), (9, 5)),
+    "dominant ninth": ((0, 0), (4, 2), (7, 4), (10, 6), (14, 8)),
+    "major ninth": ((0, 0), (4, 2), (7, 4), (11, 6), (14, 8)),
+    "minor ninth": ((0, 0), (3, 2), (7, 4), (10, 6), (14, 8)),
+    "dominant eleventh": ((0, 0), (4, 2), (7, 4), (10, 6), (14, 8), (17, 10)),
+    "dominant thirteenth": ((0, 0), (4, 2), (7, 4), (10, 6), (14, 8), (17, 10), (21, 12)),
+}
+# The qualities of the original hand-typed tables, which CHORDS and RAW_VOICINGS still expose.
+LEGACY_QUALITIES = ("major", "minor", "diminished", "major seventh", "dominant seventh", "minor seventh",
+                    "minor seventh flat five")
+
+
+def inversion_name(inversion):
+    if inversion == 0:
+        return "root"
+    return f"{ORDINALS.get(inversion, f'{inversion}th')} inversion"
+
+
+def chord_name(root, quality, inversion):
+    return f"{root} {quality} {inversion_name(inversion)}"
+
+
+def _spell(step, semitone):
+    """Spelled note for an absolute letter step (C4 = 28) and MIDI-style semitone (C4 = 60)."""
+    octave, letter = divmod(step, 7)
+    natural = 12 * (octave + 1) + NATURAL_PITCH_CLASSES[LETTERS[letter]]
+    return LETTERS[letter] + ACCIDENTAL_NAMES[semitone - natural], octave
+
+
+@functools.lru_cache(maxsize=None)
+def chord_tones(root, quality):
+    """Root-position tones as ((letter step, semitone), ...), with the root in octave ROOT_OCTAVE."""
+    letter = LETTERS.index(root[0])
+    root_step = 7 * ROOT_OCTAVE + letter
+    root_semitone = 12 * (ROOT_OCTAVE + 1) + NATURAL_PITCH_CLASSES[root[0]] + sum(ACCIDENTALS[a] for a in root[1:])
+    return tuple((root_step + steps, root_semitone + semitones) for semitones, steps in QUALITIES[quality])
+
+
+@functools.lru_cache(maxsize=None)
+def chord_voicing(root, quality, inversion):
+    """Close voicing as spelled notes with octaves, bass first, e.g. ('E3', 'G3', 'C4').
+
+    The root stays in octave 4 (by letter, so B#3 and Cb5 keep their letter's
+    octave). For inversion k, the tones from the k-th up drop by the octaves
+    that put the k-th below the root (one, for triads and sevenths), keeping
+    their spacing; the tones under the k-th stay above the root.
+    """
+    tones = chord_tones(root, quality)
+    if not 0 <= inversion < len(tones):
+        raise ValueError(f"{quality} has no {inversion_name(inversion)}")
+    if inversion:
+        octaves = (tones[inversion][0] - tones[0][0]) // 7 + 1
+        dropped = [(step - 7 * octaves, semitone - 12 * octaves) for step, semitone in tones[inversion:]]
+        tones = sorted(dropped + list(tones[:inversion]), key=lambda tone: (tone[1], tone[0]))
+    return tuple(f"{name}{octave}" for name, octave in (_spell(step, semitone) for step, semitone in tones))
+
+
+@functools.lru_cache(maxsize=None)
+def chord_notes(root, quality, inversion):
+    """Spelled pitch classes bass first, e.g. ('E', 'G', 'C'), as in CHORDS."""
+    return tuple(note.rstrip("-0123456789") for note in chord_voicing(root, quality, inversion))
+
+
+class ChordLibrary(Mapping):
+    """Every root x quality x inversion as a read-only {chord name: notes} mapping.
+
+    Names are enumerated from the formulas without spelling anything; notes
+    are computed on lookup and memoized. With voiced=True the values are
+    voicings with octaves (as in CHORD_VOICINGS) rather than pitch classes.
+    """
+
+    def __init__(self, qualities=tuple(QUALITIES), roots=ROOTS, voiced=False):
+        self.qualities = tuple(qualities)
+        self.roots = tuple(roots)
+        self.voiced = voiced
+        self._quality_set = frozenset(self.qualities)
+        self._root_set = frozenset(self.roots)
+        self._values = {}
+
+    def _parts(self, name):
+        try:
+            root, quality, inversion = parse_chord_name(name)
+        except (ValueError, IndexError):
+            return None
+        if root not in self._root_set or quality not in self._quality_set:
+            return None
+        if not 0 <= inversion < len(QUALITIES[quality]) or name != chord_name(root, quality, inversion):
+            return None
+        return root, quality, inversion
+
+    def __getitem__(self, name):
+        value = self._values.get(name)
+        if value is None:
+            parts = self._parts(name)
+            if parts is None:
+                raise KeyError(name)
+            value = chord_voicing(*parts) if self.voiced else chord_notes(*parts)
+            self._values[name] = value
+        return value
+
+    def __contains__(self, name):
+        return name in self._values or (isinstance(name, str) and self._parts(name) is not None)
+
+    def __iter__(self):
+        for quality in self.qualities:
+            size = len(QUALITIES[quality])
+            for root in self.roots:
+                for inversion in range(size):
+                    yield chord_name(root, quality, inversion)
+
+    def __len__(self):
+        return len(self.roots) * sum(len(QUALITIES[quality]) for quality in self.qualities)
+
+
+def voicings_text(library):
+    """A voiced library in the RAW_VOICINGS text format ('name: note note ...' per line)."""
+    return "".join(f"    {name}: {' '.join(notes)}\n" for name, notes in library.items())
+
+
+CHORD_LIBRARY = ChordLibrary()
+VOICING_LIBRARY = ChordLibrary(voiced=True)
@@ -0,0 +1,146 @@
+from PIL import Image, ImageDraw
+
+from Chords.metrics import METRICS
+from Chords.pitch import midi_to_name, note_to_midi, to_midi_set
+
+DEFAULT_LOW_NOTE = "C3"
+DEFAULT_HIGH_NOTE = "C6"
+DEFAULT_SIZE = (700, 150)
+
+# "auto" sizes each diagram to its voicing; a range like "C3-C6" is kept for every
+# voicing that fits it and widened by whole octaves for any that do not.
+KEYBOARD_RANGE_ENV_VAR = "CHORD_TRAINER_KEYBOARD_RANGE"
+AUTO_RANGE = "auto"
+MIN_RANGE_OCTAVES = 1
+PIANO_LOW_MIDI = 21  # A0
+PIANO_HIGH_MIDI = 108  # C8
+
+DIAGRAM_SECONDS = METRICS.histogram("chord_trainer_diagram_seconds",
+                                    "Seconds to draw, composite or encode one keyboard diagram.", ("stage",))
+
+
+def to_sharp(note_with_octave: str) -> str:
+    """Spell a note like 'Eb4', 'E#3' or 'Bbb4' as the sharp-named key it sounds on."""
+    return midi_to_name(note_to_midi(note_with_octave))
+
+
+def keyboard_notes(low_note=DEFAULT_LOW_NOTE, high_note=DEFAULT_HIGH_NOTE):
+    """List the sharp-named keys from low_note up to and including high_note."""
+    return [midi_to_name(midi) for midi in range(note_to_midi(low_note), note_to_midi(high_note) + 1)]
+
+
+def parse_keyboard_range(text):
+    """AUTO_RANGE for "auto", else (low_note, high_note) from a range like "C3-C6".
+
+    Both ends must be white keys: the layout starts and ends on white keys,
+    so a black end key would never be drawn.
+    """
+    text = text.strip()
+    if text.lower() == AUTO_RANGE:
+        return AUTO_RANGE
+    low, sep, high = text.partition("-")
+    if not sep:
+        raise ValueError(f"Expected 'auto' or a range like C3-C6, got {text!r}")
+    low, high = to_sharp(low), to_sharp(high)
+    for note in (low, high):
+        if "#" in note:
+            raise ValueError(f"Range {text!r} must start and end on white keys, not {note}")
+    if note_to_midi(low) >= note_to_midi(high):
+        raise ValueError(f"Range {text!r} is empty")
+    return low, high
+
+
+def voicing_range(notes, within=None, min_octaves=MIN_RANGE_OCTAVES):
+    """The keyboard range to draw notes on: whole octaves from C to C, clamped to A0-C8.
+
+    Snapping to octaves means voicings in the same register share a range, and
+    with it the renderer's layer and the cache's entries. With within, that
+    range is used as is unless notes fall outside it, in which case it grows
+    by whole octaves to fit them; so a wide voicing never runs off the keys.
+    """
+    midis = to_midi_set(notes)
+    if within is not None:
+        low, high = note_to_midi(within[0]), note_to_midi(within[1])
+        if midis and min(midis) < low:
+            low = min(midis) // 12 * 12
+        if midis and max(midis) > high:
+            high = -(-max(midis) // 12) * 12
+    elif midis:
+        low = min(midis) // 12 * 12
+        high = max(-(-max(midis) // 12) * 12, low + 12 * min_octaves)
+    else:
+        low, high = note_to_midi(DEFAULT_LOW_NOTE), note_to_midi(DEFAULT_HIGH_NOTE)
+    return midi_to_name(max(low, PIANO_LOW_MIDI)), midi_to_name(min(high, PIANO_HIGH_MIDI))
+
+
+def resolve_range(notes, keyboard_range=AUTO_RANGE):
+    """The range to draw notes on under a keyboard_range setting: AUTO_RANGE or (low_note, high_note)."""
+    return voicing_range(notes, within=None if keyboard_range == AUTO_RANGE else keyboard_range)
+
+
+def shared_range(voicings, keyboard_range=AUTO_RANGE):
+    """One range to draw several voicings side by side: resolve_range() of all their notes together.
+
+    Drawn on their own ranges, answer options would differ in width and key
+    size, and the extent alone would hint at which one is an inversion.
+    """
+    notes = set()
+    for voicing in voicings:
+        notes.update(to_midi_set(voicing))
+    return resolve_range(notes, keyboard_range)
+
+
+def group_by_range(voicings, keyboard_range=AUTO_RANGE):
+    """Split a {name: notes} mapping into {(low_note, high_note): {name: notes}}, one batch per range."""
+    groups = {}
+    for name, notes in voicings.items():
+        groups.setdefault(resolve_range(notes, keyboard_range), {})[name] = notes
+    return groups
+
+
+def keyboard_layout(low_note=DEFAULT_LOW_NOTE, high_note=DEFAULT_HIGH_NOTE, size=DEFAULT_SIZE):
+    """Key rectangles in drawing order: all white keys, then the black keys on top.
+
+    Each entry is (note, is_black, (x0, y0, x1, y1)) with note sharp-spelled.
+    """
+    notes = keyboard_notes(low_note, high_note)
+
+    img_width, img_height = size
+    white_key_height = img_height
+    black_key_height = int(img_height * 0.6)
+    white_keys = [n for n in notes if "#" not in n]
+    white_key_width = img_width / len(white_keys)
+
+    layout = []
+    white_key_positions = {}
+    x = 0
+    for note in notes:
+        if "#" not in note:
+            layout.append((note, False, (x, 0, x + white_key_width, white_key_height)))
+            white_key_positions[note] = x
+            x += white_key_width
+    for idx, note in enumerate(notes):
+        if "#" in note:
+            left_idx = idx - 1
+            if left_idx >= 0 and notes[left_idx] in white_key_positions:
+                x0 = white_key_positions[notes[left_idx]] + white_key_width * 0.65
+                x1 = x0 + white_key_width * 0.7
+                layout.append((note, True, (x0, 0, x1, black_key_height)))
+    return layout
+
+
+@METRICS.timed(DIAGRAM_SECONDS, "generate_keyboard_image")
+def generate_keyboard_image(highlight_notes, low_note=DEFAULT_LOW_NOTE, high_note=DEFAULT_HIGH_NOTE,
+                            size=DEFAULT_SIZE):
+    """Draw a keyboard diagram with highlight_notes (MIDI numbers or spelled notes) filled in yellow."""
+    highlight_sharp = {midi_to_name(midi) for midi in to_midi_set(highlight_notes)}
+
+    img = Image.new("RGB", tuple(size), "white")
+    draw = ImageDraw.Draw(img)
+    for note, is_black, rect in keyboard_layout(low_note, high_note, size):
+        if note in highlight_sharp:
+            fill = "yellow"
+        else:
+            fill = "black" if is_black else "white"
+        draw.rectangle(rect, fill=fill, outline="black")
+    return img
@@ -0,0 +1,286 @@
+import bisect
+import contextlib
+import functools
+import http.server
+import math
+import os
+import threading
+import time
+
+# Any of these turns collection on. PORT also serves /metrics on 127.0.0.1:PORT; FILE rewrites a
+# Prometheus text file (for node_exporter's textfile collector) every METRICS_DUMP_INTERVAL seconds.
+METRICS_ENV_VAR = "CHORD_TRAINER_METRICS"
+METRICS_PORT_ENV_VAR = "CHORD_TRAINER_METRICS_PORT"
+METRICS_FILE_ENV_VAR = "CHORD_TRAINER_METRICS_FILE"
+METRICS_DUMP_INTERVAL = 15
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Seconds: from a cached lookup (well under a millisecond) to a cold render or a full script run.
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names, values, extra=()):
+    pairs = [*zip(names, values), *extra]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic count per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def families(self):
+        with self._lock:
+            values = dict(self._values)
+        samples = [(self.name, _format_labels(self.labelnames, labels), value)
+                   for labels, value in sorted(values.items())]
+        yield self.name, self.help, self.kind, samples
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_labels", "_start")
+
+    def __init__(self, histogram, labels):
+        self._histogram = histogram
+        self._labels = labels
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._histogram.observe(time.perf_counter() - self._start, *self._labels)
+
+
+class Histogram:
+    """Cumulative-bucket histogram per label set, as Prometheus expects."""
+
+    kind = "histogram"
+
+    def __init__(self, name, help, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][i] += 1
+            series[1] += value
+
+    def time(self, *labels):
+        """Context manager observing the seconds spent inside it."""
+        return _Timer(self, labels)
+
+    def families(self):
+        with self._lock:
+            series = {labels: (list(counts), total) for labels, (counts, total) in self._series.items()}
+        samples = []
+        for labels, (counts, total) in sorted(series.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                le = [("le", _format_value(bound))]
+                samples.append((f"{self.name}_bucket", _format_labels(self.labelnames, labels, le), cumulative))
+            samples.append((f"{self.name}_sum", _format_labels(self.labelnames, labels), total))
+            samples.append((f"{self.name}_count", _format_labels(self.labelnames, labels), cumulative))
+        yield self.name, self.help, self.kind, samples
+
+
+class StatsGauges:
+    """Gauges read from stats() dicts at scrape time, one label value per source.
+
+    For the caches and the session manager, which already count hits,
+    misses and sizes: nothing is added to their hot paths.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, prefix, help, label, sources):
+        self.name = prefix
+        self.help = help
+        self.label = label
+        self.sources = dict(sources)
+
+    def families(self):
+        rows = {}
+        for source, stats in self.sources.items():
+            for key, value in stats().items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    rows.setdefault(key, []).append((source, value))
+        for key, values in sorted(rows.items()):
+            name = f"{self.name}_{key}"
+            yield name, f"{self.help} ({key})", self.kind, [
+                (name, _format_labels((self.label,), (source,)), value) for source, value in values]
+
+
+class _NoopTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return None
+
+
+class _NoopMetric:
+    """Stands in for every metric when collection is off: each call returns at once."""
+
+    __slots__ = ()
+    _timer = _NoopTimer()
+
+    def inc(self, *labels, amount=1):
+        pass
+
+    def observe(self, value, *labels):
+        pass
+
+    def time(self, *labels):
+        return self._timer
+
+
+NOOP_METRIC = _NoopMetric()
+
+
+class MetricsRegistry:
+    """Process-wide metrics with Prometheus text exposition.
+
+    Registration is idempotent by name, so app.py can declare metrics on
+    every script run. When disabled, counter() and histogram() return
+    NOOP_METRIC and timed() returns the function undecorated, so
+    instrumented code pays at most one no-op method call.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name, help, labelnames=()):
+        if not self.enabled:
+            return NOOP_METRIC
+        return self._register(Counter(name, help, labelnames))
+
+    def histogram(self, name, help, labelnames=(), buckets=DEFAULT_BUCKETS):
+        if not self.enabled:
+            return NOOP_METRIC
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def stats_gauges(self, prefix, help, label, sources):
+        """Export every number in each source's stats() dict as {prefix}_{key}{label="source"}."""
+        if self.enabled:
+            self._register(StatsGauges(prefix, help, label, sources))
+
+    def timed(self, histogram, *labels):
+        """Decorator observing each call's duration in histogram."""
+        def decorate(fn):
+            if not self.enabled:
+                return fn
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with histogram.time(*labels):
+                    return fn(*args, **kwargs)
+
+            return wrapper
+
+        return decorate
+
+    # --- Exposition ---
+    def exposition(self):
+        """Everything collected, in the Prometheus text format (version 0.0.4)."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines = []
+        for metric in metrics:
+            for family, help, kind, samples in metric.families():
+                lines.append(f"# HELP {family} {help}")
+                lines.append(f"# TYPE {family} {kind}")
+                lines.extend(f"{name}{labels} {_format_value(value)}" for name, labels, value in samples)
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """Replace path with the current exposition, atomically, so a scraper never reads half a file."""
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.exposition())
+        os.replace(tmp, path)
+
+    def serve(self, port, host="127.0.0.1"):
+        """Serve GET /metrics from a daemon thread; returns the HTTP server."""
+        registry = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.exposition().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = http.server.ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+        return server
+
+    def dump_every(self, path, interval=METRICS_DUMP_INTERVAL):
+        """Rewrite path from a daemon thread every interval seconds."""
+        def loop():
+            while True:
+                time.sleep(interval)
+                with contextlib.suppress(OSError):
+                    self.write(path)
+
+        threading.Thread(target=loop, name="metrics-dump", daemon=True).start()
+
+    def start_exporters(self):
+        """Start the exporters configured through the environment; call once per process."""
+        port = os.environ.get(METRICS_PORT_ENV_VAR)
+        if port:
+            self.serve(int(port))
+        path = os.environ.get(METRICS_FILE_ENV_VAR)
+        if path:
+            self.dump_every(path)
+
+
+METRICS = MetricsRegistry(enabled=any(os.environ.get(var) for var in (METRICS_ENV_VAR, METRICS_PORT_ENV_VAR,
+                                                                       METRICS_FILE_ENV_VAR)))
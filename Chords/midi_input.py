@@ -0,0 +1,269 @@
+"""Recognise chords played on a MIDI keyboard.
+
+    python -m Chords.midi_input [--port NAME | --replay FILE|-] [--list-ports]
+
+A replay file has one event per line, "<seconds> on|off <midi note> [velocity]",
+and '#' comments. Live input needs the optional `mido` package (with a backend
+such as python-rtmidi); replay and recognition do not.
+"""
+import argparse
+import sys
+import threading
+import time
+from collections import namedtuple
+
+from Chords.model import COMPILED_CHORDS
+from Chords.pitch import midi_to_name
+
+NOTE_ON = "on"
+NOTE_OFF = "off"
+
+MidiEvent = namedtuple("MidiEvent", "time kind note velocity")
+Match = namedtuple("Match", "name root quality inversion exact")
+
+
+class ChordRecognizer:
+    """Hash index from (pitch-class mask, bass pitch class) to chord names.
+
+    Any voicing of a chord's pitch classes with the right bass matches it,
+    so the inversion is read off the bass; exact is True when the notes are
+    the library voicing itself. Chords that spell the same pitch classes over
+    the same bass (enharmonic duplicates) all match.
+    """
+
+    def __init__(self, chords=COMPILED_CHORDS):
+        self._chords = chords
+        index = {}
+        for name, chord in chords.items():
+            index.setdefault((chord.pc_mask, chord.bass_pc), []).append(name)
+        self._index = {key: tuple(names) for key, names in index.items()}
+
+    def lookup(self, pc_mask, bass_pc):
+        """Names for a pitch-class mask and bass: one dict probe."""
+        return self._index.get((pc_mask, bass_pc), ())
+
+    def identify(self, midi_notes):
+        """Matches for a set of held MIDI notes, empty if they form no known chord."""
+        if not midi_notes:
+            return []
+        mask = 0
+        for note in midi_notes:
+            mask |= 1 << (note % 12)
+        return self.matches(mask, min(midi_notes), midi_notes)
+
+    def matches(self, mask, bass, midi_notes):
+        """Matches for notes whose pitch-class mask and lowest note are already known."""
+        names = self._index.get((mask, bass % 12))
+        if not names:
+            return []
+        held = frozenset(midi_notes)
+        matches = []
+        for name in names:
+            chord = self._chords[name]
+            midi = chord.midi
+            matches.append(Match(name, chord.root, chord.quality, chord.inversion,
+                                 midi is not None and frozenset(midi) == held))
+        return matches
+
+
+class HeldNotes:
+    """Notes currently held down, with the pitch-class mask kept up to date per event.
+
+    Per-pitch-class counts make note on/off O(1); the bass is the minimum of
+    the held notes, which is at most ten on a keyboard.
+    """
+
+    __slots__ = ("notes", "_counts", "mask")
+
+    def __init__(self):
+        self.notes = set()
+        self._counts = [0] * 12
+        self.mask = 0
+
+    def press(self, note):
+        if note in self.notes:
+            return
+        self.notes.add(note)
+        pc = note % 12
+        self._counts[pc] += 1
+        self.mask |= 1 << pc
+
+    def release(self, note):
+        if note not in self.notes:
+            return
+        self.notes.discard(note)
+        pc = note % 12
+        self._counts[pc] -= 1
+        if not self._counts[pc]:
+            self.mask &= ~(1 << pc)
+
+    @property
+    def bass(self):
+        return min(self.notes) if self.notes else None
+
+
+class ChordListener:
+    """Turns a stream of note events into played chords.
+
+    A chord counts as played when the first key of it is released, using the
+    notes held at that moment, so rolling a chord up through a partial triad
+    does not answer early. on_chord(matches, notes) is called for each chord
+    played, including ones that match nothing (matches is then empty).
+    """
+
+    def __init__(self, recognizer=None, on_chord=None, min_notes=3):
+        self.recognizer = recognizer or ChordRecognizer()
+        self.on_chord = on_chord
+        self.min_notes = min_notes
+        self.held = HeldNotes()
+        self._armed = False
+
+    def feed(self, event):
+        """Process one event; returns (matches, notes) if it completed a chord, else None."""
+        held = self.held
+        if event.kind == NOTE_ON and event.velocity:
+            held.press(event.note)
+            self._armed = len(held.notes) >= self.min_notes
+            return None
+        if event.note not in held.notes:
+            return None
+        played = None
+        if self._armed:
+            notes = tuple(sorted(held.notes))
+            played = self.recognizer.matches(held.mask, notes[0], notes), notes
+            self._armed = False
+            if self.on_chord is not None:
+                self.on_chord(*played)
+        held.release(event.note)
+        return played
+
+    def run(self, source):
+        """Feed every event from a source; yields each chord played."""
+        for event in source:
+            played = self.feed(event)
+            if played is not None:
+                yield played
+
+
+# --- Event sources: iterables of MidiEvent ---
+def parse_replay_line(line):
+    line = line.split("#", 1)[0].strip()
+    if not line:
+        return None
+    fields = line.split()
+    if len(fields) not in (3, 4) or fields[1] not in (NOTE_ON, NOTE_OFF):
+        raise ValueError(f"Bad replay line: {line!r}")
+    velocity = int(fields[3]) if len(fields) == 4 else (64 if fields[1] == NOTE_ON else 0)
+    return MidiEvent(float(fields[0]), fields[1], int(fields[2]), velocity)
+
+
+class ReplaySource:
+    """Events from a replay file (or '-' for stdin); with realtime=True, paced by their timestamps."""
+
+    def __init__(self, path, realtime=False):
+        self.path = path
+        self.realtime = realtime
+
+    def __iter__(self):
+        f = sys.stdin if self.path == "-" else open(self.path, encoding="utf-8")
+        try:
+            start = time.perf_counter()
+            for line in f:
+                event = parse_replay_line(line)
+                if event is None:
+                    continue
+                if self.realtime:
+                    delay = event.time - (time.perf_counter() - start)
+                    if delay > 0:
+                        time.sleep(delay)
+                yield event
+        finally:
+            if f is not sys.stdin:
+                f.close()
+
+
+def write_replay(path, events):
+    with open(path, "w", encoding="utf-8") as f:
+        for event in events:
+            f.write(f"{event.time:.4f} {event.kind} {event.note} {event.velocity}\n")
+
+
+class MidoSource:
+    """Live events from a MIDI input port through mido (imported only when used)."""
+
+    def __init__(self, port_name=None):
+        import mido  # optional dependency
+
+        self._port = mido.open_input(port_name)
+
+    def __iter__(self):
+        start = time.perf_counter()
+        for message in self._port:
+            if message.type in ("note_on", "note_off"):
+                kind = NOTE_ON if message.type == "note_on" and message.velocity else NOTE_OFF
+                yield MidiEvent(time.perf_counter() - start, kind, message.note, message.velocity)
+
+    def close(self):
+        self._port.close()
+
+
+def list_input_ports():
+    """MIDI input port names, or [] if mido is not installed."""
+    try:
+        import mido
+    except ImportError:
+        return []
+    return mido.get_input_names()
+
+
+class BackgroundListener:
+    """Runs a ChordListener over a source on a daemon thread and keeps the last chord played.
+
+    take() returns each played chord once, so a UI polling it answers once per chord.
+    """
+
+    def __init__(self, source, recognizer=None):
+        self._lock = threading.Lock()
+        self._played = None
+        self.listener = ChordListener(recognizer, on_chord=self._store)
+        self._thread = threading.Thread(target=self._run, args=(source,), name="midi-listener", daemon=True)
+        self._thread.start()
+
+    def _run(self, source):
+        for _ in self.listener.run(source):
+            pass
+
+    def _store(self, matches, notes):
+        with self._lock:
+            self._played = (matches, notes)
+
+    def take(self):
+        with self._lock:
+            played, self._played = self._played, None
+            return played
+
+    def held_notes(self):
+        return sorted(self.listener.held.notes)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source_group = parser.add_mutually_exclusive_group()
+    source_group.add_argument("--port", help="MIDI input port name (default: the first one)")
+    source_group.add_argument("--replay", help="replay file, or - for stdin")
+    parser.add_argument("--realtime", action="store_true", help="pace a replay by its timestamps")
+    parser.add_argument("--list-ports", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.list_ports:
+        print("\n".join(list_input_ports()) or "No MIDI input ports (is mido installed?)")
+        return
+    source = ReplaySource(args.replay, args.realtime) if args.replay else MidoSource(args.port)
+    for matches, notes in ChordListener().run(source):
+        played = " ".join(midi_to_name(n) for n in notes)
+        names = ", ".join(m.name + ("" if m.exact else " (other voicing)") for m in matches) or "no match"
+        print(f"{played}: {names}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+from collections import defaultdict
+from types import MappingProxyType
+
+from Chords.chords import CHORDS
+from Chords.names import parse_chord_name
+from Chords.pitch import note_to_midi, pitch_class, pitch_class_mask
+from Chords.voicings import CHORD_VOICINGS
+
+_UNRESOLVED = object()
+
+
+class Chord:
+    """Compiled chord record: everything the app needs, without re-parsing strings.
+
+    pitch_classes keeps the CHORDS order, so pitch_classes[0] is the bass.
+    midi is the voicing as MIDI numbers, or None if there is none. It is read
+    from the voicing store on first access, so voicings are parsed lazily.
+    """
+
+    __slots__ = ("name", "root", "root_pc", "quality", "inversion", "pitch_classes", "pc_mask", "_midi",
+                 "_voicings")
+
+    def __init__(self, name, root, quality, inversion, pitch_classes, midi=_UNRESOLVED, voicings=None):
+        self.name = name
+        self.root = root
+        self.root_pc = pitch_class(root)
+        self.quality = quality
+        self.inversion = inversion
+        self.pitch_classes = pitch_classes
+        self.pc_mask = pitch_class_mask(pitch_classes)
+        self._midi = midi
+        self._voicings = voicings
+
+    @property
+    def midi(self):
+        midi = self._midi
+        if midi is _UNRESOLVED:
+            voicing = self._voicings.get(self.name) if self._voicings is not None else None
+            midi = tuple(note_to_midi(n) for n in voicing) if voicing else None
+            self._midi = midi
+        return midi
+
+    @property
+    def bass_pc(self):
+        return self.pitch_classes[0]
+
+    def __repr__(self):
+        return f"Chord({self.name!r})"
+
+
+def compile_chords(chords, voicings):
+    compiled = {}
+    for name, notes in chords.items():
+        root, quality, inversion = parse_chord_name(name)
+        pitch_classes = tuple(pitch_class(n) for n in notes)
+        compiled[name] = Chord(name, root, quality, inversion, pitch_classes, voicings=voicings)
+    return compiled
+
+
+def _index_by(chords, attr):
+    index = defaultdict(list)
+    for chord in chords.values():
+        index[getattr(chord, attr)].append(chord)
+    return MappingProxyType({key: tuple(group) for key, group in index.items()})
+
+
+# --- Built once at import ---
+COMPILED_CHORDS = MappingProxyType(compile_chords(CHORDS, CHORD_VOICINGS))
+BY_ROOT = _index_by(COMPILED_CHORDS, "root_pc")
+BY_QUALITY = _index_by(COMPILED_CHORDS, "quality")
+BY_INVERSION = _index_by(COMPILED_CHORDS, "inversion")
+VOICED_CHORDS = MappingProxyType({name: c for name, c in COMPILED_CHORDS.items() if name in CHORD_VOICINGS})
@@ -0,0 +1,18 @@
+def parse_chord_name(name):
+    """Split 'C# minor seventh 2nd inversion' into ('C#', 'minor seventh', 2)."""
+    words = name.split()
+    if words[-1] == "root":
+        return words[0], " ".join(words[1:-1]), 0
+    if words[-1] == "inversion":
+        return words[0], " ".join(words[1:-2]), int(words[-2][:-2])
+    raise ValueError(f"Unrecognised chord name: {name!r}")
+
+
+def chord_label(name):
+    """A chord name without its root, e.g. 'C# minor seventh 2nd inversion' -> 'minor seventh 2nd inversion'."""
+    return name.split(" ", 1)[1]
+
+
+def quality_slug(quality):
+    """File-name form of a quality, e.g. 'minor seventh flat five' -> 'minor_seventh_flat_five'."""
+    return quality.replace(" ", "_")
@@ -0,0 +1,49 @@
+NATURAL_PITCH_CLASSES = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+SHARP_NAMES = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+ACCIDENTALS = {"#": 1, "b": -1}
+
+
+def _split_spelling(note):
+    """Split 'Eb4' into ('E', -1, '4'); the octave part is '' for bare note names."""
+    note = note.strip()
+    letter = note[:1].upper()
+    if letter not in NATURAL_PITCH_CLASSES:
+        raise ValueError(f"Not a note name: {note!r}")
+    offset = 0
+    i = 1
+    while i < len(note) and note[i] in ACCIDENTALS:
+        offset += ACCIDENTALS[note[i]]
+        i += 1
+    return letter, offset, note[i:]
+
+
+def pitch_class(note):
+    """Pitch class 0-11 of a spelled note, with or without an octave ('Eb', 'E#3')."""
+    letter, offset, _ = _split_spelling(note)
+    return (NATURAL_PITCH_CLASSES[letter] + offset) % 12
+
+
+def note_to_midi(note):
+    """MIDI number of a spelled note with octave, where C4 is 60 and Cb4 is 59."""
+    letter, offset, octave = _split_spelling(note)
+    if not octave.lstrip("-").isdigit():
+        raise ValueError(f"Note has no octave: {note!r}")
+    return 12 * (int(octave) + 1) + NATURAL_PITCH_CLASSES[letter] + offset
+
+
+def midi_to_name(midi):
+    """Sharp-spelled name of a MIDI number, matching the keyboard's key names."""
+    return f"{SHARP_NAMES[midi % 12]}{midi // 12 - 1}"
+
+
+def pitch_class_mask(pitch_classes):
+    """12-bit set of pitch classes, bit n set for pitch class n."""
+    mask = 0
+    for pc in pitch_classes:
+        mask |= 1 << pc
+    return mask
+
+
+def to_midi_set(notes):
+    """Normalise an iterable of MIDI numbers and/or spelled notes to a frozenset of MIDI numbers."""
+    return frozenset(n if isinstance(n, int) else note_to_midi(n) for n in notes)
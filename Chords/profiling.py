@@ -0,0 +1,62 @@
+import json
+import os
+import sys
+import time
+
+# Set to a file path to append one JSON line per process with startup phase timings, or "-" for stderr.
+PROFILE_ENV_VAR = "CHORD_TRAINER_PROFILE_STARTUP"
+
+
+class StartupProfiler:
+    """Records wall-clock time per named startup phase, once per process.
+
+    A phase runs from the previous mark() (or begin_run()) to its own mark().
+    Streamlit re-executes app.py on every interaction, so only the first
+    occurrence of each phase is kept, and the record is written at the final
+    mark. When disabled, every call returns after one attribute check.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.enabled = bool(path)
+        self.started = time.perf_counter()
+        self.started_at = time.time()
+        self.phases = {}
+        self._last = self.started
+
+    def begin_run(self):
+        """Reset the phase clock at the top of a script run."""
+        if self.enabled:
+            self._last = time.perf_counter()
+
+    def mark(self, name, final=False):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if name not in self.phases:
+            self.phases[name] = now - self._last
+        self._last = now
+        if final:
+            self.finish()
+
+    def report(self):
+        return {
+            "pid": os.getpid(),
+            "started_at": self.started_at,
+            "total_ms": round((time.perf_counter() - self.started) * 1e3, 3),
+            "phases": [{"name": name, "ms": round(secs * 1e3, 3)} for name, secs in self.phases.items()],
+        }
+
+    def finish(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        line = json.dumps(self.report())
+        if self.path == "-":
+            print(line, file=sys.stderr)
+        else:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+STARTUP_PROFILER = StartupProfiler(os.environ.get(PROFILE_ENV_VAR))
@@ -0,0 +1,304 @@
+import contextlib
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+
+PROGRESS_ENV_VAR = "CHORD_TRAINER_PROGRESS_DB"
+# Learner data is kept out of the package tree, which may be read-only and is for bundled assets only.
+DATA_DIR_ENV_VAR = "CHORD_TRAINER_DATA_DIR"
+
+
+def user_data_dir():
+    """$CHORD_TRAINER_DATA_DIR, else chord-trainer under $XDG_DATA_HOME (default ~/.local/share)."""
+    path = os.environ.get(DATA_DIR_ENV_VAR)
+    if path:
+        return path
+    base = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(base, "chord-trainer")
+
+
+DEFAULT_PROGRESS_DB = os.path.join(user_data_dir(), "progress.sqlite3")
+DAY = 86400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    ts REAL NOT NULL,
+    session TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    chord TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    first INTEGER NOT NULL,
+    elapsed_ms INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS answers_chord_ts ON answers (chord, ts);
+CREATE INDEX IF NOT EXISTS answers_session_ts ON answers (session, ts);
+CREATE TABLE IF NOT EXISTS chord_days (
+    day INTEGER NOT NULL,
+    session TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    chord TEXT NOT NULL,
+    answered INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    elapsed_ms INTEGER NOT NULL,
+    PRIMARY KEY (chord, day, session, mode)
+);
+CREATE TABLE IF NOT EXISTS confusion_days (
+    day INTEGER NOT NULL,
+    session TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    chord TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    answered INTEGER NOT NULL,
+    PRIMARY KEY (chord, answer, day, session, mode)
+);
+"""
+
+# First answers only: later clicks on the same question are retries, not fresh recall.
+_FIRST_ANSWERS = """
+SELECT CAST(ts / {day} AS INTEGER) AS day, session, mode, chord,
+       1 AS answered, correct, elapsed_ms
+FROM answers WHERE first = 1
+UNION ALL
+SELECT day, session, mode, chord, answered, correct, elapsed_ms FROM chord_days
+""".format(day=DAY)
+
+_INSERT = "INSERT INTO answers VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+_STOP = object()
+_log = logging.getLogger(__name__)
+
+
+def _connect(path):
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, uri=path.startswith("file:"))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def _filters(session, mode):
+    clauses, params = [], []
+    if session is not None:
+        clauses.append("session = ?")
+        params.append(session)
+    if mode is not None:
+        clauses.append("mode = ?")
+        params.append(mode)
+    return clauses, params
+
+
+class ProgressStore:
+    """Durable log of every quiz answer, in SQLite (WAL mode).
+
+    record() only puts the answer on a queue; a writer thread commits queued
+    answers in batches of up to batch_size, at least every flush_interval
+    seconds, so a click never waits on disk. Queries use their own connection,
+    which WAL lets read while the writer commits.
+
+    A batch the database rejects (locked, disk full, schema changed under
+    it) is rolled back, logged and retried once, then dropped and counted in
+    dropped. Any other error stops the writer; record() and flush() then
+    raise RuntimeError instead of queueing or waiting forever.
+    """
+
+    def __init__(self, path=DEFAULT_PROGRESS_DB, batch_size=256, flush_interval=0.5, clock=time.time):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        else:
+            # Separate connections to ":memory:" would be separate databases; a shared-cache
+            # URI lets the writer and reader share one, and a unique name keeps stores apart.
+            path = f"file:progress-{uuid.uuid4().hex}?mode=memory&cache=shared"
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._clock = clock
+        self._queue = queue.Queue()
+        self._failed = None
+        self._failed_lock = threading.Lock()
+        self.dropped = 0
+        self._read_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._writer = _connect(path)
+        self._writer.executescript(_SCHEMA)
+        self._reader = _connect(path)
+        self._thread = threading.Thread(target=self._write_loop, name="progress-writer", daemon=True)
+        self._thread.start()
+
+    # --- Writing ---
+    def record(self, session, mode, chord, answer, correct, first, elapsed):
+        """Queue one answer; elapsed is the seconds from question shown to answer."""
+        row = (self._clock(), session, mode, chord, answer, int(correct), int(first), round(elapsed * 1000))
+        with self._failed_lock:
+            self._check_writer()
+            self._queue.put(row)
+
+    def _check_writer(self):
+        if self._failed is not None:
+            raise RuntimeError(f"Progress writer for {self.path} has stopped") from self._failed
+
+    def _write_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            try:
+                deadline = time.monotonic() + self.flush_interval
+                while batch[-1] is not _STOP and len(batch) < self.batch_size:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(self._queue.get(timeout=timeout))
+                    except queue.Empty:
+                        break
+                stop = batch[-1] is _STOP
+                rows = batch[:-1] if stop else batch
+                if rows:
+                    self._write_batch(rows)
+            except Exception as e:
+                _log.exception("Progress writer for %s stopped", self.path)
+                self._stop_writer(e)
+                return
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _write_batch(self, rows):
+        for attempt in (1, 2):
+            try:
+                with self._transaction():
+                    self._writer.executemany(_INSERT, rows)
+                return
+            except sqlite3.Error:
+                _log.exception("Could not write %d answers to %s (attempt %d of 2)", len(rows), self.path, attempt)
+        self.dropped += len(rows)
+
+    def _stop_writer(self, error):
+        """Mark the writer as failed and release everything still queued, so flush() cannot hang."""
+        with self._failed_lock:
+            self._failed = error
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    return
+                self._queue.task_done()
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        # The connection is in autocommit mode; one explicit transaction per batch.
+        # compact() shares the connection with the writer thread, hence the lock.
+        with self._write_lock:
+            self._writer.execute("BEGIN")
+            try:
+                yield
+                self._writer.execute("COMMIT")
+            except BaseException:
+                # A failed COMMIT leaves the transaction open; roll it back so the next BEGIN works.
+                if self._writer.in_transaction:
+                    self._writer.execute("ROLLBACK")
+                raise
+
+    def flush(self):
+        """Block until every answer recorded so far is committed (or dropped, see dropped)."""
+        self._check_writer()
+        self._queue.join()
+        self._check_writer()
+
+    def close(self):
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._writer.close()
+        self._reader.close()
+
+    # --- Queries ---
+    def _query(self, sql, params=()):
+        with self._read_lock:
+            return self._reader.execute(sql, params).fetchall()
+
+    def chord_accuracy(self, session=None, mode=None):
+        """{chord: (answered, correct, mean seconds to answer)} over first answers."""
+        clauses, params = _filters(session, mode)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._query(
+            f"SELECT chord, SUM(answered), SUM(correct), SUM(elapsed_ms) FROM ({_FIRST_ANSWERS}) {where} GROUP BY chord",
+            params,
+        )
+        return {chord: (n, correct, ms / n / 1000) for chord, n, correct, ms in rows}
+
+    def accuracy_over_time(self, chord, session=None, mode=None, since=None):
+        """[(day start timestamp, answered, correct)] for one chord, oldest first."""
+        clauses, params = _filters(session, mode)
+        clauses.insert(0, "chord = ?")
+        params.insert(0, chord)
+        if since is not None:
+            clauses.append("day >= ?")
+            params.append(int(since // DAY))
+        rows = self._query(
+            f"SELECT day, SUM(answered), SUM(correct) FROM ({_FIRST_ANSWERS}) WHERE {' AND '.join(clauses)} "
+            "GROUP BY day ORDER BY day",
+            params,
+        )
+        return [(day * DAY, n, correct) for day, n, correct in rows]
+
+    def recent_answers(self, session, limit=50):
+        """The session's latest answers, newest first, as (ts, mode, chord, answer, correct, elapsed seconds)."""
+        rows = self._query(
+            "SELECT ts, mode, chord, answer, correct, elapsed_ms FROM answers "
+            "WHERE session = ? ORDER BY ts DESC LIMIT ?",
+            (session, limit),
+        )
+        return [(ts, mode, chord, answer, bool(correct), ms / 1000) for ts, mode, chord, answer, correct, ms in rows]
+
+    # --- Maintenance ---
+    def compact(self, before):
+        """Fold first answers older than the timestamp before into per-day totals and drop the raw rows.
+
+        Accuracy queries give the same results afterwards (at day resolution),
+        and wrong first answers are kept as per-day counts of each (chord,
+        answer) pair, so confusion summaries survive too. Only the individual
+        answers, their retries and their separate times are gone. The WAL is
+        checkpointed and truncated. Returns the number of rows removed.
+        """
+        self.flush()
+        cutoff = int(before // DAY) * DAY
+        with self._transaction():
+            self._writer.execute(
+                """
+                INSERT INTO chord_days (day, session, mode, chord, answered, correct, elapsed_ms)
+                SELECT CAST(ts / ? AS INTEGER), session, mode, chord, COUNT(*), SUM(correct), SUM(elapsed_ms)
+                FROM answers WHERE first = 1 AND ts < ?
+                GROUP BY 1, session, mode, chord
+                ON CONFLICT (chord, day, session, mode) DO UPDATE SET
+                    answered = answered + excluded.answered,
+                    correct = correct + excluded.correct,
+                    elapsed_ms = elapsed_ms + excluded.elapsed_ms
+                """,
+                (DAY, cutoff),
+            )
+            self._writer.execute(
+                """
+                INSERT INTO confusion_days (day, session, mode, chord, answer, answered)
+                SELECT CAST(ts / ? AS INTEGER), session, mode, chord, answer, COUNT(*)
+                FROM answers WHERE first = 1 AND correct = 0 AND ts < ?
+                GROUP BY 1, session, mode, chord, answer
+                ON CONFLICT (chord, answer, day, session, mode) DO UPDATE SET
+                    answered = answered + excluded.answered
+                """,
+                (DAY, cutoff),
+            )
+            removed = self._writer.execute("DELETE FROM answers WHERE ts < ?", (cutoff,)).rowcount
+        with self._write_lock:
+            self._writer.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._writer.execute("PRAGMA optimize")
+        return removed
+
+    def recorder(self, session):
+        """A QuizEngine recorder that logs answers under this session id."""
+        def record(mode, chord, answer, correct, first, elapsed):
+            self.record(session, mode, chord, answer, correct, first, elapsed)
+        return record
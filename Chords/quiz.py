@@ -0,0 +1,285 @@
+import random
+import time
+from array import array
+
+from Chords.catalogue import get_catalogue
+from Chords.metrics import METRICS
+from Chords.names import chord_label, parse_chord_name
+
+IDENTIFY_MODE = "identify the position"
+PLAY_MODE = "Playing the Position"
+EAR_MODE = "Ear Training"
+# Marks catalogue ids that are not in a quiz's pool.
+_ABSENT = 0xFFFF
+
+QUESTIONS = METRICS.counter("chord_trainer_questions_total", "Questions asked.", ("mode",))
+ANSWERS = METRICS.counter("chord_trainer_answers_total", "Answers submitted; retries are answers after the first.",
+                          ("mode", "result", "attempt"))
+OPTION_SECONDS = METRICS.histogram("chord_trainer_option_sampling_seconds",
+                                   "Seconds to draw a Playing the Position question's options.", ("sampler",))
+
+
+class QuizEngine:
+    """Question state for one learner, independent of Streamlit.
+
+    The pool is the chords currently in play, held as catalogue ids in an
+    array (two bytes per chord) with a catalogue-sized array of positions
+    for O(1) membership, so a session does not carry its own dict of names.
+    Picking a question or distractors is O(1)/O(k) using index arithmetic
+    instead of building filtered lists on every click. With a scheduler (see Chords.scheduler),
+    questions come from it instead of uniformly at random, and the first
+    answer to each question is reported back to it, both by catalogue id. With a recorder (see
+    ProgressStore.recorder), every answer is logged along with the seconds
+    since the question was shown.
+    """
+
+    __slots__ = ("_pool_ids", "_positions", "current", "_rng", "scheduler", "recorder", "_asked_at")
+
+    def __init__(self, pool, rng=None, scheduler=None, recorder=None):
+        self._rng = rng or random.Random()
+        self.scheduler = scheduler
+        self.recorder = recorder
+        self._asked_at = time.monotonic()
+        self._pool_ids = array("H")
+        self._positions = None
+        self.current = None
+        self.set_pool(pool)
+
+    @property
+    def pool(self):
+        names = get_catalogue().names
+        return tuple(names[i] for i in self._pool_ids)
+
+    def set_pool(self, pool):
+        """Change the chords in play; moves on if the current chord was deselected."""
+        catalogue = get_catalogue()
+        try:
+            ids = array("H", [catalogue.ids[name] for name in pool])
+        except KeyError as e:
+            raise ValueError(f"Unknown chord: {e.args[0]}") from None
+        if ids != self._pool_ids:
+            if not ids:
+                raise ValueError("A quiz needs at least one chord")
+            positions = array("H", [_ABSENT]) * len(catalogue.names)
+            for i, chord_id in enumerate(ids):
+                positions[chord_id] = i
+            self._pool_ids = ids
+            self._positions = positions
+            if self.scheduler is not None:
+                self.scheduler.set_pool(ids)
+            self._on_new_pool()
+        if not self.in_pool(self.current):
+            if self.scheduler is not None:
+                self.current = catalogue.names[self.scheduler.next()]
+            else:
+                self.current = catalogue.names[ids[self._rng.randrange(len(ids))]]
+            self._new_question()
+
+    def in_pool(self, name):
+        chord_id = get_catalogue().ids.get(name)
+        return chord_id is not None and self._positions[chord_id] != _ABSENT
+
+    def _pick_other(self):
+        """A random pool chord other than the current one (or the current one if it is alone)."""
+        catalogue = get_catalogue()
+        ids = self._pool_ids
+        n = len(ids)
+        if n == 1:
+            return catalogue.names[ids[0]]
+        i = self._rng.randrange(n - 1)
+        if i >= self._positions[catalogue.ids[self.current]]:
+            i += 1
+        return catalogue.names[ids[i]]
+
+    def sample_others(self, k):
+        """Up to k distinct pool chords other than the current one, in random order."""
+        catalogue = get_catalogue()
+        ids = self._pool_ids
+        n = len(ids)
+        skip = self._positions[catalogue.ids[self.current]]
+        indices = self._rng.sample(range(n - 1), min(k, n - 1))
+        return [catalogue.names[ids[i + 1 if i >= skip else i]] for i in indices]
+
+    def next_question(self):
+        if self.scheduler is not None:
+            catalogue = get_catalogue()
+            self.current = catalogue.names[self.scheduler.next(exclude=catalogue.ids[self.current])]
+        else:
+            self.current = self._pick_other()
+        self._new_question()
+        return self.current
+
+    def _new_question(self):
+        self._asked_at = time.monotonic()
+        QUESTIONS.inc(self.mode)
+        self._on_new_question()
+
+    def _grade(self, answer, first):
+        """Report an answer; only the first one to a question counts for the schedule."""
+        correct = answer == self.current
+        ANSWERS.inc(self.mode, "correct" if correct else "wrong", "first" if first else "retry")
+        if first and self.scheduler is not None:
+            self.scheduler.record(get_catalogue().ids[self.current], correct)
+        if self.recorder is not None:
+            self.recorder(self.mode, self.current, answer, correct, first, time.monotonic() - self._asked_at)
+        return correct
+
+    def _on_new_pool(self):
+        pass
+
+    def _on_new_question(self):
+        pass
+
+    def submit_answer(self, answer):
+        raise NotImplementedError
+
+    def snapshot(self):
+        raise NotImplementedError
+
+
+class IdentifyQuiz(QuizEngine):
+    """'identify the position': see the notes, pick the chord name.
+
+    Only the options tried for the current question are kept, in order;
+    they are cleared by next_question().
+    """
+
+    __slots__ = ("_attempts", "last_attempt")
+    mode = IDENTIFY_MODE
+
+    def __init__(self, pool, rng=None, scheduler=None, recorder=None):
+        self._attempts = []
+        self.last_attempt = None
+        super().__init__(pool, rng, scheduler, recorder)
+
+    def _on_new_question(self):
+        self._attempts = []
+        self.last_attempt = None
+
+    def submit_answer(self, answer):
+        tried = self._attempts
+        correct = self._grade(answer, first=not tried)
+        if answer not in tried:
+            tried.append(answer)
+        self.last_attempt = answer
+        return correct
+
+    def current_attempts(self):
+        return self._attempts
+
+    def snapshot(self):
+        return {
+            "mode": self.mode,
+            "current": self.current,
+            "attempts": list(self._attempts),
+            "last_attempt": self.last_attempt,
+            "correct": self.last_attempt == self.current if self.last_attempt is not None else None,
+        }
+
+
+class EarQuiz(IdentifyQuiz):
+    """'Ear Training': hear a voicing, name its quality and inversion.
+
+    The learner answers with a label such as 'minor 1st inversion'; it is
+    graded and recorded as the chord with the question's root and that label,
+    so attempts, schedules and logs stay in chord names.
+    """
+
+    __slots__ = ("_labels", "_label_set")
+    mode = EAR_MODE
+
+    def __init__(self, pool, rng=None, scheduler=None, recorder=None):
+        self._labels = {}
+        self._label_set = frozenset()
+        super().__init__(pool, rng, scheduler, recorder)
+
+    def _on_new_pool(self):
+        labels = {}
+        for name in self.pool:
+            root, quality, inversion = parse_chord_name(name)
+            labels.setdefault(quality, {})[inversion] = chord_label(name)
+        self._labels = {quality: [by_inversion[i] for i in sorted(by_inversion)]
+                        for quality, by_inversion in sorted(labels.items())}
+        self._label_set = frozenset(label for by_inversion in labels.values() for label in by_inversion.values())
+
+    @property
+    def labels(self):
+        """{quality: labels in inversion order} over the chords in play."""
+        return self._labels
+
+    def is_label(self, label):
+        return label in self._label_set
+
+    def answer_for(self, label):
+        return f"{parse_chord_name(self.current)[0]} {label}"
+
+    def submit_answer(self, label):
+        return super().submit_answer(self.answer_for(label))
+
+    def snapshot(self):
+        snapshot = super().snapshot()
+        snapshot["attempts"] = [chord_label(name) for name in snapshot["attempts"]]
+        if snapshot["last_attempt"] is not None:
+            snapshot["last_attempt"] = chord_label(snapshot["last_attempt"])
+        return snapshot
+
+
+class PlayQuiz(QuizEngine):
+    """'Playing the Position': see the chord name, pick its keyboard diagram.
+
+    options are chord names (the correct one plus distractors), drawn lazily
+    on first access so a question that is skipped never samples any. With a
+    similarity index (see Chords.similarity), distractors are the chords most
+    (or, at low difficulty, least) confusable with the answer rather than
+    random ones.
+    """
+
+    __slots__ = ("num_options", "_options", "clicked", "similarity", "difficulty", "_similar")
+    mode = PLAY_MODE
+
+    def __init__(self, pool, num_options=4, rng=None, scheduler=None, similarity=None, difficulty="hard",
+                 recorder=None):
+        self.num_options = num_options
+        self._options = None
+        self.clicked = None
+        self.similarity = similarity
+        self.difficulty = difficulty
+        self._similar = None
+        super().__init__(pool, rng, scheduler, recorder)
+
+    def _on_new_pool(self):
+        if self.similarity is not None:
+            self._similar = self.similarity.restricted(frozenset(self.pool))
+
+    def distractors(self):
+        k = self.num_options - 1
+        if self._similar is not None:
+            return self._similar.distractors(self.current, k, self.difficulty, self._rng)
+        return self.sample_others(k)
+
+    def _on_new_question(self):
+        self._options = None
+        self.clicked = None
+
+    @property
+    def options(self):
+        if self._options is None:
+            with OPTION_SECONDS.time("random" if self._similar is None else self.difficulty):
+                options = [self.current] + self.distractors()
+                self._rng.shuffle(options)
+            self._options = options
+        return self._options
+
+    def submit_answer(self, answer):
+        correct = self._grade(answer, first=self.clicked is None)
+        self.clicked = answer
+        return correct
+
+    def snapshot(self):
+        return {
+            "mode": self.mode,
+            "current": self.current,
+            "options": list(self.options),
+            "clicked": self.clicked,
+            "correct": self.clicked == self.current if self.clicked is not None else None,
+        }
@@ -0,0 +1,170 @@
+import threading
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from Chords.keyboard import (
+    DEFAULT_HIGH_NOTE,
+    DEFAULT_LOW_NOTE,
+    DEFAULT_SIZE,
+    DIAGRAM_SECONDS,
+    generate_keyboard_image,
+    keyboard_layout,
+)
+from Chords.metrics import METRICS
+from Chords.pitch import note_to_midi, to_midi_set
+
+# Diagrams only ever contain these three colours, so layers are stored as one
+# palette index per pixel instead of three RGB bytes.
+PALETTE = ((255, 255, 255), (0, 0, 0), (255, 255, 0))
+WHITE, BLACK, HIGHLIGHT = range(len(PALETTE))
+
+# A theme is just another palette for the same indices, so theming costs nothing at render time.
+THEMES = {
+    "light": PALETTE,
+    "dark": ((214, 214, 214), (24, 24, 24), (255, 196, 0)),
+}
+_FLAT_PALETTES = {name: [channel for rgb in colours for channel in rgb] for name, colours in THEMES.items()}
+
+
+def _to_indices(img):
+    rgb = np.asarray(img.convert("RGB"), dtype=np.uint8)
+    out = np.zeros(rgb.shape[:2], dtype=np.uint8)
+    for index, colour in enumerate(PALETTE):
+        out[(rgb == colour).all(axis=2)] = index
+    return out
+
+
+def _mask_to_slices(mask):
+    """Decompose a 2-D boolean mask into (row slice, column slice) rectangles.
+
+    Consecutive rows with identical column runs merge into one rectangle, so a
+    white key notched by its black neighbours becomes two or three slices.
+    """
+    rects = []
+    open_runs = {}
+    prev_runs = ()
+    height = mask.shape[0]
+    # Only a row that differs from the one above it can open or close a rectangle.
+    changes = (np.flatnonzero((mask[1:] != mask[:-1]).any(axis=1)) + 1).tolist()
+    for row in (0, *changes, height):
+        if row < height:
+            cols = np.flatnonzero(mask[row])
+            breaks = np.flatnonzero(np.diff(cols) != 1) + 1
+            runs = tuple((int(run[0]), int(run[-1]) + 1) for run in np.split(cols, breaks) if len(run))
+        else:
+            runs = ()
+        if runs != prev_runs:
+            for c0, c1 in prev_runs:
+                rects.append((slice(open_runs.pop((c0, c1)), row), slice(c0, c1)))
+            for run in runs:
+                open_runs[run] = row
+            prev_runs = runs
+    return tuple(rects)
+
+
+def to_image(indices, theme="light"):
+    """Wrap an (H, W) array of palette indices as a palette-mode PIL image in the given theme."""
+    img = Image.fromarray(indices, "P")
+    img.putpalette(_FLAT_PALETTES[theme])
+    return img
+
+
+def _overlaps(a, b):
+    # One pixel of slack: PIL rounds float coordinates and draws outlines inclusively.
+    return a[0] <= b[2] + 1 and b[0] <= a[2] + 1 and a[1] <= b[3] + 1 and b[1] <= a[3] + 1
+
+
+class _KeyboardLayer:
+    """Blank keyboard pixels for one (range, size) plus the fill area of every key, by MIDI number.
+
+    Both are drawn the way generate_keyboard_image draws them, so composited
+    output is pixel-identical to the per-rectangle path. A key's mask comes from
+    redrawing only that key lit, and the keys drawn after it that overlap it,
+    onto the blank keyboard, so a layer costs a few rectangles per key rather
+    than a whole keyboard per key, and even the full 88 keys are cheap.
+    """
+
+    def __init__(self, low_note, high_note, size):
+        blank = generate_keyboard_image([], low_note, high_note, size)
+        blank_rgb = np.asarray(blank, dtype=np.uint8)
+        self.base = _to_indices(blank)
+        self.shape = self.base.shape
+        self.masks = {}
+        layout = keyboard_layout(low_note, high_note, size)
+        height, width = self.shape
+        for i, (note, _, rect) in enumerate(layout):
+            lit = blank.copy()
+            draw = ImageDraw.Draw(lit)
+            draw.rectangle(rect, fill="yellow", outline="black")
+            for _, later_black, later_rect in layout[i + 1:]:
+                if _overlaps(rect, later_rect):
+                    draw.rectangle(later_rect, fill="black" if later_black else "white", outline="black")
+            rows = slice(max(int(rect[1]) - 1, 0), min(int(rect[3]) + 2, height))
+            cols = slice(max(int(rect[0]) - 1, 0), min(int(rect[2]) + 2, width))
+            lit_rgb = np.asarray(lit.crop((cols.start, rows.start, cols.stop, rows.stop)), dtype=np.uint8)
+            changed = (lit_rgb != blank_rgb[rows, cols]).any(axis=2)
+            self.masks[note_to_midi(note)] = tuple(
+                (slice(r.start + rows.start, r.stop + rows.start), slice(c.start + cols.start, c.stop + cols.start))
+                for r, c in _mask_to_slices(changed))
+
+    def paint(self, out, highlight_notes):
+        """Paint highlights into out, an (H, W) array that starts as a copy of base.
+
+        highlight_notes may be MIDI numbers or spelled notes like 'Eb4'.
+        """
+        masks = self.masks
+        for note in to_midi_set(highlight_notes):
+            for rows, cols in masks.get(note, ()):
+                out[rows, cols] = HIGHLIGHT
+
+
+class KeyboardRenderer:
+    """Composites keyboard diagrams from a precomputed base layer and per-key masks."""
+
+    def __init__(self):
+        self._layers = {}
+        self._lock = threading.Lock()
+
+    def layer(self, low_note=DEFAULT_LOW_NOTE, high_note=DEFAULT_HIGH_NOTE, size=DEFAULT_SIZE):
+        key = (low_note, high_note, tuple(size))
+        layer = self._layers.get(key)
+        if layer is None:
+            with self._lock:
+                layer = self._layers.get(key)
+                if layer is None:
+                    layer = _KeyboardLayer(low_note, high_note, tuple(size))
+                    self._layers[key] = layer
+        return layer
+
+    def render_array(self, highlight_notes, low_note=DEFAULT_LOW_NOTE, high_note=DEFAULT_HIGH_NOTE,
+                     size=DEFAULT_SIZE):
+        """Render one diagram as an (H, W) array of PALETTE indices."""
+        layer = self.layer(low_note, high_note, size)
+        out = layer.base.copy()
+        layer.paint(out, highlight_notes)
+        return out
+
+    @METRICS.timed(DIAGRAM_SECONDS, "render")
+    def render(self, highlight_notes, low_note=DEFAULT_LOW_NOTE, high_note=DEFAULT_HIGH_NOTE, size=DEFAULT_SIZE,
+               theme="light"):
+        """Drop-in replacement for generate_keyboard_image, returning a palette image."""
+        return to_image(self.render_array(highlight_notes, low_note, high_note, size), theme)
+
+    def render_batch_array(self, voicings, low_note=DEFAULT_LOW_NOTE, high_note=DEFAULT_HIGH_NOTE,
+                           size=DEFAULT_SIZE):
+        """Render N highlight sets into a single (N, H, W) array of PALETTE indices."""
+        layer = self.layer(low_note, high_note, size)
+        out = np.empty((len(voicings),) + layer.shape, dtype=np.uint8)
+        out[:] = layer.base
+        for i, notes in enumerate(voicings):
+            layer.paint(out[i], notes)
+        return out
+
+    def render_batch(self, voicings, low_note=DEFAULT_LOW_NOTE, high_note=DEFAULT_HIGH_NOTE, size=DEFAULT_SIZE,
+                     theme="light"):
+        batch = self.render_batch_array(voicings, low_note, high_note, size)
+        return [to_image(frame, theme) for frame in batch]
+
+
+RENDERER = KeyboardRenderer()
@@ -0,0 +1,184 @@
+import json
+import time
+from array import array
+
+from Chords.catalogue import get_catalogue
+
+# Leitner boxes: a correct first answer moves a chord up one box, a wrong one sends it back to box 0.
+# The interval before a chord is due again grows with its box.
+BOX_INTERVALS = (0, 30, 120, 600, 3600, 86400, 4 * 86400)
+STATE_VERSION = 1
+# Due time of a chord that has no card yet, and heap slot of a chord that is not in the pool.
+_NO_CARD = -1.0
+_ABSENT = 0xFFFF
+
+
+class LeitnerScheduler:
+    """Picks the next chord to practise, by catalogue id, from a heap keyed on (due time, -error rate).
+
+    Cards are parallel arrays indexed by chord id, and the heap is an array
+    of the pool's ids with each id's heap slot kept alongside, so a schedule
+    costs about twenty bytes per chord rather than an object per card and a
+    tuple per heap entry. next() is O(1) and record() O(log n): an answered
+    chord is sifted to its new place instead of pushed again. When nothing is
+    due yet, the chord that falls due soonest is still returned, so practice
+    never stalls. Chord names only appear in dumps() and loads().
+    """
+
+    __slots__ = ("clock", "_box", "_due", "_reviews", "_errors", "_heap", "_slot")
+
+    def __init__(self, pool=(), clock=time.time):
+        self.clock = clock
+        self._box = array("B")
+        self._due = array("d")
+        self._reviews = array("I")
+        self._errors = array("I")
+        self._heap = array("H")
+        self._slot = array("H")
+        self.set_pool(pool)
+
+    def _grow(self, size):
+        extra = size - len(self._due)
+        if extra > 0:
+            self._box.extend(bytes(extra))
+            self._due.extend(array("d", [_NO_CARD]) * extra)
+            self._reviews.extend(array("I", [0]) * extra)
+            self._errors.extend(array("I", [0]) * extra)
+            self._slot.extend(array("H", [_ABSENT]) * extra)
+
+    def _key(self, chord_id):
+        # Laplace-smoothed error rate, so unseen chords rank between known-good and known-bad ones.
+        return self._due[chord_id], -(self._errors[chord_id] + 1) / (self._reviews[chord_id] + 2), chord_id
+
+    def set_pool(self, pool):
+        """Restrict scheduling to the chord ids in pool; cards for other chords are kept but not scheduled."""
+        pool = set(pool)
+        if pool:
+            self._grow(max(pool) + 1)
+        now = self.clock()
+        for chord_id in pool:
+            if self._due[chord_id] == _NO_CARD:
+                self._due[chord_id] = now
+        # A sorted array is a valid heap.
+        self._heap = array("H", sorted(pool, key=self._key))
+        slot = self._slot
+        for chord_id in range(len(slot)):
+            slot[chord_id] = _ABSENT
+        for i, chord_id in enumerate(self._heap):
+            slot[chord_id] = i
+
+    def _sift(self, i):
+        """Move the entry at heap index i up or down to where its key now belongs."""
+        heap, slot, due, reviews, errors = self._heap, self._slot, self._due, self._reviews, self._errors
+
+        def before(a, b):
+            # _key(a) < _key(b), without building the tuples.
+            if due[a] != due[b]:
+                return due[a] < due[b]
+            rate_a = (errors[a] + 1) / (reviews[a] + 2)
+            rate_b = (errors[b] + 1) / (reviews[b] + 2)
+            return rate_a > rate_b if rate_a != rate_b else a < b
+
+        chord_id = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if not before(chord_id, heap[parent]):
+                break
+            heap[i] = moved = heap[parent]
+            slot[moved] = i
+            i = parent
+        n = len(heap)
+        child = 2 * i + 1
+        while child < n:
+            if child + 1 < n and before(heap[child + 1], heap[child]):
+                child += 1
+            if not before(heap[child], chord_id):
+                break
+            heap[i] = moved = heap[child]
+            slot[moved] = i
+            i = child
+            child = 2 * i + 1
+        heap[i] = chord_id
+        slot[chord_id] = i
+
+    def next(self, exclude=None):
+        """The most urgent chord id in the pool, other than exclude unless it is the only one."""
+        heap = self._heap
+        if not heap:
+            return None
+        if heap[0] != exclude or len(heap) == 1:
+            return heap[0]
+        # The runner-up in a binary heap is one of the root's children.
+        if len(heap) == 2 or self._key(heap[1]) < self._key(heap[2]):
+            return heap[1]
+        return heap[2]
+
+    def record(self, chord_id, correct):
+        """Update a chord after a graded answer and reschedule it."""
+        self._grow(chord_id + 1)
+        self._reviews[chord_id] += 1
+        if correct:
+            self._box[chord_id] = min(self._box[chord_id] + 1, len(BOX_INTERVALS) - 1)
+        else:
+            self._errors[chord_id] += 1
+            self._box[chord_id] = 0
+        self._due[chord_id] = self.clock() + BOX_INTERVALS[self._box[chord_id]]
+        if self._slot[chord_id] != _ABSENT:
+            self._sift(self._slot[chord_id])
+
+    def stats(self, chord_id):
+        if chord_id >= len(self._due) or self._due[chord_id] == _NO_CARD:
+            return None
+        return {"box": self._box[chord_id], "due": self._due[chord_id], "reviews": self._reviews[chord_id],
+                "errors": self._errors[chord_id]}
+
+    # --- Persistence ---
+    def dumps(self):
+        """Compact JSON bytes: {name: [box, due, reviews, errors]} for chords answered at least once."""
+        names = get_catalogue().names
+        cards = {
+            names[i]: [self._box[i], round(self._due[i], 1), reviews, self._errors[i]]
+            for i, reviews in enumerate(self._reviews)
+            if reviews
+        }
+        return json.dumps({"v": STATE_VERSION, "cards": cards}, separators=(",", ":")).encode("utf-8")
+
+    @classmethod
+    def loads(cls, data, pool=(), clock=time.time):
+        """A scheduler from dumps() output; chords no longer in the catalogue are dropped."""
+        state = json.loads(data)
+        if state.get("v") != STATE_VERSION:
+            raise ValueError(f"Unsupported scheduler state version: {state.get('v')!r}")
+        ids = get_catalogue().ids
+        scheduler = cls(clock=clock)
+        cards = {ids[name]: card for name, card in state["cards"].items() if name in ids}
+        if cards:
+            scheduler._grow(max(cards) + 1)
+        for chord_id, (box, due, reviews, errors) in cards.items():
+            scheduler._box[chord_id] = box
+            scheduler._due[chord_id] = due
+            scheduler._reviews[chord_id] = reviews
+            scheduler._errors[chord_id] = errors
+        scheduler.set_pool(pool)
+        return scheduler
+
+
+# --- Saved progress files: {mode: dumps() text} ---
+def dump_schedules(schedulers):
+    return json.dumps({mode: scheduler.dumps().decode("utf-8") for mode, scheduler in schedulers.items()})
+
+
+def load_schedules(data, modes):
+    """{mode: LeitnerScheduler} from a dump_schedules() file; modes it lacks start fresh.
+
+    Raises ValueError for anything that is not such a file (truncated,
+    another format or an unsupported version), so a caller has one error to handle.
+    """
+    try:
+        states = json.loads(data)
+        if not isinstance(states, dict):
+            raise ValueError("expected schedules by mode")
+        return {mode: LeitnerScheduler.loads(states[mode]) if mode in states else LeitnerScheduler()
+                for mode in modes}
+    except (AttributeError, KeyError, OverflowError, TypeError, ValueError) as e:
+        raise ValueError(f"Not a saved practice schedule: {e}") from e
@@ -0,0 +1,336 @@
+"""Asyncio HTTP/JSON API serving the identify and play quizzes.
+
+    python -m Chords.server [--host 127.0.0.1] [--port 8000] [--progress-db progress.sqlite3]
+                           [--max-sessions N] [--session-ttl SECONDS] [--keyboard-range auto|C3-C6]
+
+POST /sessions                 {"mode": "identify"|"play"|"ear", "bases": [...]} -> session + question
+GET  /sessions/<id>/question   current question
+POST /sessions/<id>/answer     {"answer": chord name (identify), option index (play) or label (ear)}
+POST /sessions/<id>/next       move on to a new question
+GET  /diagrams/<token>.png     keyboard diagram, immutable and cacheable
+GET  /diagrams/<low>-<high>/<token>.png  the same, on a play question's shared range (e.g. C3-C6)
+GET  /audio/<token>.wav        voicing audio, immutable and cacheable
+GET  /health                    status, live sessions and session memory
+GET  /metrics                   Prometheus text exposition (collected when CHORD_TRAINER_METRICS=1)
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import traceback
+from http import HTTPStatus
+
+from Chords.atlas import DEFAULT_AUDIO_BANK, audio_asset_key
+from Chords.audio import AUDIO_CACHE
+from Chords.build_assets import load_current_atlas
+from Chords.catalogue import DEFAULT_BASES, get_catalogue
+from Chords.chords import CHORDS
+from Chords.diagram_cache import DIAGRAM_CACHE
+from Chords.keyboard import AUTO_RANGE, parse_keyboard_range, resolve_range, shared_range
+from Chords.metrics import CONTENT_TYPE, METRICS
+from Chords.model import VOICED_CHORDS
+from Chords.pitch import note_to_midi
+from Chords.progress import ProgressStore
+from Chords.quiz import EarQuiz, IdentifyQuiz, PlayQuiz
+from Chords.sessions import DEFAULT_MAX_SESSIONS, DEFAULT_SESSION_TTL, QuizSession, SessionManager
+
+MAX_BODY_BYTES = 64 * 1024
+
+REQUEST_SECONDS = METRICS.histogram("chord_trainer_http_request_seconds", "Seconds to handle an API request.",
+                                    ("route",))
+# Request timings are labelled by first path segment; anything else is "other", so stray URLs add no series.
+ROUTES = frozenset({"sessions", "diagrams", "audio", "health", "metrics"})
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message=None):
+        super().__init__(message or status.phrase)
+        self.status = status
+
+
+def _route(path):
+    route = path.strip("/").split("/", 1)[0]
+    return route if route in ROUTES else "other"
+
+
+def _diagram_token(midi):
+    # Opaque so option diagrams do not reveal chord names; stable so browsers can cache them.
+    return hashlib.blake2s(repr(midi).encode("ascii"), digest_size=8).hexdigest()
+
+
+class QuizAPI:
+    def __init__(self, sessions=None, diagram_cache=DIAGRAM_CACHE, progress=None, audio_bank=None,
+                 audio_cache=AUDIO_CACHE, keyboard_range=AUTO_RANGE):
+        self.catalogue = get_catalogue()
+        self.sessions = sessions if sessions is not None else SessionManager()
+        self.diagram_cache = diagram_cache
+        self.keyboard_range = keyboard_range
+        self.progress = progress
+        self.audio_bank = audio_bank
+        self.audio_cache = audio_cache
+        self.diagram_tokens = {_diagram_token(c.midi): c.midi for c in VOICED_CHORDS.values()}
+        self._token_of = {name: _diagram_token(c.midi) for name, c in VOICED_CHORDS.items()}
+        # Voicings with the same notes share a token, so any one of their names finds the clip.
+        self.audio_tokens = {token: name for name, token in self._token_of.items()}
+        METRICS.stats_gauges("chord_trainer_cache", "Asset cache statistics", "cache",
+                             {"diagram": diagram_cache.stats, "audio": audio_cache.stats})
+        METRICS.stats_gauges("chord_trainer_session_store", "Quiz session statistics", "store",
+                             {"server": self.sessions.stats})
+
+    # --- Routing ---
+    def handle(self, method, path, body):
+        """Returns (status, content type, body bytes, extra headers)."""
+        parts = path.strip("/").split("/")
+        if method == "GET" and parts == ["health"]:
+            return self._json({"status": "ok", "sessions": self.sessions.stats()})
+        if method == "GET" and parts == ["metrics"]:
+            return HTTPStatus.OK, CONTENT_TYPE, METRICS.exposition().encode("utf-8"), {}
+        if method == "POST" and parts == ["sessions"]:
+            return self._json(self.create_session(self._parse_json(body)), HTTPStatus.CREATED)
+        if len(parts) == 3 and parts[0] == "sessions":
+            session = self.sessions.get(parts[1])
+            if session is None:
+                raise HTTPError(HTTPStatus.NOT_FOUND, "Unknown or expired session")
+            if method == "GET" and parts[2] == "question":
+                return self._json(self.question(session))
+            if method == "POST" and parts[2] == "answer":
+                return self._json(self.answer(session.quiz, self._parse_json(body)))
+            if method == "POST" and parts[2] == "next":
+                session.quiz.next_question()
+                return self._json(self.question(session))
+        if method == "GET" and 2 <= len(parts) <= 3 and parts[0] == "diagrams" and parts[-1].endswith(".png"):
+            return self.diagram(parts[-1][:-4], parts[1] if len(parts) == 3 else None)
+        if method == "GET" and len(parts) == 2 and parts[0] == "audio" and parts[1].endswith(".wav"):
+            return self.audio(parts[1][:-4])
+        raise HTTPError(HTTPStatus.NOT_FOUND)
+
+    # --- Endpoints ---
+    def create_session(self, payload):
+        mode = payload.get("mode", "identify")
+        bases = payload.get("bases") or list(DEFAULT_BASES)
+        if not isinstance(bases, list) or not all(isinstance(b, str) for b in bases):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "bases must be a list of chord group names")
+        unknown = [b for b in bases if b not in self.catalogue.grouped]
+        if unknown:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Unknown chord groups: {unknown}")
+        chords = self.catalogue.selected_chords(bases)
+        if mode == "identify":
+            engine = IdentifyQuiz(chords)
+        elif mode in ("play", "ear"):
+            chords = [ch for ch in chords if ch in VOICED_CHORDS]
+            if not chords:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "None of the selected chords have voicings")
+            engine = PlayQuiz(chords) if mode == "play" else EarQuiz(chords)
+        else:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "mode must be 'identify', 'play' or 'ear'")
+        session = QuizSession(engine.mode, engine, sorted(bases))
+        session_id = self.sessions.create(session)
+        if self.progress is not None:
+            engine.recorder = self.progress.recorder(session_id)
+        return {"session": session_id, "question": self.question(session)}
+
+    def question(self, session):
+        engine = session.quiz
+        if isinstance(engine, EarQuiz):
+            return {
+                "mode": "ear",
+                "audio": f"/audio/{self._token_of[engine.current]}.wav",
+                "options": engine.labels,
+                "attempts": engine.snapshot()["attempts"],
+            }
+        if isinstance(engine, IdentifyQuiz):
+            return {
+                "mode": "identify",
+                "notes": CHORDS[engine.current],
+                "options": {base: self.catalogue.options[base] for base in session.bases},
+                "attempts": list(engine.current_attempts()),
+            }
+        # Options are drawn on one shared range, so their width and key size give nothing away.
+        low, high = shared_range([VOICED_CHORDS[name].midi for name in engine.options], self.keyboard_range)
+        return {
+            "mode": "play",
+            "prompt": engine.current,
+            "options": [f"/diagrams/{low}-{high}/{self._token_of[name]}.png" for name in engine.options],
+        }
+
+    def answer(self, engine, payload):
+        answer = payload.get("answer")
+        if isinstance(engine, PlayQuiz):
+            # JSON true/false arrive as bool, which is an int subclass; they are not indexes.
+            if isinstance(answer, bool) or not isinstance(answer, int) or not 0 <= answer < len(engine.options):
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "answer must be an option index")
+            answer = engine.options[answer]
+        elif isinstance(engine, EarQuiz):
+            if not isinstance(answer, str) or not engine.is_label(answer):
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "answer must be one of the session's quality/inversion labels")
+        elif not isinstance(answer, str) or not engine.in_pool(answer):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "answer must be one of the session's chords")
+        correct = engine.submit_answer(answer)
+        result = {"correct": correct, "answer": answer}
+        if correct:
+            result["chord"] = engine.current
+        return result
+
+    def diagram(self, token, key_range=None):
+        """The diagram for token, on its own range or on key_range (such as "C3-C6") from a play question."""
+        midi = self.diagram_tokens.get(token)
+        if midi is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND)
+        if key_range is None:
+            low, high = resolve_range(midi, self.keyboard_range)
+        else:
+            try:
+                low, high = parse_keyboard_range(key_range)
+            except ValueError:
+                raise HTTPError(HTTPStatus.NOT_FOUND) from None
+            # Only ranges shared_range() can produce, which keeps the renderer's layers few, and wide enough for midi.
+            if resolve_range({note_to_midi(low), note_to_midi(high), *midi}, self.keyboard_range) != (low, high):
+                raise HTTPError(HTTPStatus.NOT_FOUND)
+        data = self.diagram_cache.get_encoded(midi, "png", low, high)
+        headers = {"Cache-Control": "public, max-age=31536000, immutable", "ETag": f'"{token}-{low}-{high}"'}
+        return HTTPStatus.OK, "image/png", data, headers
+
+    def audio(self, token):
+        name = self.audio_tokens.get(token)
+        if name is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND)
+        # A memoryview into the mapped bank; it is written to the socket without copying.
+        data = self.audio_bank.get(audio_asset_key(name)) if self.audio_bank is not None else None
+        if data is None:
+            data = self.audio_cache.get(VOICED_CHORDS[name].midi)
+        headers = {"Cache-Control": "public, max-age=31536000, immutable", "ETag": f'"{token}"'}
+        return HTTPStatus.OK, "audio/wav", data, headers
+
+    # --- Helpers ---
+    @staticmethod
+    def _parse_json(body):
+        if not body:
+            return {}
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be JSON")
+        if not isinstance(payload, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object")
+        return payload
+
+    @staticmethod
+    def _json(payload, status=HTTPStatus.OK):
+        return status, "application/json", json.dumps(payload, separators=(",", ":")).encode("utf-8"), {}
+
+
+async def _read_request(reader):
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    try:
+        method, target, version = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = headers.get("content-length") or "0"
+    if not (length.isascii() and length.isdigit()):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Content-Length must be a non-negative integer")
+    length = int(length)
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+    body = await reader.readexactly(length) if length else b""
+    keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+    return method, target.split("?", 1)[0], body, keep_alive
+
+
+def _write_response(writer, status, content_type, body, headers, keep_alive):
+    head = [
+        f"HTTP/1.1 {status.value} {status.phrase}",
+        f"Content-Type: {content_type}",
+        f"Content-Length: {len(body)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    head.extend(f"{name}: {value}" for name, value in headers.items())
+    writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+    writer.write(body)
+
+
+def _error_response(status, message=None):
+    return status, "application/json", json.dumps({"error": message or status.phrase}).encode("utf-8"), {}
+
+
+def make_handler(api):
+    async def handle_connection(reader, writer):
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                    if request is None:
+                        break
+                    method, path, body, keep_alive = request
+                    with REQUEST_SECONDS.time(_route(path)):
+                        status, content_type, payload, headers = api.handle(method, path, body)
+                except HTTPError as exc:
+                    keep_alive = False
+                    status, content_type, payload, headers = _error_response(exc.status, str(exc))
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    raise
+                except Exception:
+                    # A bug in a handler still gets the client a response, not a dropped connection.
+                    traceback.print_exc()
+                    keep_alive = False
+                    status, content_type, payload, headers = _error_response(HTTPStatus.INTERNAL_SERVER_ERROR)
+                _write_response(writer, status, content_type, payload, headers, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    return handle_connection
+
+
+async def serve(host="127.0.0.1", port=8000, api=None):
+    api = api or QuizAPI()
+    server = await asyncio.start_server(make_handler(api), host, port)
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-sessions", type=int, default=DEFAULT_MAX_SESSIONS)
+    parser.add_argument("--session-ttl", type=float, default=DEFAULT_SESSION_TTL,
+                        help="seconds before an idle session is dropped")
+    parser.add_argument("--progress-db", help="log every answer to this SQLite file")
+    parser.add_argument("--audio-bank", default=DEFAULT_AUDIO_BANK,
+                        help="audio atlas from `python -m Chords.build_assets --audio`")
+    parser.add_argument("--keyboard-range", type=parse_keyboard_range, default=AUTO_RANGE,
+                        help='"auto" to fit each diagram to its voicing, or a fixed range like C3-C6')
+    args = parser.parse_args(argv)
+    progress = ProgressStore(args.progress_db) if args.progress_db else None
+    api = QuizAPI(SessionManager(args.max_sessions, args.session_ttl), progress=progress,
+                  audio_bank=load_current_atlas(args.audio_bank), keyboard_range=args.keyboard_range)
+
+    async def run():
+        server = await serve(args.host, args.port, api)
+        print(f"Serving on http://{args.host}:{args.port}")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if progress is not None:
+            progress.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import itertools
+import secrets
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+
+DEFAULT_MAX_SESSIONS = 10000
+DEFAULT_SESSION_TTL = 2 * 3600
+# Attributes that point at process-wide objects (similarity indexes, progress recorders), not per-session state.
+SHARED_ATTRS = frozenset({"similarity", "_similar", "recorder"})
+
+
+class QuizSession:
+    """One learner's state: the quiz for the mode in use and, in the app, a scheduler per mode.
+
+    Switching mode replaces the quiz, so only one engine is held at a time.
+    """
+
+    __slots__ = ("mode", "quiz", "bases", "schedulers", "last_seen")
+
+    def __init__(self, mode=None, quiz=None, bases=(), schedulers=None):
+        self.mode = mode
+        self.quiz = quiz
+        self.bases = tuple(bases)
+        self.schedulers = schedulers
+        self.last_seen = 0.0
+
+
+def deep_sizeof(obj, _seen=None):
+    """Bytes held by obj and the containers and objects it refers to.
+
+    Strings are not counted (chord names are shared with the catalogue), nor
+    are callables or attributes in SHARED_ATTRS.
+    """
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen or isinstance(obj, str) or callable(obj):
+        return 0
+    _seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, _seen) + deep_sizeof(v, _seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, _seen) for item in obj)
+    elif not isinstance(obj, (array, bytes, int, float)):
+        attrs = dict(vars(obj)) if hasattr(obj, "__dict__") else {}
+        for cls in type(obj).__mro__:
+            for attr in cls.__dict__.get("__slots__", ()):
+                attrs[attr] = getattr(obj, attr, None)
+        size += sum(deep_sizeof(value, _seen) for attr, value in attrs.items() if attr not in SHARED_ATTRS)
+    return size
+
+
+class SessionManager:
+    """Server-side sessions under random ids, evicting idle and least recently used ones.
+
+    Sessions unused for ttl seconds expire, and at most max_sessions are kept;
+    both are enforced on every create() and get(), oldest first, so the work
+    is proportional to what is evicted. Thread-safe: Streamlit runs each
+    browser session's script on its own thread.
+    """
+
+    def __init__(self, max_sessions=DEFAULT_MAX_SESSIONS, ttl=DEFAULT_SESSION_TTL, clock=time.monotonic):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._clock = clock
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self.created = 0
+        self.expired = 0
+        self.evicted = 0
+
+    def create(self, session):
+        session_id = secrets.token_urlsafe(12)
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            session.last_seen = now
+            self._sessions[session_id] = session
+            self.created += 1
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+                self.evicted += 1
+        return session_id
+
+    def get(self, session_id):
+        """The session, marked as used, or None if it is unknown or has expired."""
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.last_seen = now
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def _expire(self, now):
+        sessions = self._sessions
+        while sessions:
+            session = next(iter(sessions.values()))
+            if now - session.last_seen < self.ttl:
+                return
+            sessions.popitem(last=False)
+            self.expired += 1
+
+    def stats(self, sample=100):
+        """Live sessions, evictions so far, and mean bytes per session over the sample most recently used."""
+        with self._lock:
+            self._expire(self._clock())
+            recent = list(itertools.islice(reversed(self._sessions.values()), sample))
+            stats = {
+                "sessions": len(self._sessions),
+                "max_sessions": self.max_sessions,
+                "ttl": self.ttl,
+                "created": self.created,
+                "expired": self.expired,
+                "evicted": self.evicted,
+            }
+        stats["bytes_per_session"] = round(sum(map(deep_sizeof, recent)) / len(recent)) if recent else 0
+        return stats
+
+    def __len__(self):
+        return len(self._sessions)
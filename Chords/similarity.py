@@ -0,0 +1,86 @@
+import functools
+import random
+import threading
+from collections import OrderedDict
+
+from Chords.model import VOICED_CHORDS
+
+DIFFICULTY_LEVELS = {"easy": 0.0, "medium": 0.5, "hard": 1.0}
+# Restricted indexes kept per SimilarityIndex, least recently used dropped first.
+RESTRICTED_CACHE_SIZE = 32
+
+
+def voicing_distance(a, b):
+    """How easy two voicings are to tell apart; smaller means more confusable.
+
+    Counts keys lit in one diagram but not the other, plus half a point per
+    pitch class not shared and half a point for a different inversion. The
+    spread of the voicings (semitones between sorted notes / 12) breaks ties.
+    """
+    keys = len(set(a.midi) ^ set(b.midi))
+    pitch_classes = bin(a.pc_mask ^ b.pc_mask).count("1")
+    inversion = 0 if a.inversion == b.inversion else 1
+    spread = sum(abs(x - y) for x, y in zip(sorted(a.midi), sorted(b.midi))) / 12
+    return keys + 0.5 * pitch_classes + 0.5 * inversion + 0.01 * spread
+
+
+class SimilarityIndex:
+    """Every voiced chord's other voicings, ranked once from most to least confusable.
+
+    Voicings that light exactly the same keys (enharmonic duplicates) are left
+    out, since they would be indistinguishable as options. Building is
+    O(n^2 log n); a query reads a k-sized window of the precomputed ranking.
+    """
+
+    def __init__(self, chords=VOICED_CHORDS, neighbours=None):
+        self._restricted = OrderedDict()
+        self._lock = threading.Lock()
+        if neighbours is not None:
+            self.neighbours = neighbours
+            return
+        self.neighbours = {}
+        for name, chord in chords.items():
+            keys = frozenset(chord.midi)
+            ranked = sorted(
+                (voicing_distance(chord, other), other_name)
+                for other_name, other in chords.items()
+                if other_name != name and frozenset(other.midi) != keys
+            )
+            self.neighbours[name] = tuple(other_name for _, other_name in ranked)
+
+    def restricted(self, pool):
+        """The same rankings filtered to a frozenset of chord names, cached per pool."""
+        with self._lock:
+            index = self._restricted.get(pool)
+            if index is not None:
+                self._restricted.move_to_end(pool)
+                return index
+        index = SimilarityIndex(neighbours={
+            name: tuple(n for n in ranked if n in pool)
+            for name, ranked in self.neighbours.items()
+            if name in pool
+        })
+        with self._lock:
+            index = self._restricted.setdefault(pool, index)
+            self._restricted.move_to_end(pool)
+            while len(self._restricted) > RESTRICTED_CACHE_SIZE:
+                self._restricted.popitem(last=False)
+        return index
+
+    def distractors(self, name, k=3, difficulty="hard", rng=random):
+        """k distinct distractors for name, drawn from a window of its ranking.
+
+        difficulty is "easy", "medium", "hard" or a float from 0 (least
+        confusable) to 1 (most confusable).
+        """
+        level = DIFFICULTY_LEVELS.get(difficulty, difficulty)
+        ranked = self.neighbours[name]
+        window = max(2 * k, k + 2)
+        start = round((1.0 - level) * max(0, len(ranked) - window))
+        candidates = ranked[start:start + window]
+        return rng.sample(candidates, min(k, len(candidates)))
+
+
+@functools.lru_cache(maxsize=None)
+def get_similarity_index():
+    return SimilarityIndex()
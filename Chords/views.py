@@ -0,0 +1,49 @@
+import streamlit as st
+
+from Chords.chords import CHORDS
+from Chords.pitch import midi_to_name
+
+
+def identify_grid(quiz, sorted_bases, options, submit_answer=None):
+    """Identify the Position's question, answer grid and feedback for an IdentifyQuiz.
+
+    This is the body of app.py's identify_view fragment, kept here so that
+    benchmarks.bench_identify_clicks times the same code. options maps each
+    base to its chords in display order (Catalogue.options); submit_answer
+    defaults to quiz.submit_answer.
+    """
+    submit_answer = submit_answer or quiz.submit_answer
+    # Buttons answer through on_click (which runs before the rerun, so the feedback
+    # drawn below is already up to date) and keep the same key across questions,
+    # so the frontend reuses them instead of remounting the grid.
+    st.button("Next Chord", key="next_chord_position", on_click=quiz.next_question)
+
+    chord_key = quiz.current
+    attempts = quiz.current_attempts()
+    st.write(f"### Notes: {', '.join(CHORDS[chord_key])}")
+
+    unrecognized = st.session_state.pop("midi_unrecognized", None)
+    if unrecognized is not None:
+        st.warning(f"{' '.join(midi_to_name(n) for n in unrecognized)} is not a chord in the library.")
+
+    # --- Display columns of options with feedback ---
+    for col, base in zip(st.columns(len(sorted_bases)), sorted_bases):
+        with col:
+            st.write(f"**{base}**")
+            # Precomputed order: root chord first, then the rest sorted
+            for option in options[base]:
+                st.button(option, key=f"identify_{option}", on_click=submit_answer, args=(option,))
+
+                # Feedback coloring for attempted options
+                if option in attempts:
+                    if option == chord_key:
+                        st.success(f"{option} ✅")
+                    else:
+                        st.error(f"{option} ❌")
+
+    # --- Display bottom feedback ---
+    if attempts and quiz.last_attempt:
+        if quiz.last_attempt == chord_key:
+            st.success(f"✅ Correct! It was {chord_key}")
+        else:
+            st.error("❌ Incorrect. Try again!")
@@ -1,305 +1,14 @@
-RAW_VOICINGS = """
-    C major root: C4 E4 G4
-    C major 1st inversion: E3 G3 C4
-    C major 2nd inversion: G3 C4 E4
-    C# major root: C#4 E#4 G#4
-    C# major 1st inversion: E#3 G#3 C#4
-    C# major 2nd inversion: G#3 C#4 E#4
-    D major root: D4 F#4 A4
-    D major 1st inversion: F#3 A3 D4
-    D major 2nd inversion: A3 D4 F#4
-    Eb major root: Eb4 G4 Bb4
-    Eb major 1st inversion: G3 Bb3 Eb4
-    Eb major 2nd inversion: Bb3 Eb4 G4
-    E major root: E4 G#4 B4
-    E major 1st inversion: G#3 B3 E4
-    E major 2nd inversion: B3 E4 G#4
-    F major root: F4 A4 C5
-    F major 1st inversion: A3 C4 F4
-    F major 2nd inversion: C4 F4 A4
-    F# major root: F#4 A#4 C#5
-    F# major 1st inversion: A#3 C#4 F#4
-    F# major 2nd inversion: C#4 F#4 A#4
-    G major root: G4 B4 D5
-    G major 1st inversion: B3 D4 G4
-    G major 2nd inversion: D4 G4 B4
-    Ab major root: Ab4 C5 Eb5
-    Ab major 1st inversion: C4 Eb4 Ab4
-    Ab major 2nd inversion: Eb4 Ab4 C5
-    A major root: A4 C#5 E5
-    A major 1st inversion: C#4 E4 A4
-    A major 2nd inversion: E4 A4 C#5
-    Bb major root: Bb4 D5 F5
-    Bb major 1st inversion: D4 F4 Bb4
-    Bb major 2nd inversion: F4 Bb4 D5
-    B major root: B4 D#5 F#5
-    B major 1st inversion: D#4 F#4 B4
-    B major 2nd inversion: F#4 B4 D#5
-    C minor root: C4 Eb4 G4
-    C minor 1st inversion: Eb3 G3 C4
-    C minor 2nd inversion: G3 C4 Eb4
-    C# minor root: C#4 E4 G#4
-    C# minor 1st inversion: E3 G#3 C#4
-    C# minor 2nd inversion: G#3 C#4 E4
-    D minor root: D4 F4 A4
-    D minor 1st inversion: F3 A3 D4
-    D minor 2nd inversion: A3 D4 F4
-    Eb minor root: Eb4 Gb4 Bb4
-    Eb minor 1st inversion: Gb3 Bb3 Eb4
-    Eb minor 2nd inversion: Bb3 Eb4 Gb4
-    E minor root: E4 G4 B4
-    E minor 1st inversion: G3 B3 E4
-    E minor 2nd inversion: B3 E4 G4
-    F minor root: F4 Ab4 C5
-    F minor 1st inversion: Ab3 C4 F4
-    F minor 2nd inversion: C4 F4 Ab4
-    F# minor root: F#4 A4 C#5
-    F# minor 1st inversion: A3 C#4 F#4
-    F# minor 2nd inversion: C#4 F#4 A4
-    G minor root: G4 Bb4 D5
-    G minor 1st inversion: Bb3 D4 G4
-    G minor 2nd inversion: D4 G4 Bb4
-    Ab minor root: Ab4 Cb5 Eb5
-    Ab minor 1st inversion: Cb4 Eb4 Ab4
-    Ab minor 2nd inversion: Eb4 Ab4 Cb5
-    A minor root: A4 C5 E5
-    A minor 1st inversion: C4 E4 A4
-    A minor 2nd inversion: E4 A4 C5
-    Bb minor root: Bb4 Db5 F5
-    Bb minor 1st inversion: Db4 F4 Bb4
-    Bb minor 2nd inversion: F4 Bb4 Db5
-    B minor root: B4 D5 F#5
-    B minor 1st inversion: D4 F#4 B4
-    B minor 2nd inversion: F#4 B4 D5
-    C diminished root: C4 Eb4 Gb4
-    C diminished 1st inversion: Eb3 Gb3 C4
-    C diminished 2nd inversion: Gb3 C4 Eb4
-    C# diminished root: C#4 E4 G4
-    C# diminished 1st inversion: E3 G3 C#4
-    C# diminished 2nd inversion: G3 C#4 E4
-    D diminished root: D4 F4 Ab4
-    D diminished 1st inversion: F3 Ab3 D4
-    D diminished 2nd inversion: Ab3 D4 F4
-    Eb diminished root: Eb4 Gb4 Bb4
-    Eb diminished 1st inversion: Gb3 Bb3 Eb4
-    Eb diminished 2nd inversion: Bb3 Eb4 Gb4
-    E diminished root: E4 G4 Bb4
-    E diminished 1st inversion: G3 Bb3 E4
-    E diminished 2nd inversion: Bb3 E4 G4
-    F diminished root: F4 Ab4 Cb5
-    F diminished 1st inversion: Ab3 Cb4 F4
-    F diminished 2nd inversion: Cb4 F4 Ab4
-    F# diminished root: F#4 A4 C5
-    F# diminished 1st inversion: A3 C4 F#4
-    F# diminished 2nd inversion: C4 F#4 A4
-    G diminished root: G4 Bb4 Db5
-    G diminished 1st inversion: Bb3 Db4 G4
-    G diminished 2nd inversion: Db4 G4 Bb4
-    Ab diminished root: Ab4 Cb5 Eb5
-    Ab diminished 1st inversion: Cb4 Eb4 Ab4
-    Ab diminished 2nd inversion: Eb4 Ab4 Cb5
-    A diminished root: A4 C5 Eb5
-    A diminished 1st inversion: C4 Eb4 A4
-    A diminished 2nd inversion: Eb4 A4 C5
-    Bb diminished root: Bb4 Db5 Fb5
-    Bb diminished 1st inversion: Db4 Fb4 Bb4
-    Bb diminished 2nd inversion: Fb4 Bb4 Db5
-    B diminished root: B4 D5 F5
-    B diminished 1st inversion: D4 F4 B4
-    B diminished 2nd inversion: F4 B4 D5
-    C major seventh root: C4 E4 G4 B4
-    C major seventh 1st inversion: E3 G3 B3 C4
-    C major seventh 2nd inversion: G3 B3 C4 E4
-    C major seventh 3rd inversion: B3 C4 E4 G4
-    C# major seventh root: C#4 E#4 G#4 B#4
-    C# major seventh 1st inversion: E#3 G#3 B#3 C#4
-    C# major seventh 2nd inversion: G#3 B#3 C#4 E#4
-    C# major seventh 3rd inversion: B#3 C#4 E#4 G#4
-    D major seventh root: D4 F#4 A4 C#5
-    D major seventh 1st inversion: F#3 A3 C#4 D4
-    D major seventh 2nd inversion: A3 C#4 D4 F#4
-    D major seventh 3rd inversion: C#4 D4 F#4 A4
-    Eb major seventh root: Eb4 G4 Bb4 D5
-    Eb major seventh 1st inversion: G3 Bb3 D4 Eb4
-    Eb major seventh 2nd inversion: Bb3 D4 Eb4 G4
-    Eb major seventh 3rd inversion: D4 Eb4 G4 Bb4
-    E major seventh root: E4 G#4 B4 D#5
-    E major seventh 1st inversion: G#3 B3 D#4 E4
-    E major seventh 2nd inversion: B3 D#4 E4 G#4
-    E major seventh 3rd inversion: D#4 E4 G#4 B4
-    F major seventh root: F4 A4 C5 E5
-    F major seventh 1st inversion: A3 C4 E4 F4
-    F major seventh 2nd inversion: C4 E4 F4 A4
-    F major seventh 3rd inversion: E4 F4 A4 C5
-    F# major seventh root: F#4 A#4 C#5 E#5
-    F# major seventh 1st inversion: A#3 C#4 E#4 F#4
-    F# major seventh 2nd inversion: C#4 E#4 F#4 A#4
-    F# major seventh 3rd inversion: E#4 F#4 A#4 C#5
-    G major seventh root: G4 B4 D5 F#5
-    G major seventh 1st inversion: B3 D4 F#4 G4
-    G major seventh 2nd inversion: D4 F#4 G4 B4
-    G major seventh 3rd inversion: F#4 G4 B4 D5
-    Ab major seventh root: Ab4 C5 Eb5 G5
-    Ab major seventh 1st inversion: C4 Eb4 G4 Ab4
-    Ab major seventh 2nd inversion: Eb4 G4 Ab4 C5
-    Ab major seventh 3rd inversion: G4 Ab4 C5 Eb5
-    A major seventh root: A4 C#5 E5 G#5
-    A major seventh 1st inversion: C#4 E4 G#4 A4
-    A major seventh 2nd inversion: E4 G#4 A4 C#5
-    A major seventh 3rd inversion: G#4 A4 C#5 E5
-    Bb major seventh root: Bb4 D5 F5 A5
-    Bb major seventh 1st inversion: D4 F4 A4 Bb4
-    Bb major seventh 2nd inversion: F4 A4 Bb4 D5
-    Bb major seventh 3rd inversion: A4 Bb4 D5 F5
-    B major seventh root: B4 D#5 F#5 A#5
-    B major seventh 1st inversion: D#4 F#4 A#4 B4
-    B major seventh 2nd inversion: F#4 A#4 B4 D#5
-    B major seventh 3rd inversion: A#4 B4 D#5 F#5
-    C dominant seventh root: C4 E4 G4 Bb4
-    C dominant seventh 1st inversion: E3 G3 Bb3 C4
-    C dominant seventh 2nd inversion: G3 Bb3 C4 E4
-    C dominant seventh 3rd inversion: Bb3 C4 E4 G4
-    C# dominant seventh root: C#4 E#4 G#4 B4
-    C# dominant seventh 1st inversion: E#3 G#3 B3 C#4
-    C# dominant seventh 2nd inversion: G#3 B3 C#4 E#4
-    C# dominant seventh 3rd inversion: B3 C#4 E#4 G#4
-    D dominant seventh root: D4 F#4 A4 C5
-    D dominant seventh 1st inversion: F#3 A3 C4 D4
-    D dominant seventh 2nd inversion: A3 C4 D4 F#4
-    D dominant seventh 3rd inversion: C4 D4 F#4 A4
-    Eb dominant seventh root: Eb4 G4 Bb4 Db5
-    Eb dominant seventh 1st inversion: G3 Bb3 Db4 Eb4
-    Eb dominant seventh 2nd inversion: Bb3 Db4 Eb4 G4
-    Eb dominant seventh 3rd inversion: Db4 Eb4 G4 Bb4
-    E dominant seventh root: E4 G#4 B4 D5
-    E dominant seventh 1st inversion: G#3 B3 D4 E4
-    E dominant seventh 2nd inversion: B3 D4 E4 G#4
-    E dominant seventh 3rd inversion: D4 E4 G#4 B4
-    F dominant seventh root: F4 A4 C5 Eb5
-    F dominant seventh 1st inversion: A3 C4 Eb4 F4
-    F dominant seventh 2nd inversion: C4 Eb4 F4 A4
-    F dominant seventh 3rd inversion: Eb4 F4 A4 C5
-    F# dominant seventh root: F#4 A#4 C#5 E5
-    F# dominant seventh 1st inversion: A#3 C#4 E4 F#4
-    F# dominant seventh 2nd inversion: C#4 E4 F#4 A#4
-    F# dominant seventh 3rd inversion: E4 F#4 A#4 C#5
-    G dominant seventh root: G4 B4 D5 F5
-    G dominant seventh 1st inversion: B3 D4 F4 G4
-    G dominant seventh 2nd inversion: D4 F4 G4 B4
-    G dominant seventh 3rd inversion: F4 G4 B4 D5
-    Ab dominant seventh root: Ab4 C5 Eb5 Gb5
-    Ab dominant seventh 1st inversion: C4 Eb4 Gb4 Ab4
-    Ab dominant seventh 2nd inversion: Eb4 Gb4 Ab4 C5
-    Ab dominant seventh 3rd inversion: Gb4 Ab4 C5 Eb5
-    A dominant seventh root: A4 C#5 E5 G5
-    A dominant seventh 1st inversion: C#4 E4 G4 A4
-    A dominant seventh 2nd inversion: E4 G4 A4 C#5
-    A dominant seventh 3rd inversion: G4 A4 C#5 E5
-    Bb dominant seventh root: Bb4 D5 F5 Ab5
-    Bb dominant seventh 1st inversion: D4 F4 Ab4 Bb4
-    Bb dominant seventh 2nd inversion: F4 Ab4 Bb4 D5
-    Bb dominant seventh 3rd inversion: Ab4 Bb4 D5 F5
-    B dominant seventh root: B4 D#5 F#5 A5
-    B dominant seventh 1st inversion: D#4 F#4 A4 B4
-    B dominant seventh 2nd inversion: F#4 A4 B4 D#5
-    B dominant seventh 3rd inversion: A4 B4 D#5 F#5
-    C minor seventh root: C4 Eb4 G4 Bb4
-    C minor seventh 1st inversion: Eb3 G3 Bb3 C4
-    C minor seventh 2nd inversion: G3 Bb3 C4 Eb4
-    C minor seventh 3rd inversion: Bb3 C4 Eb4 G4
-    C# minor seventh root: C#4 E4 G#4 B4
-    C# minor seventh 1st inversion: E3 G#3 B3 C#4
-    C# minor seventh 2nd inversion: G#3 B3 C#4 E4
-    C# minor seventh 3rd inversion: B3 C#4 E4 G#4
-    D minor seventh root: D4 F4 A4 C5
-    D minor seventh 1st inversion: F3 A3 C4 D4
-    D minor seventh 2nd inversion: A3 C4 D4 F4
-    D minor seventh 3rd inversion: C4 D4 F4 A4
-    Eb minor seventh root: Eb4 Gb4 Bb4 Db5
-    Eb minor seventh 1st inversion: Gb3 Bb3 Db4 Eb4
-    Eb minor seventh 2nd inversion: Bb3 Db4 Eb4 Gb4
-    Eb minor seventh 3rd inversion: Db4 Eb4 Gb4 Bb4
-    E minor seventh root: E4 G4 B4 D5
-    E minor seventh 1st inversion: G3 B3 D4 E4
-    E minor seventh 2nd inversion: B3 D4 E4 G4
-    E minor seventh 3rd inversion: D4 E4 G4 B4
-    F minor seventh root: F4 Ab4 C5 Eb5
-    F minor seventh 1st inversion: Ab3 C4 Eb4 F4
-    F minor seventh 2nd inversion: C4 Eb4 F4 Ab4
-    F minor seventh 3rd inversion: Eb4 F4 Ab4 C5
-    F# minor seventh root: F#4 A4 C#5 E5
-    F# minor seventh 1st inversion: A3 C#4 E4 F#4
-    F# minor seventh 2nd inversion: C#4 E4 F#4 A4
-    F# minor seventh 3rd inversion: E4 F#4 A4 C#5
-    G minor seventh root: G4 Bb4 D5 F5
-    G minor seventh 1st inversion: Bb3 D4 F4 G4
-    G minor seventh 2nd inversion: D4 F4 G4 Bb4
-    G minor seventh 3rd inversion: F4 G4 Bb4 D5
-    Ab minor seventh root: Ab4 Cb5 Eb5 Gb5
-    Ab minor seventh 1st inversion: Cb4 Eb4 Gb4 Ab4
-    Ab minor seventh 2nd inversion: Eb4 Gb4 Ab4 Cb5
-    Ab minor seventh 3rd inversion: Gb4 Ab4 Cb5 Eb5
-    A minor seventh root: A4 C5 E5 G5
-    A minor seventh 1st inversion: C4 E4 G4 A4
-    A minor seventh 2nd inversion: E4 G4 A4 C5
-    A minor seventh 3rd inversion: G4 A4 C5 E5
-    Bb minor seventh root: Bb4 Db5 F5 Ab5
-    Bb minor seventh 1st inversion: Db4 F4 Ab4 Bb4
-    Bb minor seventh 2nd inversion: F4 Ab4 Bb4 Db5
-    Bb minor seventh 3rd inversion: Ab4 Bb4 Db5 F5
-    B minor seventh root: B4 D5 F#5 A5
-    B minor seventh 1st inversion: D4 F#4 A4 B4
-    B minor seventh 2nd inversion: F#4 A4 B4 D5
-    B minor seventh 3rd inversion: A4 B4 D5 F#5
-    C minor seventh flat five root: C4 Eb4 Gb4 Bb4
-    C minor seventh flat five 1st inversion: Eb3 Gb3 Bb3 C4
-    C minor seventh flat five 2nd inversion: Gb3 Bb3 C4 Eb4
-    C minor seventh flat five 3rd inversion: Bb3 C4 Eb4 Gb4
-    C# minor seventh flat five root: C#4 E4 G4 B4
-    C# minor seventh flat five 1st inversion: E3 G3 B3 C#4
-    C# minor seventh flat five 2nd inversion: G3 B3 C#4 E4
-    C# minor seventh flat five 3rd inversion: B3 C#4 E4 G4
-    D minor seventh flat five root: D4 F4 Ab4 C5
-    D minor seventh flat five 1st inversion: F3 Ab3 C4 D4
-    D minor seventh flat five 2nd inversion: Ab3 C4 D4 F4
-    D minor seventh flat five 3rd inversion: C4 D4 F4 Ab4
-    Eb minor seventh flat five root: Eb4 Gb4 Bb4 Db5
-    Eb minor seventh flat five 1st inversion: Gb3 Bb3 Db4 Eb4
-    Eb minor seventh flat five 2nd inversion: Bb3 Db4 Eb4 Gb4
-    Eb minor seventh flat five 3rd inversion: Db4 Eb4 Gb4 Bb4
-    E minor seventh flat five root: E4 G4 Bb4 D5
-    E minor seventh flat five 1st inversion: G3 Bb3 D4 E4
-    E minor seventh flat five 2nd inversion: Bb3 D4 E4 G4
-    E minor seventh flat five 3rd inversion: D4 E4 G4 Bb4
-    F minor seventh flat five root: F4 Ab4 Cb5 Eb5
-    F minor seventh flat five 1st inversion: Ab3 Cb4 Eb4 F4
-    F minor seventh flat five 2nd inversion: Cb4 Eb4 F4 Ab4
-    F minor seventh flat five 3rd inversion: Eb4 F4 Ab4 Cb5
-    F# minor seventh flat five root: F#4 A4 C5 E5
-    F# minor seventh flat five 1st inversion: A3 C4 E4 F#4
-    F# minor seventh flat five 2nd inversion: C4 E4 F#4 A4
-    F# minor seventh flat five 3rd inversion: E4 F#4 A4 C5
-    G minor seventh flat five root: G4 Bb4 Db5 F5
-    G minor seventh flat five 1st inversion: Bb3 Db4 F4 G4
-    G minor seventh flat five 2nd inversion: Db4 F4 G4 Bb4
-    G minor seventh flat five 3rd inversion: F4 G4 Bb4 Db5
-    Ab minor seventh flat five root: Ab4 Cb5 Eb5 Gb5
-    Ab minor seventh flat five 1st inversion: Cb4 Eb4 Gb4 Ab4
-    Ab minor seventh flat five 2nd inversion: Eb4 Gb4 Ab4 Cb5
-    Ab minor seventh flat five 3rd inversion: Gb4 Ab4 Cb5 Eb5
-    A minor seventh flat five root: A4 C5 Eb5 G5
-    A minor seventh flat five 1st inversion: C4 Eb4 G4 A4
-    A minor seventh flat five 2nd inversion: Eb4 G4 A4 C5
-    A minor seventh flat five 3rd inversion: G4 A4 C5 Eb5
-    Bb minor seventh flat five root: Bb4 Db5 Fb5 Ab5
-    Bb minor seventh flat five 1st inversion: Db4 Fb4 Ab4 Bb4
-    Bb minor seventh flat five 2nd inversion: Fb4 Ab4 Bb4 Db5
-    Bb minor seventh flat five 3rd inversion: Ab4 Bb4 Db5 Fb5
-    B minor seventh flat five root: B4 D5 F5 A5
-    B minor seventh flat five 1st inversion: D4 F4 A4 B4
-    B minor seventh flat five 2nd inversion: F4 A4 B4 D5
-    B minor seventh flat five 3rd inversion: A4 B4 D5 F5
-    """
+import functools
+import os
+import threading
+from collections.abc import Mapping
+
+from Chords.generator import LEGACY_QUALITIES, ChordLibrary, voicings_text
+from Chords.names import parse_chord_name, quality_slug
+
+# A directory of "<group>.txt" voicing files (see export_voicings) whose voicings replace the generated ones.
+VOICINGS_DIR_ENV_VAR = "CHORD_TRAINER_VOICINGS_DIR"
+
 
 def parse_voicings(raw_text):
     voicings = {}
@@ -312,5 +21,171 @@ def parse_voicings(raw_text):
         voicings[name.strip()] = notes.strip().split()
     return voicings
 
-CHORD_VOICINGS = parse_voicings(RAW_VOICINGS)
+
+def index_voicings(raw_text):
+    """Like parse_voicings, but leaves each chord's notes as an unsplit string."""
+    index = {}
+    for line in raw_text.strip().splitlines():
+        name, sep, notes = line.partition(":")
+        if sep and name.strip():
+            index[name.strip()] = notes
+    return index
+
+
+def voicing_group(chord_name):
+    """Group (file stem) a chord's voicing lives in when the library is split by quality."""
+    return quality_slug(parse_chord_name(chord_name)[1])
+
+
+class VoicingStore(Mapping):
+    """Read-only {chord name: [notes]} mapping that parses on first access.
+
+    Source text is only split into lines when a group is first touched, and a
+    chord's notes are only split when that chord is looked up. A store built
+    with from_directory() reads one "<group>.txt" file per quality, so looking
+    up a major chord never opens the seventh-chord files.
+    """
+
+    def __init__(self, loaders, group_of=None):
+        self._loaders = dict(loaders)  # group -> callable returning raw text, until loaded
+        self.groups = tuple(self._loaders)
+        self._group_of = group_of
+        self._pending = {}  # name -> unsplit notes
+        self._parsed = {}
+        self._order = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_text(cls, raw_text):
+        return cls({"": lambda: raw_text})
+
+    @classmethod
+    def from_directory(cls, directory):
+        loaders = {}
+        for filename in sorted(os.listdir(directory)):
+            group, ext = os.path.splitext(filename)
+            if ext == ".txt":
+                loaders[group] = functools.partial(_read_text, os.path.join(directory, filename))
+        return cls(loaders, group_of=voicing_group)
+
+    def _load_group(self, group):
+        with self._lock:
+            loader = self._loaders.pop(group, None)
+            if loader is None:
+                return
+            for name, notes in index_voicings(loader()).items():
+                if name not in self._pending and name not in self._parsed:
+                    self._order.append(name)
+                self._pending[name] = notes
+
+    def _load_for(self, name):
+        if self._group_of is None:
+            self._load_group("")
+            return
+        try:
+            group = self._group_of(name)
+        except (ValueError, IndexError):
+            return
+        self._load_group(group)
+
+    def _load_all(self):
+        for group in list(self._loaders):
+            self._load_group(group)
+
+    def __getitem__(self, name):
+        notes = self._parsed.get(name)
+        if notes is not None:
+            return notes
+        if name not in self._pending:
+            self._load_for(name)
+        raw = self._pending.get(name)
+        if raw is None:
+            raise KeyError(name)
+        notes = raw.split()
+        self._parsed[name] = notes
+        return notes
+
+    def __contains__(self, name):
+        if name in self._parsed or name in self._pending:
+            return True
+        self._load_for(name)
+        return name in self._pending
+
+    def __iter__(self):
+        self._load_all()
+        return iter(list(self._order))
+
+    def __len__(self):
+        self._load_all()
+        return len(self._order)
+
+    def loaded_groups(self):
+        return [group for group in self.groups if group not in self._loaders]
+
+
+def _read_text(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def export_voicings(voicings, directory):
+    """Write a {name: notes} mapping as one '<group>.txt' file per quality, for from_directory()."""
+    groups = {}
+    for name, notes in voicings.items():
+        groups.setdefault(voicing_group(name), []).append(f"{name}: {' '.join(notes)}")
+    os.makedirs(directory, exist_ok=True)
+    for group, lines in groups.items():
+        with open(os.path.join(directory, f"{group}.txt"), "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+    return sorted(groups)
+
+
+class LayeredVoicings(Mapping):
+    """Read-only {chord name: notes} over base, with overrides replacing the voicings they list.
+
+    The chords are base's: overrides for names outside it are ignored, since
+    there is no chord for them to voice. Looking a chord up only loads the
+    override group it would be in.
+    """
+
+    def __init__(self, base, overrides):
+        self.base = base
+        self.overrides = overrides
+
+    def __getitem__(self, name):
+        if name in self.base and name in self.overrides:
+            return self.overrides[name]
+        return self.base[name]
+
+    def __contains__(self, name):
+        return name in self.base
+
+    def __iter__(self):
+        return iter(self.base)
+
+    def __len__(self):
+        return len(self.base)
+
+
+def load_chord_voicings(directory=None):
+    """Generated close voicings for every chord in CHORDS, overridden by a directory of voicing files if given."""
+    generated = ChordLibrary(LEGACY_QUALITIES, voiced=True)
+    if not directory:
+        return generated
+    return LayeredVoicings(generated, VoicingStore.from_directory(directory))
+
+
+CHORD_VOICINGS = load_chord_voicings(os.environ.get(VOICINGS_DIR_ENV_VAR))
+
+
+@functools.lru_cache(maxsize=None)
+def _raw_voicings():
+    return voicings_text(CHORD_VOICINGS)
+
+
+def __getattr__(name):
+    # RAW_VOICINGS, the text form of CHORD_VOICINGS, is only built if something still asks for it.
+    if name == "RAW_VOICINGS":
+        return _raw_voicings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
@@ -1,33 +1,149 @@
+# --- Opt-in startup profiling (CHORD_TRAINER_PROFILE_STARTUP=path.jsonl) ---
+from Chords.profiling import STARTUP_PROFILER
+STARTUP_PROFILER.begin_run()
+
+import os
+import time
+import uuid
 import streamlit as st
-import random
-from collections import defaultdict
-from PIL import Image, ImageDraw
+
+# Only modules that do not load the chord data, so "chord parse" below times the parsing alone.
+from Chords.audio import AUDIO_CACHE
+from Chords.diagram_cache import DIAGRAM_CACHE
+from Chords.encoding import check_format
+from Chords.atlas import DEFAULT_AUDIO_BANK, DEFAULT_DIAGRAM_ATLAS, audio_asset_key, diagram_asset_key
+from Chords.keyboard import (AUTO_RANGE, KEYBOARD_RANGE_ENV_VAR, group_by_range, parse_keyboard_range, resolve_range,
+                             shared_range)
+from Chords.metrics import METRICS
+from Chords.progress import DEFAULT_PROGRESS_DB, PROGRESS_ENV_VAR, ProgressStore
+from Chords.sessions import QuizSession, SessionManager
+STARTUP_PROFILER.mark("imports")
 
 # --- Import chord data from external files ---
-from Chords.chords import CHORDS
-from Chords.voicings import CHORD_VOICINGS
-
-# --- Function to reset session state ---
-def reset_session_state_for_mode(mode_to_keep):
-    """Reset session state keys for the mode not currently selected."""
-    # Keys for identify the position
-    identify_keys = ["current_chord", "attempts", "show_result", "last_attempt"]
-    # Keys for playing the position
-    play_keys = ["play_current_chord", "play_feedback", "play_clicked_option", "play_options"]
-
-    if mode_to_keep == "identify the position":
-        for key in play_keys:
-            if key in st.session_state:
-                del st.session_state[key]
-    elif mode_to_keep == "Playing the Position":
-        for key in identify_keys:
-            if key in st.session_state:
-                del st.session_state[key]
+from Chords.model import VOICED_CHORDS
+STARTUP_PROFILER.mark("chord parse")
+
+# Modules built on the chord data; importing them is cheap once it is parsed.
+from Chords.analytics import ANALYTICS_ENV_VAR, DEFAULT_ANALYTICS_SUMMARY, AnswerStats
+from Chords.build_assets import load_current_atlas
+from Chords.catalogue import DEFAULT_BASES, get_catalogue
+from Chords.midi_input import BackgroundListener, MidoSource, list_input_ports
+from Chords.quiz import EAR_MODE, IDENTIFY_MODE, PLAY_MODE, EarQuiz, IdentifyQuiz, PlayQuiz
+from Chords.scheduler import LeitnerScheduler, dump_schedules, load_schedules
+from Chords.views import identify_grid
+
+catalogue = get_catalogue()
+STARTUP_PROFILER.mark("grouping")
+
+# --- Diagrams are served as pre-encoded bytes: "png", "webp" or "svg" ---
+DIAGRAM_FORMAT = check_format(os.environ.get("CHORD_TRAINER_DIAGRAM_FORMAT", "png"))
+DIAGRAM_THEME = os.environ.get("CHORD_TRAINER_THEME", "light")
+# "auto" (a diagram spans its voicing's octaves; a question's options, all of theirs) or a fixed range like "C3-C6".
+KEYBOARD_RANGE = parse_keyboard_range(os.environ.get(KEYBOARD_RANGE_ENV_VAR, AUTO_RANGE))
+
+
+# --- Pre-built diagram atlas (python -m Chords.build_assets), memory-mapped once per process ---
+@st.cache_resource
+def open_diagram_atlas():
+    return load_current_atlas(os.environ.get("CHORD_TRAINER_ATLAS", DEFAULT_DIAGRAM_ATLAS))
+
+
+DIAGRAM_ATLAS = open_diagram_atlas()
+
+
+def diagram_bytes(chord_name, key_range=None):
+    """Encoded diagram for a chord: a slice of the atlas if built, else from the render cache.
+
+    key_range is the (low_note, high_note) to draw on; by default, the chord's own range.
+    """
+    midi = VOICED_CHORDS[chord_name].midi
+    low_note, high_note = key_range or resolve_range(midi, KEYBOARD_RANGE)
+    if DIAGRAM_ATLAS is not None:
+        key = diagram_asset_key(chord_name, low_note, high_note, DIAGRAM_THEME, DIAGRAM_FORMAT)
+        data = DIAGRAM_ATLAS.get(key)
+        if data is not None:
+            return bytes(data)  # st.image takes bytes, not memoryview
+    return DIAGRAM_CACHE.get_encoded(midi, DIAGRAM_FORMAT, low_note, high_note, theme=DIAGRAM_THEME)
+
+
+# --- Pre-built audio bank (python -m Chords.build_assets --audio), memory-mapped once per process ---
+@st.cache_resource
+def open_audio_bank():
+    return load_current_atlas(os.environ.get("CHORD_TRAINER_AUDIO_BANK", DEFAULT_AUDIO_BANK))
+
+
+AUDIO_BANK = open_audio_bank()
+
+
+def audio_bytes(chord_name):
+    """WAV clip for a chord: a slice of the audio bank if built, else from the synthesis cache."""
+    if AUDIO_BANK is not None:
+        data = AUDIO_BANK.get(audio_asset_key(chord_name))
+        if data is not None:
+            return bytes(data)  # st.audio takes bytes, not memoryview
+    return AUDIO_CACHE.get(VOICED_CHORDS[chord_name].midi)
+
+
+# --- Optionally pre-render every diagram and audio clip once per process ---
+@st.cache_resource
+def warm_diagram_cache():
+    voicings = {name: chord.midi for name, chord in VOICED_CHORDS.items()}
+    for (low_note, high_note), group in group_by_range(voicings, KEYBOARD_RANGE).items():
+        DIAGRAM_CACHE.warm_up(group, low_note, high_note, fmt=DIAGRAM_FORMAT, theme=DIAGRAM_THEME)
+    if AUDIO_BANK is None:
+        AUDIO_CACHE.warm_up(voicings)
+    return True
+
 
+if os.environ.get("CHORD_TRAINER_WARM_CACHE") == "1":
+    warm_diagram_cache()
+STARTUP_PROFILER.mark("diagram assets")
+
+# --- Quiz state lives server-side in a SessionManager; st.session_state only holds the session id ---
+MODES = (IDENTIFY_MODE, PLAY_MODE, EAR_MODE)
+
+
+@st.cache_resource
+def open_session_manager():
+    return SessionManager()
+
+
+def quiz_session():
+    """This browser session's QuizSession; a new one (with fresh schedules) if it was idle long enough to expire."""
+    sessions = open_session_manager()
+    session = sessions.get(st.session_state.get("quiz_session"))
+    if session is None:
+        session = QuizSession(schedulers={m: LeitnerScheduler() for m in MODES})
+        st.session_state.quiz_session = sessions.create(session)
+    return session
+
+
+session = quiz_session()
+
+
+# --- Metrics: off unless CHORD_TRAINER_METRICS, _PORT or _FILE is set (see Chords/metrics.py) ---
+VIEW_SECONDS = METRICS.histogram("chord_trainer_view_seconds", "Seconds to build part of the page.", ("view",))
+ANSWER_SECONDS = METRICS.histogram("chord_trainer_answer_seconds", "Seconds to handle an answer click.", ("mode",))
+
+
+@st.cache_resource
+def start_metrics():
+    METRICS.stats_gauges("chord_trainer_cache", "Asset cache statistics", "cache",
+                         {"diagram": DIAGRAM_CACHE.stats, "audio": AUDIO_CACHE.stats})
+    METRICS.stats_gauges("chord_trainer_session_store", "Quiz session statistics", "store",
+                         {"app": open_session_manager().stats})
+    METRICS.start_exporters()
+
+
+if METRICS.enabled:
+    start_metrics()
 
 # --- MODE SELECTION (top of page) ---
-mode = st.sidebar.selectbox("Select Mode", ["identify the position", "Playing the Position"])
-reset_session_state_for_mode(mode)
+mode = st.sidebar.selectbox("Select Mode", MODES)
+if session.mode != mode:
+    # Only the quiz for the mode in use is kept.
+    session.mode = mode
+    session.quiz = None
 
 # --- MOBILE-FRIENDLY BUTTONS CSS ---
 st.markdown("""
@@ -42,251 +158,276 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# --- Group chords by base name ---
-grouped_chords = defaultdict(list)
-for chord_name in CHORDS.keys():
-    words = chord_name.split()
-    if "major" in words or "minor" in words or "diminished" in words:
-        if "seventh" in chord_name or "flat five" in chord_name or "dominant" in chord_name:
-            base = " ".join(words[:3])
-        else:
-            base = " ".join(words[:2])
-    else:
-        base = " ".join(words[:2])
-    grouped_chords[base].append(chord_name)
-
 # --- Sidebar selection ---
 st.sidebar.title("Select Chords for Quiz")
 selected_base_chords = []
 
-categories = {"Major": [], "Minor": [], "Diminished": [], "Sevenths & Extensions": []}
-
-for base in grouped_chords.keys():
-    if "major" in base and "seventh" not in base:
-        categories["Major"].append(base)
-    elif "minor" in base and "seventh" not in base:
-        categories["Minor"].append(base)
-    elif "diminished" in base:
-        categories["Diminished"].append(base)
-    else:
-        categories["Sevenths & Extensions"].append(base)
-
-for cat in categories:
-    categories[cat].sort()
-
-for cat, bases in categories.items():
+for cat, bases in catalogue.categories.items():
     with st.sidebar.expander(cat, expanded=True):
         for base in bases:
-            if st.checkbox(base, value=base in ["C major", "A minor", "E minor", "G major"]):
+            if st.checkbox(base, value=base in DEFAULT_BASES):
                 selected_base_chords.append(base)
 
 if not selected_base_chords:
     st.warning("Please select at least one chord.")
     st.stop()
 
-# --- Build selected chords dict ---
-selected_chords_dict = {base: grouped_chords[base] for base in selected_base_chords}
-all_selected_chords = [ch for sublist in selected_chords_dict.values() for ch in sublist]
+# --- Build selected chords list ---
+all_selected_chords = catalogue.selected_chords(selected_base_chords)
+
+# --- Spaced repetition: one schedule per mode, kept for the whole browser session ---
+use_schedule = st.sidebar.toggle("Spaced repetition", value=False,
+                                 help="Ask chords you get wrong more often, and ones you know less often.")
+if use_schedule:
+    with st.sidebar.expander("Practice schedule"):
+        saved = dump_schedules(session.schedulers)
+        st.download_button("Save progress", saved, file_name="chord-trainer-progress.json", mime="application/json")
+        upload = st.file_uploader("Load progress", type="json")
+        if upload is not None and st.session_state.get("loaded_schedule") != upload.file_id:
+            try:
+                session.schedulers = load_schedules(upload.getvalue(), MODES)
+            except ValueError as e:
+                st.error(f"Could not load progress: {e}")  # the current schedules are kept
+            else:
+                session.quiz = None
+                st.session_state.loaded_schedule = upload.file_id
+
+
+def quiz_scheduler(mode_name):
+    return session.schedulers[mode_name] if use_schedule else None
+
+
+# --- Progress log: every answer goes to SQLite in the background (CHORD_TRAINER_PROGRESS_DB="" turns it off) ---
+@st.cache_resource
+def open_progress_store():
+    path = os.environ.get(PROGRESS_ENV_VAR, DEFAULT_PROGRESS_DB)
+    return ProgressStore(path) if path else None
+
+
+progress = open_progress_store()
+if "progress_session" not in st.session_state:
+    st.session_state.progress_session = uuid.uuid4().hex
+recorder = progress.recorder(st.session_state.progress_session) if progress is not None else None
+
+if progress is not None:
+    with st.sidebar.expander("Your accuracy"):
+        accuracy = progress.chord_accuracy(session=st.session_state.progress_session, mode=mode)
+        if accuracy:
+            st.dataframe(
+                [{"Chord": chord, "Correct": f"{correct}/{n}", "Avg. time (s)": round(seconds, 1)}
+                 for chord, (n, correct, seconds) in sorted(accuracy.items(), key=lambda kv: kv[1][1] / kv[1][0])],
+                hide_index=True,
+            )
+        else:
+            st.caption("Answer a few questions to see your accuracy per chord.")
+
+
+# --- Dashboard from the precomputed analytics summary (python -m Chords.analytics) ---
+@st.cache_resource
+def load_answer_stats(path, mtime):
+    return AnswerStats.load(path)
+
+
+analytics_path = os.environ.get(ANALYTICS_ENV_VAR, DEFAULT_ANALYTICS_SUMMARY)
+try:
+    answer_stats = load_answer_stats(analytics_path, os.path.getmtime(analytics_path))
+except FileNotFoundError:
+    answer_stats = None
+except ValueError:
+    answer_stats = None
+    st.sidebar.warning("The analytics summary is stale; rebuild it with `python -m Chords.analytics`.")
+if answer_stats is not None:
+    with st.sidebar.expander("Common mix-ups"):
+        for chord, answer, count in answer_stats.top_confusions(5, among=all_selected_chords):
+            st.write(f"{chord} → {answer} ({count}×)")
+        by_inversion = answer_stats.by_attribute("inversion")
+        if by_inversion:
+            st.dataframe(
+                [{"Inversion": inversion or "root", "Accuracy": f"{correct / n:.0%}", "Avg. time (s)": round(seconds, 1)}
+                 for inversion, (n, correct, seconds) in sorted(by_inversion.items())],
+                hide_index=True,
+            )
+
+
+STARTUP_PROFILER.mark("sidebar build")
+
+# --- MIDI keyboard input: one listener per port for the process (needs mido) ---
+# Seconds between re-reads of the port names, so a keyboard plugged in later still shows up.
+MIDI_PORTS_TTL = 5
+
+
+@st.cache_resource(ttl=MIDI_PORTS_TTL)
+def midi_input_ports():
+    return list_input_ports()
+
+
+@st.cache_resource
+def open_midi_listener(port):
+    return BackgroundListener(MidoSource(port))
+
+
+def midi_answer(matches, pool, expected):
+    """The recognized chord to submit: the expected one if it matches, else one in the quiz pool."""
+    names = [m.name for m in matches]
+    if expected in names:
+        return expected
+    return next((name for name in names if name in pool), names[0] if names else None)
+
 
 # ---------------------------
 # IDENTIFY THE POSITION MODE
 # ---------------------------
-if mode == "identify the position":
-    # --- Initialize session state ---
-    if "current_chord" not in st.session_state or st.session_state.current_chord not in all_selected_chords:
-        st.session_state.current_chord = random.choice(all_selected_chords)
-    if "attempts" not in st.session_state:
-        st.session_state.attempts = {}
-    if "show_result" not in st.session_state:
-        st.session_state.show_result = False
-    if "last_attempt" not in st.session_state:
-        st.session_state.last_attempt = None
-
-    # --- Next chord ---
-    if st.button("Next Chord", key="next_chord_position"):
-        remaining_chords = [ch for ch in all_selected_chords if ch != st.session_state.current_chord]
-        if remaining_chords:
-            st.session_state.current_chord = random.choice(remaining_chords)
-        st.session_state.attempts[st.session_state.current_chord] = []
-        st.session_state.show_result = False
-        st.session_state.last_attempt = None
-
-    chord_key = st.session_state.current_chord
-    st.write(f"### Notes: {', '.join(CHORDS[chord_key])}")
-
-    # --- Handle button clicks ---
-    def handle_option(option):
-        clicked = st.button(option, key=f"{chord_key}_{option}")
-        if clicked:
-            if chord_key not in st.session_state.attempts:
-                st.session_state.attempts[chord_key] = []
-            if option not in st.session_state.attempts[chord_key]:
-                st.session_state.attempts[chord_key].append(option)
-            st.session_state.show_result = True
-            st.session_state.last_attempt = option
-        return clicked
-
-    # --- Display columns of options with feedback ---
-    sorted_bases = sorted(selected_base_chords)
-    cols = st.columns(len(sorted_bases))
-
-    for col_idx, base in enumerate(sorted_bases):
-        with cols[col_idx]:
-            st.write(f"**{base}**")
-            options = selected_chords_dict[base]
-
-            # Root chord first
-            root_options = [opt for opt in options if "root" in opt.lower()]
-            other_options = [opt for opt in options if "root" not in opt.lower()]
-            options_sorted = root_options + sorted(other_options)
-
-            for option in options_sorted:
-                handle_option(option)
-
-                # Feedback coloring for attempted options
-                attempts = st.session_state.attempts.get(chord_key, [])
-                if option in attempts:
-                    if option == chord_key:
-                        st.success(f"{option} ✅")
-                    else:
-                        st.error(f"{option} ❌")
+view_started = time.perf_counter()
+if mode == IDENTIFY_MODE:
+    midi_ports = midi_input_ports()
+    midi_port = None
+    if midi_ports and st.sidebar.toggle("Answer on a MIDI keyboard", value=False):
+        midi_port = st.sidebar.selectbox("MIDI input", midi_ports)
+
+    # --- Quiz state lives in a headless engine; this block is only the view ---
+    scheduler = quiz_scheduler(IDENTIFY_MODE)
+    if session.quiz is None or session.quiz.scheduler is not scheduler:
+        session.quiz = IdentifyQuiz(all_selected_chords, scheduler=scheduler, recorder=recorder)
+    quiz = session.quiz
+    quiz.set_pool(all_selected_chords)
+
+    # --- Answer by playing: a chord counts once its first key is released ---
+    if midi_port is not None:
+        midi_listener = open_midi_listener(midi_port)
+
+        @st.fragment(run_every=0.25)
+        def poll_midi():
+            played = midi_listener.take()
+            if played is not None:
+                matches, notes = played
+                answer = midi_answer(matches, all_selected_chords, quiz.current)
+                if answer is None:
+                    st.session_state.midi_unrecognized = notes
+                else:
+                    quiz.submit_answer(answer)
+                st.rerun()
 
-    # --- Display bottom feedback ---
-    attempts = st.session_state.attempts.get(chord_key, [])
-    if attempts and st.session_state.last_attempt:
-        if st.session_state.last_attempt == chord_key:
-            st.success(f"✅ Correct! It was {chord_key}")
-        else:
-            st.error(f"❌ Incorrect. Try again!")
+        poll_midi()
+
+    # --- Question, answer grid and feedback ---
+    # A fragment, so a click reruns only this block, not the sidebar (see Chords/views.py).
+    submit_answer = METRICS.timed(ANSWER_SECONDS, IDENTIFY_MODE)(quiz.submit_answer)
+
+    @st.fragment
+    @METRICS.timed(VIEW_SECONDS, "identify grid")
+    def identify_view(sorted_bases):
+        identify_grid(quiz, sorted_bases, catalogue.options, submit_answer)
+
+    identify_view(sorted(selected_base_chords))
 
 # ---------------------------
 # PLAYING THE POSITION MODE
 # ---------------------------
-elif mode == "Playing the Position":
-    import io
-    import random
-    from PIL import Image, ImageDraw
-
-    # --- Generate keyboard images ---
-    def generate_keyboard_image(highlight_notes, low_note="C3", high_note="C6"):
-        import re
-
-        key_order = ["C","C#","D","D#","E","F","F#","G","G#","A","A#","B"]
-        naturals_to_index = {"C":0,"D":2,"E":4,"F":5,"G":7,"A":9,"B":11}
-
-        def to_sharp(note_with_octave: str) -> str:
-            m = re.match(r"^([A-Ga-g])([#b]?)(\d)$", note_with_octave.strip())
-            if not m:
-                return note_with_octave.strip()
-            letter = m.group(1).upper()
-            accidental = m.group(2)
-            octave = int(m.group(3))
-            semitone = naturals_to_index[letter]
-            if accidental == "#":
-                semitone += 1
-            elif accidental == "b":
-                semitone -= 1
-            if semitone >= 12:
-                semitone -= 12
-                octave += 1
-            elif semitone < 0:
-                semitone += 12
-                octave -= 1
-            return f"{key_order[semitone]}{octave}"
-
-        highlight_sharp = {to_sharp(n) for n in highlight_notes}
-
-        def split_note(n):
-            return n[:-1], int(n[-1])
-        low_pc, low_oct = split_note(low_note)
-        high_pc, high_oct = split_note(high_note)
-
-        keyboard_notes = []
-        for octave in range(low_oct, high_oct + 1):
-            for pc in key_order:
-                full = f"{pc}{octave}"
-                keyboard_notes.append(full)
-                if full == high_note:
-                    break
-            if keyboard_notes[-1] == high_note:
-                break
-
-        img_width, img_height = 700, 150
-        white_key_height = img_height
-        black_key_height = int(img_height * 0.6)
-        white_keys = [n for n in keyboard_notes if "#" not in n]
-        white_key_width = img_width / len(white_keys)
-
-        img = Image.new("RGB", (img_width, img_height), "white")
-        draw = ImageDraw.Draw(img)
-        white_key_positions = {}
-        x = 0
-        for note in keyboard_notes:
-            if "#" not in note:
-                fill = "yellow" if note in highlight_sharp else "white"
-                draw.rectangle([x, 0, x + white_key_width, white_key_height], fill=fill, outline="black")
-                white_key_positions[note] = x
-                x += white_key_width
-        for idx, note in enumerate(keyboard_notes):
-            if "#" in note:
-                left_idx = idx - 1
-                if keyboard_notes[left_idx] in white_key_positions:
-                    x0 = white_key_positions[keyboard_notes[left_idx]] + white_key_width * 0.65
-                    x1 = x0 + white_key_width * 0.7
-                    fill = "yellow" if note in highlight_sharp else "black"
-                    draw.rectangle([x0, 0, x1, black_key_height], fill=fill, outline="black")
-        return img
-
+elif mode == PLAY_MODE:
     # --- Clickable image with "Select" button ---
+    @METRICS.timed(VIEW_SECONDS, "clickable_image")
     def clickable_image(img, key):
+        if DIAGRAM_FORMAT == "svg":
+            img = img.decode("utf-8")  # st.image takes SVG as markup, not bytes
         st.image(img, use_container_width=True)  # updated parameter
         return st.button("Select", key=key)
 
-    available_chords = [ch for ch in all_selected_chords if ch in CHORD_VOICINGS]
+    available_chords = [ch for ch in all_selected_chords if ch in VOICED_CHORDS]
     if not available_chords:
-        st.warning("None of your selected chords have voicings in the database. Paste your lines into RAW_VOICINGS using the exact chord names.")
+        st.warning("None of your selected chords have voicings. Add their quality's formula to Chords/generator.py.")
         st.stop()
 
-    # --- Initialize session state ---
-    if "play_current_chord" not in st.session_state:
-        st.session_state.play_current_chord = random.choice(available_chords)
-        st.session_state.play_feedback = ""
-        st.session_state.play_clicked_option = None
-    if "play_options" not in st.session_state:
-        st.session_state.play_options = None
+    # --- Distractors: random, or picked by musical similarity to the answer ---
+    difficulty = st.sidebar.select_slider("Distractor difficulty", ["random", "easy", "medium", "hard"],
+                                          value="random")
+    similarity = None
+    if difficulty != "random":
+        from Chords.similarity import get_similarity_index  # its ranking is built on first use only
+        similarity = get_similarity_index()
+
+    # --- Quiz state lives in a headless engine; this block is only the view ---
+    scheduler = quiz_scheduler(PLAY_MODE)
+    quiz = session.quiz
+    if quiz is None or quiz.scheduler is not scheduler or quiz.similarity is not similarity:
+        session.quiz = PlayQuiz(available_chords, scheduler=scheduler, similarity=similarity,
+                                difficulty=difficulty, recorder=recorder)
+    elif quiz.difficulty != difficulty:
+        quiz.difficulty = difficulty  # takes effect from the next question
+    quiz = session.quiz
+    quiz.set_pool(available_chords)
 
     if st.button("Next Chord", key="next_chord_play"):
-        pool = [ch for ch in available_chords if ch != st.session_state.play_current_chord] or available_chords
-        st.session_state.play_current_chord = random.choice(pool)
-        st.session_state.play_feedback = ""
-        st.session_state.play_clicked_option = None
-        st.session_state.play_options = None
+        quiz.next_question()
 
-    current_chord = st.session_state.play_current_chord
+    current_chord = quiz.current
     st.write(f"### Which diagram shows: {current_chord}?")
 
-    if st.session_state.play_options is None:
-        correct_notes = CHORD_VOICINGS[current_chord]
-        correct_img = generate_keyboard_image(correct_notes)
-        other_chords = [ch for ch in available_chords if ch != current_chord]
-        wrong_chords = random.sample(other_chords, min(3, len(other_chords)))
-        wrong_imgs = [generate_keyboard_image(CHORD_VOICINGS[ch]) for ch in wrong_chords]
-        options = [(current_chord, correct_img)] + list(zip(wrong_chords, wrong_imgs))
-        random.shuffle(options)
-        st.session_state.play_options = options
-
-    # --- Display images with "Select" buttons ---
-    cols = st.columns(len(st.session_state.play_options))
-    for idx, (chord_name, img) in enumerate(st.session_state.play_options):
+    # --- Display images with "Select" buttons; options are chord names, diagrams come from the shared cache ---
+    # All options share one range, so their width and key size give nothing away.
+    options = quiz.options
+    question_range = shared_range([VOICED_CHORDS[name].midi for name in options], KEYBOARD_RANGE)
+    cols = st.columns(len(options))
+    for idx, chord_name in enumerate(options):
         with cols[idx]:
+            img = diagram_bytes(chord_name, question_range)
             if clickable_image(img, key=f"play_{chord_name}"):
-                st.session_state.play_clicked_option = chord_name
-                if chord_name == current_chord:
-                    st.session_state.play_feedback = f"✅ Correct! It was {current_chord}"
-                else:
-                    st.session_state.play_feedback = f"❌ Incorrect, that was {chord_name}. Try again!"
+                with ANSWER_SECONDS.time(PLAY_MODE):
+                    quiz.submit_answer(chord_name)
 
     # --- Show feedback ---
-    if st.session_state.play_feedback:
-        st.info(st.session_state.play_feedback)
+    if quiz.clicked is not None:
+        if quiz.clicked == current_chord:
+            st.info(f"✅ Correct! It was {current_chord}")
+        else:
+            st.info(f"❌ Incorrect, that was {quiz.clicked}. Try again!")
+        # --- Hear the voicing that was picked ---
+        st.audio(audio_bytes(quiz.clicked), format="audio/wav")
+
+# ---------------------------
+# EAR TRAINING MODE
+# ---------------------------
+elif mode == EAR_MODE:
+    available_chords = [ch for ch in all_selected_chords if ch in VOICED_CHORDS]
+    if not available_chords:
+        st.warning("None of your selected chords have voicings. Add their quality's formula to Chords/generator.py.")
+        st.stop()
+
+    # --- Quiz state lives in a headless engine; this block is only the view ---
+    scheduler = quiz_scheduler(EAR_MODE)
+    if session.quiz is None or session.quiz.scheduler is not scheduler:
+        session.quiz = EarQuiz(available_chords, scheduler=scheduler, recorder=recorder)
+    quiz = session.quiz
+    quiz.set_pool(available_chords)
+
+    if st.button("Next Chord", key="next_chord_ear"):
+        quiz.next_question()
+
+    chord_key = quiz.current
+    st.write("### Listen, then name the quality and inversion")
+    st.audio(audio_bytes(chord_key), format="audio/wav")
+
+    # --- One column per quality, one button per inversion ---
+    qualities = list(quiz.labels)
+    cols = st.columns(len(qualities))
+    for col_idx, quality in enumerate(qualities):
+        with cols[col_idx]:
+            st.write(f"**{quality}**")
+            for label in quiz.labels[quality]:
+                if st.button(label, key=f"ear_{chord_key}_{label}"):
+                    with ANSWER_SECONDS.time(EAR_MODE):
+                        quiz.submit_answer(label)
+                if quiz.answer_for(label) in quiz.current_attempts():
+                    if quiz.answer_for(label) == chord_key:
+                        st.success(f"{label} ✅")
+                    else:
+                        st.error(f"{label} ❌")
+
+    # --- Display bottom feedback ---
+    if quiz.last_attempt:
+        if quiz.last_attempt == chord_key:
+            st.success(f"✅ Correct! It was {chord_key}")
+        else:
+            st.error("❌ Incorrect. Try again!")
 
+VIEW_SECONDS.observe(time.perf_counter() - view_started, mode)
+STARTUP_PROFILER.mark("first render", final=True)
@@ -0,0 +1,21 @@
+import time
+
+
+def timed(fn):
+    """(seconds, result) of one call to fn."""
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def best_of(fn, repeat):
+    """Fastest of repeat calls to fn, in seconds."""
+    return min(timed(fn)[0] for _ in range(repeat))
+
+
+def per_call(fn, calls):
+    """Mean seconds per call over calls back-to-back calls to fn."""
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls
@@ -0,0 +1,56 @@
+"""Synthesis time per chord and memory footprint of the audio clip cache.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_audio --repeat 20
+"""
+import argparse
+import time
+
+from Chords.audio import AudioCache, encode_wav, note_samples, render_voicing_wav, synthesize
+from Chords.model import VOICED_CHORDS
+
+
+def per_chord(fn, voicings, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for midi in voicings:
+            fn(midi)
+    return (time.perf_counter() - start) / (repeat * len(voicings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    voicings = [chord.midi for chord in VOICED_CHORDS.values()]
+    note_samples.cache_clear()
+    cold = per_chord(synthesize, voicings, 1)
+    notes = note_samples.cache_info().currsize
+    warm = per_chord(synthesize, voicings, args.repeat)
+    samples = synthesize(voicings[0])
+    start = time.perf_counter()
+    for _ in range(args.repeat * 10):
+        encode_wav(samples)
+    encode = (time.perf_counter() - start) / (args.repeat * 10)
+    print(f"synthesize, cold note tables  {cold * 1e3:8.3f} ms/chord ({notes} distinct notes)")
+    print(f"synthesize, warm note tables  {warm * 1e3:8.3f} ms/chord")
+    print(f"encode_wav                    {encode * 1e3:8.3f} ms/chord")
+
+    cache = AudioCache(render=render_voicing_wav)
+    start = time.perf_counter()
+    cache.warm_up(dict(enumerate(voicings)))
+    precompute = time.perf_counter() - start
+    hit = per_chord(cache.get, voicings, args.repeat)
+    stats = cache.stats()
+    print(f"precompute whole library      {precompute * 1e3:8.1f} ms for {stats['entries']} clips")
+    print(f"cache hit                     {hit * 1e6:8.2f} us/chord")
+    print(f"cache footprint               {stats['bytes'] / 2 ** 20:8.2f} MiB "
+          f"({stats['bytes'] / stats['entries'] / 1024:.1f} KiB/clip)")
+    note_bytes = sum(note_samples(m).nbytes for m in {m for midi in voicings for m in midi})
+    print(f"note tables                   {note_bytes / 2 ** 20:8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Bytes per diagram and encode time for each served format.
+
+"raw" is the old path: an RGB PIL image handed to st.image, which Streamlit
+re-encodes as PNG on every rerun. Run from the repository root:
+
+    python -m benchmarks.bench_encoding
+"""
+import argparse
+import io
+
+from benchmarks._timing import best_of
+from Chords.encoding import encode_png, encode_webp, render_svg
+from Chords.keyboard import generate_keyboard_image
+from Chords.model import VOICED_CHORDS
+from Chords.renderer import RENDERER
+
+
+def encode_raw_png(midi):
+    buf = io.BytesIO()
+    RENDERER.render(midi).convert("RGB").save(buf, format="PNG")
+    return buf.getvalue()
+
+
+FORMATS = {
+    "raw rgb png": encode_raw_png,
+    "palette png": lambda midi: encode_png(RENDERER.render(midi)),
+    "webp": lambda midi: encode_webp(RENDERER.render(midi)),
+    "svg": render_svg,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    voicings = [chord.midi for chord in VOICED_CHORDS.values()]
+    RENDERER.layer()
+    generate_keyboard_image([])
+    n = len(voicings)
+
+    print(f"{n} voicings, best of {args.repeat}")
+    for label, encode in FORMATS.items():
+        best = best_of(lambda: [encode(midi) for midi in voicings], args.repeat)
+        encoded = [encode(midi) for midi in voicings]
+        sizes = sorted(len(data) for data in encoded)
+        stable = all(encode(midi) == data for midi, data in zip(voicings[:20], encoded))
+        print(f"  {label:<12} {sum(sizes) / n:8.0f} B/diagram (max {sizes[-1]:5d})"
+              f"  {best / n * 1e6:8.1f} us/encode  stable={stable}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Cost of generating the chord library from interval formulas: enumeration, first spelling and memoized lookups.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_generator --repeat 20
+"""
+import argparse
+import time
+
+from Chords.generator import LEGACY_QUALITIES, ChordLibrary, chord_notes, chord_tones, chord_voicing
+
+
+def clear_memos():
+    for fn in (chord_tones, chord_voicing, chord_notes):
+        fn.cache_clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    for label, qualities in (("legacy (CHORDS)", LEGACY_QUALITIES), ("full library", None)):
+        library = ChordLibrary(qualities) if qualities else ChordLibrary()
+        voiced = ChordLibrary(library.qualities, voiced=True)
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            names = list(library)
+        enumerate_ms = (time.perf_counter() - start) / args.repeat * 1e3
+
+        cold = 0.0
+        for _ in range(args.repeat):
+            clear_memos()
+            library._values.clear()
+            voiced._values.clear()
+            start = time.perf_counter()
+            for name in names:
+                voiced[name]
+                library[name]
+            cold += time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for name in names:
+                voiced[name]
+        warm = (time.perf_counter() - start) / (args.repeat * len(names))
+
+        print(f"{label}: {len(names)} chords")
+        print(f"  enumerate names            {enumerate_ms:8.2f} ms")
+        print(f"  spell notes + voicings     {cold / args.repeat * 1e3:8.2f} ms (cold memos)")
+        print(f"  memoized lookup            {warm * 1e6:8.2f} us/chord")
+
+
+if __name__ == "__main__":
+    main()
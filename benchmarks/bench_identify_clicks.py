@@ -0,0 +1,78 @@
+"""Server time per answer click in Identify the Position mode, with every chord group selected.
+
+"full rerun" clicks an option in app.py through Streamlit's AppTest, which
+always re-executes the whole script: sidebar, schedulers, progress panel and
+grid. That is what every click cost before the grid became a fragment.
+"fragment" runs only identify_view's body, Chords.views.identify_grid, which
+is all Streamlit re-executes for a click now that the answer grid is an
+st.fragment.
+
+Needs streamlit. Run from the repository root:
+
+    python -m benchmarks.bench_identify_clicks --clicks 30
+"""
+import argparse
+import os
+import statistics
+import time
+
+
+def identify_fragment_script():
+    import streamlit as st
+
+    from Chords.catalogue import get_catalogue
+    from Chords.quiz import IdentifyQuiz
+    from Chords.views import identify_grid
+
+    catalogue = get_catalogue()
+    sorted_bases = sorted(catalogue.options)
+    if "identify_quiz" not in st.session_state:
+        st.session_state.identify_quiz = IdentifyQuiz(catalogue.selected_chords(sorted_bases))
+    identify_grid(st.session_state.identify_quiz, sorted_bases, catalogue.options)
+
+
+def time_clicks(at, options, clicks):
+    times = []
+    for i in range(clicks):
+        start = time.perf_counter()
+        at.button(key=f"identify_{options[i % len(options)]}").click().run()
+        times.append(time.perf_counter() - start)
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clicks", type=int, default=30)
+    args = parser.parse_args()
+
+    from streamlit.testing.v1 import AppTest
+
+    from Chords.catalogue import get_catalogue
+
+    catalogue = get_catalogue()
+    options = [option for base in sorted(catalogue.options) for option in catalogue.options[base]]
+    # Keep the benchmark off the real progress log.
+    os.environ["CHORD_TRAINER_PROGRESS_DB"] = ""
+
+    app_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+    full = AppTest.from_file(app_path, default_timeout=120)
+    full.run()
+    for checkbox in full.sidebar.checkbox:
+        if checkbox.label in catalogue.options:
+            checkbox.check()
+    full.run()
+    full_times = time_clicks(full, options, args.clicks)
+
+    fragment = AppTest.from_function(identify_fragment_script, default_timeout=120)
+    fragment.run()
+    fragment_times = time_clicks(fragment, options, args.clicks)
+
+    print(f"{len(options)} answer buttons, {args.clicks} clicks")
+    for label, times in (("full rerun", full_times), ("fragment", fragment_times)):
+        print(f"  {label:<11} median {statistics.median(times) * 1e3:8.1f} ms   max {max(times) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
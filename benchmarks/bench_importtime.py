@@ -0,0 +1,84 @@
+"""Reproducible `python -X importtime` breakdown of the app's imports.
+
+Each module is imported in a fresh interpreter (after one warm-up run so .pyc
+files exist), and the cumulative time per top-level import is averaged over
+--repeat runs. Modules that are not installed are reported and skipped.
+Run from the repository root:
+
+    python -m benchmarks.bench_importtime [--json out.json]
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+MODULES = (
+    "streamlit",
+    "PIL.Image",
+    "numpy",
+    "Chords.chords",
+    "Chords.voicings",
+    "Chords.model",
+    "Chords.catalogue",
+    "Chords.diagram_cache",
+)
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def importtime(module):
+    """{imported module: cumulative microseconds} for one fresh import of module ("pass" for none)."""
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "pass" if module == "pass" else f"import {module}"],
+        capture_output=True, text=True, env=env,
+    )
+    if out.returncode != 0:
+        return None
+    timings = {}
+    for line in out.stderr.splitlines():
+        m = _LINE.match(line)
+        if m:
+            timings[m.group(4)] = int(m.group(2))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    interpreter_startup = set(importtime("pass"))
+    results = {}
+    for module in MODULES:
+        if importtime(module) is None:  # warm-up, and availability check
+            print(f"  {module:<22} not importable, skipped")
+            continue
+        totals = defaultdict(int)
+        for _ in range(args.repeat):
+            for name, micros in importtime(module).items():
+                totals[name] += micros
+        mean = {name: total / args.repeat for name, total in totals.items()}
+        results[module] = {
+            "cumulative_us": mean[module],
+            "top": sorted(
+                ((name, micros) for name, micros in mean.items()
+                 if name != module and name not in interpreter_startup),
+                key=lambda item: -item[1],
+            )[:5],
+        }
+        print(f"  {module:<22} {mean[module] / 1e3:8.2f} ms")
+        for name, micros in results[module]["top"]:
+            print(f"      {name:<30} {micros / 1e3:8.2f} ms")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version, "repeat": args.repeat, "modules": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Rendering cost by keyboard range size, and fixed versus voicing-fitted ("auto") ranges.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_keyboard_range [--repeat 5] [--wide 200]
+
+For each range size: the one-off layer build, per-diagram cost of the
+per-rectangle and composited renderers, and PNG encoding. Then the voicing
+library and a set of synthetic multi-octave voicings under each range
+setting: how many distinct ranges (renderer layers) they need, and the cost
+of encoding every diagram from cold.
+"""
+import argparse
+import random
+
+from benchmarks._timing import best_of, timed
+from Chords.encoding import encode_diagram
+from Chords.keyboard import AUTO_RANGE, generate_keyboard_image, group_by_range, keyboard_notes
+from Chords.model import VOICED_CHORDS
+from Chords.renderer import KeyboardRenderer
+from Chords.voicings import CHORD_VOICINGS
+
+RANGES = (("C4", "C5"), ("C3", "C5"), ("C3", "C6"), ("C2", "C7"), ("A0", "C8"))
+SETTINGS = (("C3", "C6"), AUTO_RANGE)
+
+
+def wide_voicings(count, rng):
+    """Chord tones of each library voicing spread over two to six octaves, as an arranger might."""
+    library = list(VOICED_CHORDS.values())
+    voicings = {}
+    for i in range(count):
+        chord = rng.choice(library)
+        span = rng.randint(2, 6)
+        octave = 12 * rng.randint(2, 8 - span)
+        notes = {octave + chord.bass_pc}
+        notes.update(octave + 12 + pc + 12 * rng.randrange(span - 1) for pc in chord.pitch_classes)
+        voicings[f"wide {i}"] = tuple(sorted(notes))
+    return voicings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--wide", type=int, default=200, help="synthetic multi-octave voicings")
+    args = parser.parse_args()
+
+    voicings = [chord.midi for chord in VOICED_CHORDS.values()]
+    spelled = list(CHORD_VOICINGS.values())
+    n = len(voicings)
+    print(f"By range size ({n} voicings, best of {args.repeat}):")
+    for low, high in RANGES:
+        renderer = KeyboardRenderer()
+        layer_build, _ = timed(lambda: renderer.layer(low, high))
+        rect = best_of(lambda: [generate_keyboard_image(v, low, high) for v in spelled], args.repeat) / n
+        composited = best_of(lambda: [renderer.render(v, low, high) for v in voicings], args.repeat) / n
+        png = best_of(lambda: [encode_diagram(v, "png", low, high, renderer=renderer) for v in voicings],
+                      args.repeat) / n
+        png_bytes = sum(len(encode_diagram(v, "png", low, high, renderer=renderer)) for v in voicings) / n
+        keys = len(keyboard_notes(low, high))
+        print(f"  {low}-{high} ({keys:2d} keys)  layer {layer_build * 1e3:6.1f} ms   per-rectangle "
+              f"{rect * 1e6:7.1f} us   composited {composited * 1e6:6.1f} us   "
+              f"png {png * 1e6:7.1f} us, {png_bytes:5.0f} B")
+
+    rng = random.Random(0)
+    sets = {
+        "library": {name: chord.midi for name, chord in VOICED_CHORDS.items()},
+        "wide": wide_voicings(args.wide, rng),
+    }
+    print("Cold encode of every diagram, by range setting:")
+    for label, library in sets.items():
+        for setting in SETTINGS:
+            groups = group_by_range(library, setting)
+            renderer = KeyboardRenderer()
+            total, _ = timed(lambda: [encode_diagram(notes, "png", low, high, renderer=renderer)
+                                      for (low, high), group in groups.items() for notes in group.values()])
+            name = setting if setting == AUTO_RANGE else "-".join(setting)
+            sizes = sorted({len(keyboard_notes(low, high)) for low, high in groups})
+            print(f"  {label:<8} {name:<6} {len(groups):3d} ranges (keys {sizes[0]}-{sizes[-1]})   "
+                  f"{total * 1e3:8.1f} ms total, layers included")
+
+
+if __name__ == "__main__":
+    main()
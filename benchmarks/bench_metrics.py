@@ -0,0 +1,64 @@
+"""Overhead of metrics instrumentation, disabled and enabled, and the cost of a scrape.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_metrics --calls 200000
+
+"end to end" runs the headless quiz benchmark in a subprocess with and
+without CHORD_TRAINER_METRICS, since collection is decided at import.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+from benchmarks._timing import per_call, timed
+from Chords.metrics import METRICS_ENV_VAR, MetricsRegistry
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200000)
+    parser.add_argument("--questions", type=int, default=50000, help="questions per quiz benchmark run")
+    args = parser.parse_args()
+
+    def work():
+        pass
+
+    baseline = per_call(work, args.calls)
+    print(f"plain call                     {baseline * 1e9:8.0f} ns")
+    for enabled in (False, True):
+        registry = MetricsRegistry(enabled)
+        counter = registry.counter("bench_total", "Calls.", ("mode",))
+        histogram = registry.histogram("bench_seconds", "Seconds.", ("stage",))
+        decorated = registry.timed(histogram, "decorated")(work)
+
+        def timed_block():
+            with histogram.time("block"):
+                pass
+
+        label = "enabled" if enabled else "disabled"
+        print(f"{label}:")
+        print(f"  counter.inc                  {per_call(lambda: counter.inc('identify'), args.calls) * 1e9:8.0f} ns")
+        print(f"  with histogram.time()        {per_call(timed_block, args.calls) * 1e9:8.0f} ns")
+        print(f"  @timed call, minus plain     {(per_call(decorated, args.calls) - baseline) * 1e9:8.0f} ns")
+        if enabled:
+            for i in range(200):
+                counter.inc(f"mode{i}")
+            elapsed, text = timed(registry.exposition)
+            print(f"  exposition                   {elapsed * 1e3:8.2f} ms "
+                  f"({len(text.splitlines())} lines)")
+
+    print("end to end (benchmarks.bench_quiz):")
+    for enabled in (False, True):
+        env = {k: v for k, v in os.environ.items() if not k.startswith(METRICS_ENV_VAR)}
+        if enabled:
+            env[METRICS_ENV_VAR] = "1"
+        out = subprocess.run([sys.executable, "-m", "benchmarks.bench_quiz", "--questions", str(args.questions)],
+                             env=env, capture_output=True, text=True, check=True).stdout
+        engine_lines = [line.strip() for line in out.splitlines() if "(engine)" in line]
+        print(f"  metrics {'on ' if enabled else 'off'}: " + " | ".join(engine_lines))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Per-event latency of MIDI chord recognition, replaying recorded note streams.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_midi --chords 2000
+    python -m benchmarks.bench_midi --replay session.txt
+
+Without --replay, a stream is recorded first: random voicings from
+CHORD_VOICINGS, shifted by octaves and rolled up note by note, so the
+recognizer also sees partial chords. The hash index is compared with a
+linear scan over every chord's pitch-class set.
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from Chords.midi_input import NOTE_OFF, NOTE_ON, ChordListener, ChordRecognizer, MidiEvent, ReplaySource, write_replay
+from Chords.model import VOICED_CHORDS
+
+
+def record_stream(n_chords, seed=0):
+    rng = random.Random(seed)
+    names = list(VOICED_CHORDS)
+    events, t, expected = [], 0.0, []
+    for _ in range(n_chords):
+        name = rng.choice(names)
+        shift = 12 * rng.choice((-1, 0, 1))
+        notes = [n + shift for n in VOICED_CHORDS[name].midi]
+        expected.append(name)
+        for note in notes:
+            t += rng.uniform(0.005, 0.03)
+            events.append(MidiEvent(t, NOTE_ON, note, 80))
+        t += 0.4
+        for note in rng.sample(notes, len(notes)):
+            t += rng.uniform(0.0, 0.02)
+            events.append(MidiEvent(t, NOTE_OFF, note, 0))
+        t += 0.2
+    return events, expected
+
+
+class LinearListener(ChordListener):
+    """Baseline: the same listener, recognizing by scanning every chord."""
+
+    def __init__(self):
+        super().__init__()
+        self._chords = list(VOICED_CHORDS.values())
+        self.recognizer.matches = self._scan
+
+    def _scan(self, mask, bass, midi_notes):
+        return [c.name for c in self._chords if c.pc_mask == mask and c.bass_pc == bass % 12]
+
+
+def time_events(listener, events):
+    latencies = []
+    played = 0
+    for event in events:
+        start = time.perf_counter()
+        result = listener.feed(event)
+        latencies.append(time.perf_counter() - start)
+        played += result is not None
+    return latencies, played
+
+
+def report(label, latencies):
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99)]
+    print(f"  {label:<12} mean {statistics.fmean(latencies) * 1e6:7.2f} us   "
+          f"p50 {latencies[len(latencies) // 2] * 1e6:7.2f} us   p99 {p99 * 1e6:7.2f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chords", type=int, default=2000, help="chords in the recorded stream")
+    parser.add_argument("--replay", help="replay an existing recording instead")
+    args = parser.parse_args()
+
+    expected = None
+    if args.replay:
+        path = args.replay
+    else:
+        events, expected = record_stream(args.chords)
+        fd, path = tempfile.mkstemp(suffix=".txt")
+        os.close(fd)
+        write_replay(path, events)
+    try:
+        start = time.perf_counter()
+        events = list(ReplaySource(path))
+        parse_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        recognizer = ChordRecognizer()
+        index_ms = (time.perf_counter() - start) * 1e3
+
+        listener = ChordListener(recognizer)
+        hashed, played = time_events(listener, events)
+        linear, _ = time_events(LinearListener(), events)
+
+        print(f"{len(events)} events, {played} chords played (index built in {index_ms:.2f} ms, "
+              f"replay parsed in {parse_s * 1e3:.1f} ms)")
+        report("hash index", hashed)
+        report("linear scan", linear)
+        if expected is not None:
+            recognized = [[m.name for m in matches] for matches, _ in ChordListener(recognizer).run(events)]
+            hits = sum(name in names for name, names in zip(expected, recognized))
+            print(f"  recognized {hits}/{len(expected)} recorded chords")
+    finally:
+        if not args.replay:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
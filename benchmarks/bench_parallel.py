@@ -0,0 +1,49 @@
+"""Throughput (diagrams/sec) of render_batch_parallel at different worker counts.
+
+The voicing library is repeated to simulate a large set (thousands of diagrams).
+Run from the repository root:
+
+    python -m benchmarks.bench_parallel --copies 20 --workers 1 2 4
+"""
+import argparse
+import os
+import time
+
+from Chords.batch import render_batch_parallel
+from Chords.encoding import encode_png
+from Chords.keyboard import generate_keyboard_image
+from Chords.model import VOICED_CHORDS
+from Chords.pitch import midi_to_name
+
+
+def serial_baseline(voicings):
+    # The pre-batch path: one generate_keyboard_image + PNG encode per diagram.
+    return [encode_png(generate_keyboard_image([midi_to_name(m) for m in v])) for v in voicings]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=10, help="times to repeat the voicing library")
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, os.cpu_count() or 1}))
+    parser.add_argument("--format", default="png", choices=["png", "webp", "svg"])
+    parser.add_argument("--chunk-size", type=int, default=None)
+    args = parser.parse_args()
+
+    voicings = [chord.midi for chord in VOICED_CHORDS.values()] * args.copies
+    n = len(voicings)
+    print(f"{n} diagrams, format={args.format}, {os.cpu_count()} CPUs")
+
+    start = time.perf_counter()
+    serial_baseline(voicings)
+    elapsed = time.perf_counter() - start
+    print(f"  generate_keyboard_image, serial  {n / elapsed:9.0f} diagrams/sec")
+
+    for workers in args.workers:
+        start = time.perf_counter()
+        render_batch_parallel(voicings, args.format, workers=workers, chunk_size=args.chunk_size)
+        elapsed = time.perf_counter() - start
+        print(f"  render_batch_parallel workers={workers:<3} {n / elapsed:9.0f} diagrams/sec")
+
+
+if __name__ == "__main__":
+    main()
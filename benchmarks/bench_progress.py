@@ -0,0 +1,75 @@
+"""Click-path cost of logging an answer: queued batched writes versus a synchronous commit per answer.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_progress --answers 20000
+"""
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from Chords.model import VOICED_CHORDS
+from Chords.progress import ProgressStore
+
+
+def fake_answers(n, rng):
+    names = list(VOICED_CHORDS)
+    for _ in range(n):
+        chord = rng.choice(names)
+        answer = chord if rng.random() < 0.7 else rng.choice(names)
+        yield "bench", "identify the position", chord, answer, answer == chord, True, rng.uniform(0.5, 8)
+
+
+def bench_store(path, answers):
+    store = ProgressStore(path)
+    start = time.perf_counter()
+    for row in answers:
+        store.record(*row)
+    click = (time.perf_counter() - start) / len(answers)
+    store.flush()
+    total = time.perf_counter() - start
+    start = time.perf_counter()
+    store.chord_accuracy()
+    accuracy = time.perf_counter() - start
+    start = time.perf_counter()
+    store.accuracy_over_time(answers[0][2])
+    over_time = time.perf_counter() - start
+    store.close()
+    return click, total, accuracy, over_time
+
+
+def bench_sync(path, answers):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE answers (ts REAL, session TEXT, mode TEXT, chord TEXT, answer TEXT, "
+                 "correct INTEGER, first INTEGER, elapsed_ms INTEGER)")
+    start = time.perf_counter()
+    for row in answers:
+        conn.execute("INSERT INTO answers VALUES (?, ?, ?, ?, ?, ?, ?, ?)", (time.time(), *row[:6], round(row[6] * 1000)))
+        conn.commit()
+    click = (time.perf_counter() - start) / len(answers)
+    conn.close()
+    return click
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--answers", type=int, default=20000)
+    parser.add_argument("--sync-answers", type=int, default=500)
+    args = parser.parse_args()
+
+    answers = list(fake_answers(args.answers, random.Random(0)))
+    with tempfile.TemporaryDirectory() as tmp:
+        click, total, accuracy, over_time = bench_store(os.path.join(tmp, "store.sqlite3"), answers)
+        sync = bench_sync(os.path.join(tmp, "sync.sqlite3"), answers[:args.sync_answers])
+    print(f"ProgressStore.record          {click * 1e6:8.2f} us/answer on the click path")
+    print(f"  all {len(answers)} committed after  {total * 1e3:8.1f} ms")
+    print(f"  chord_accuracy              {accuracy * 1e3:8.2f} ms")
+    print(f"  accuracy_over_time (1 chord) {over_time * 1e3:7.2f} ms")
+    print(f"INSERT + commit per answer    {sync * 1e6:8.2f} us/answer on the click path")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Headless quiz throughput: questions/sec for both modes with every chord selected.
+
+Each question is next_question() plus one wrong and one right submit_answer()
+(and, in play mode, drawing the options). Run from the repository root:
+
+    python -m benchmarks.bench_quiz --questions 100000
+"""
+import argparse
+import random
+import time
+
+from Chords.catalogue import get_catalogue
+from Chords.model import VOICED_CHORDS
+from Chords.quiz import IdentifyQuiz, PlayQuiz
+
+
+def run_identify(quiz, questions):
+    wrong = quiz.pool[0]
+    for _ in range(questions):
+        current = quiz.next_question()
+        quiz.submit_answer(wrong)
+        quiz.submit_answer(current)
+
+
+def run_play(quiz, questions):
+    for _ in range(questions):
+        current = quiz.next_question()
+        options = quiz.options
+        quiz.submit_answer(options[0])
+        quiz.submit_answer(current)
+
+
+def legacy_play(pool, questions, rng):
+    # The pre-engine app.py logic: filtered list comprehensions on every question.
+    current = rng.choice(pool)
+    for _ in range(questions):
+        current = rng.choice([ch for ch in pool if ch != current] or pool)
+        other_chords = [ch for ch in pool if ch != current]
+        options = [current] + rng.sample(other_chords, min(3, len(other_chords)))
+        rng.shuffle(options)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--questions", type=int, default=50000)
+    args = parser.parse_args()
+
+    catalogue = get_catalogue()
+    all_chords = catalogue.selected_chords(catalogue.grouped)
+    voiced = [name for name in all_chords if name in VOICED_CHORDS]
+    n = args.questions
+
+    for label, fn in [
+        ("identify (engine)", lambda: run_identify(IdentifyQuiz(all_chords, rng=random.Random(0)), n)),
+        ("play (engine)", lambda: run_play(PlayQuiz(voiced, rng=random.Random(0)), n)),
+        ("play (legacy list rebuild)", lambda: legacy_play(voiced, n, random.Random(0))),
+    ]:
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<28} {n / elapsed:10.0f} questions/sec  ({elapsed / n * 1e6:6.2f} us/question)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Compare the per-rectangle PIL renderer with the base-layer compositing renderer.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_renderer
+"""
+import argparse
+
+from benchmarks._timing import best_of, timed
+from Chords.keyboard import generate_keyboard_image
+from Chords.renderer import KeyboardRenderer
+from Chords.voicings import CHORD_VOICINGS
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    voicings = list(CHORD_VOICINGS.values())
+    n = len(voicings)
+    renderer = KeyboardRenderer()
+
+    layer_build, _ = timed(renderer.layer)
+
+    rect = best_of(lambda: [generate_keyboard_image(v) for v in voicings], args.repeat)
+    single = best_of(lambda: [renderer.render(v) for v in voicings], args.repeat)
+    batch = best_of(lambda: renderer.render_batch(voicings), args.repeat)
+    batch_array = best_of(lambda: renderer.render_batch_array(voicings), args.repeat)
+
+    print(f"{n} voicings, best of {args.repeat}")
+    print(f"  base layer build (one-off):   {layer_build * 1e3:8.2f} ms")
+    for label, total in [
+        ("per-rectangle PIL", rect),
+        ("composited, one at a time", single),
+        ("composited batch -> images", batch),
+        ("composited batch -> array", batch_array),
+    ]:
+        print(f"  {label:<29} {total / n * 1e6:8.1f} us/diagram  ({rect / total:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Cost per "Next Chord" of the Leitner scheduler versus the old list-rebuild + random.choice.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_scheduler --sizes 300 3000 30000
+"""
+import argparse
+import random
+import time
+
+from Chords.scheduler import LeitnerScheduler
+
+
+def bench_scheduler(n, steps, rng):
+    clock = [0.0]
+    scheduler = LeitnerScheduler(range(n), clock=lambda: clock[0])
+    current = None
+    start = time.perf_counter()
+    for _ in range(steps):
+        current = scheduler.next(exclude=current)
+        scheduler.record(current, rng.random() < 0.7)
+        clock[0] += 5
+    return (time.perf_counter() - start) / steps
+
+
+def bench_legacy(names, steps, rng):
+    current = names[0]
+    start = time.perf_counter()
+    for _ in range(steps):
+        remaining = [ch for ch in names if ch != current]
+        current = rng.choice(remaining)
+    return (time.perf_counter() - start) / steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[300, 3000, 30000])
+    parser.add_argument("--steps", type=int, default=5000)
+    args = parser.parse_args()
+
+    for n in args.sizes:
+        names = [f"chord {i}" for i in range(n)]
+        sched = bench_scheduler(n, args.steps, random.Random(0))
+        legacy = bench_legacy(names, min(args.steps, 500), random.Random(0))
+        print(f"  n={n:<6} scheduler next+record {sched * 1e6:8.2f} us   list rebuild + choice {legacy * 1e6:10.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Resident memory per Playing the Position session: pinned diagram images versus chord names.
+
+"images" reproduces the old session layout: four freshly rendered RGB diagrams
+pinned per session. "names" is the current layout: four chord names per session,
+with diagrams resolved through the shared DIAGRAM_CACHE.
+
+Each variant runs in its own subprocess so freed memory does not skew the other.
+Linux only (reads /proc/self/statm). Run from the repository root:
+
+    python -m benchmarks.bench_session_memory --sessions 200
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import subprocess
+import sys
+
+
+def rss_bytes():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def build_sessions(variant, count, seed=0):
+    from Chords.diagram_cache import DIAGRAM_CACHE
+    from Chords.keyboard import generate_keyboard_image
+    from Chords.model import VOICED_CHORDS
+    from Chords.voicings import CHORD_VOICINGS
+
+    rng = random.Random(seed)
+    names = list(VOICED_CHORDS)
+    # Load the modules and the renderer's base layer before measuring.
+    DIAGRAM_CACHE.get(VOICED_CHORDS[names[0]].midi)
+    generate_keyboard_image(CHORD_VOICINGS[names[0]])
+    gc.collect()
+
+    before = rss_bytes()
+    sessions = []
+    for _ in range(count):
+        options = rng.sample(names, 4)
+        if variant == "images":
+            play_options = [(name, generate_keyboard_image(CHORD_VOICINGS[name])) for name in options]
+        else:
+            play_options = options
+            for name in options:
+                DIAGRAM_CACHE.get(VOICED_CHORDS[name].midi)
+        sessions.append({"play_options": play_options})
+    gc.collect()
+    after = rss_bytes()
+    return {
+        "variant": variant,
+        "sessions": count,
+        "rss_delta_bytes": after - before,
+        "bytes_per_session": (after - before) / count,
+        "shared_cache_bytes": DIAGRAM_CACHE.stats()["bytes"] if variant == "names" else 0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--variant", choices=["images", "names"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        print(json.dumps(build_sessions(args.variant, args.sessions)))
+        return
+
+    for variant in ("images", "names"):
+        out = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_session_memory", "--variant", variant,
+             "--sessions", str(args.sessions)],
+            check=True, capture_output=True, text=True,
+        )
+        result = json.loads(out.stdout)
+        print(f"{variant:>6}: {result['bytes_per_session'] / 1024:8.1f} KiB/session over {args.sessions} sessions"
+              f"  (shared cache {result['shared_cache_bytes'] / 1024 / 1024:.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
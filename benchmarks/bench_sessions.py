@@ -0,0 +1,75 @@
+"""Memory per concurrent session in the SessionManager, and the cost of get() and idle eviction.
+
+Each session holds a quiz over every chord, answered for a few questions,
+as a learner would leave it. Bytes per session come from the manager's own
+stats(); traced bytes (tracemalloc) are the cross-check. Run from the
+repository root:
+
+    python -m benchmarks.bench_sessions --sessions 5000
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from Chords.catalogue import get_catalogue
+from Chords.model import VOICED_CHORDS
+from Chords.quiz import EarQuiz, IdentifyQuiz, PlayQuiz
+from Chords.scheduler import LeitnerScheduler
+from Chords.sessions import QuizSession, SessionManager
+
+
+def make_session(kind, pool, rng):
+    voiced = [name for name in pool if name in VOICED_CHORDS]
+    scheduler = LeitnerScheduler() if kind == "identify+schedule" else None
+    if kind == "play":
+        quiz = PlayQuiz(voiced, rng=random.Random(rng.random()))
+    elif kind == "ear":
+        quiz = EarQuiz(voiced, rng=random.Random(rng.random()))
+    else:
+        quiz = IdentifyQuiz(pool, rng=random.Random(rng.random()), scheduler=scheduler)
+    for _ in range(20):
+        if kind == "play":
+            quiz.submit_answer(quiz.options[0])
+        elif kind == "ear":
+            quiz.submit_answer(next(iter(quiz.labels.values()))[0])
+        else:
+            quiz.submit_answer(rng.choice(pool))
+        quiz.next_question()
+    return QuizSession(quiz.mode, quiz, get_catalogue().options)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=5000)
+    args = parser.parse_args()
+
+    catalogue = get_catalogue()
+    pool = catalogue.selected_chords(sorted(catalogue.options))
+    rng = random.Random(0)
+    for kind in ("identify", "play", "ear", "identify+schedule"):
+        clock = [0.0]
+        sessions = SessionManager(max_sessions=args.sessions, ttl=60, clock=lambda: clock[0])
+        tracemalloc.start()
+        ids = [sessions.create(make_session(kind, pool, rng)) for _ in range(args.sessions)]
+        traced, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        stats = sessions.stats()
+
+        start = time.perf_counter()
+        for session_id in rng.choices(ids, k=100000):
+            sessions.get(session_id)
+        get_us = (time.perf_counter() - start) / 100000 * 1e6
+
+        clock[0] = 120.0
+        start = time.perf_counter()
+        sessions.get(None)
+        expire_ms = (time.perf_counter() - start) * 1e3
+
+        print(f"{kind:<18} {stats['bytes_per_session'] / 1024:6.1f} KiB/session (stats), "
+              f"{traced / args.sessions / 1024:6.1f} KiB/session (traced)   get {get_us:5.2f} us   "
+              f"expire {args.sessions} idle in {expire_ms:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Cost of drawing Playing the Position distractors: similarity-index lookup versus ranking on every question.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_similarity --questions 2000
+"""
+import argparse
+import random
+import time
+
+from Chords.model import VOICED_CHORDS
+from Chords.similarity import SimilarityIndex, voicing_distance
+
+
+def bench_index(index, pool, questions, difficulty, rng):
+    restricted = index.restricted(frozenset(pool))
+    start = time.perf_counter()
+    for _ in range(questions):
+        restricted.distractors(rng.choice(pool), 3, difficulty, rng)
+    return (time.perf_counter() - start) / questions
+
+
+def bench_rank_each_time(pool, questions, rng):
+    start = time.perf_counter()
+    for _ in range(questions):
+        name = rng.choice(pool)
+        chord = VOICED_CHORDS[name]
+        ranked = sorted((voicing_distance(chord, VOICED_CHORDS[o]), o) for o in pool if o != name)
+        rng.sample(ranked[:6], 3)
+    return (time.perf_counter() - start) / questions
+
+
+def bench_random(pool, questions, rng):
+    start = time.perf_counter()
+    for _ in range(questions):
+        name = rng.choice(pool)
+        rng.sample([ch for ch in pool if ch != name], 3)
+    return (time.perf_counter() - start) / questions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--questions", type=int, default=2000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = SimilarityIndex()
+    print(f"index build ({len(VOICED_CHORDS)} voicings): {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+    pool = list(VOICED_CHORDS)
+    for difficulty in ("easy", "medium", "hard"):
+        t = bench_index(index, pool, args.questions, difficulty, random.Random(0))
+        print(f"  index lookup ({difficulty:<6})        {t * 1e6:8.2f} us/question")
+    t = bench_rank_each_time(pool, min(args.questions, 200), random.Random(0))
+    print(f"  rank whole pool per question  {t * 1e6:8.2f} us/question")
+    t = bench_random(pool, args.questions, random.Random(0))
+    print(f"  list rebuild + random sample  {t * 1e6:8.2f} us/question")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Import time of the chord data modules, and eager vs lazy voicing parsing.
+
+Import times are measured in fresh interpreters (best of --repeat). The
+synthetic library repeats RAW_VOICINGS under renamed roots to simulate growth.
+Run from the repository root:
+
+    python -m benchmarks.bench_voicings_import --scale 50
+"""
+import argparse
+import subprocess
+import sys
+import tempfile
+
+from benchmarks._timing import timed
+from Chords.voicings import RAW_VOICINGS, VoicingStore, export_voicings, parse_voicings
+
+IMPORT_SNIPPET = (
+    "import time; t = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - t)"
+)
+
+
+def import_seconds(module, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", IMPORT_SNIPPET.format(module=module)],
+            check=True, capture_output=True, text=True,
+        )
+        best = min(best, float(out.stdout))
+    return best
+
+
+def synthetic_library(scale):
+    lines = []
+    for i in range(scale):
+        for line in RAW_VOICINGS.strip().splitlines():
+            root, rest = line.strip().split(" ", 1)
+            lines.append(f"{root}~{i} {rest}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=int, default=50, help="copies of RAW_VOICINGS in the synthetic library")
+    args = parser.parse_args()
+
+    print(f"Import time, fresh interpreter, best of {args.repeat}")
+    for module in ("Chords.chords", "Chords.voicings", "Chords.model"):
+        print(f"  {module:<16} {import_seconds(module, args.repeat) * 1e3:8.2f} ms")
+
+    text = synthetic_library(args.scale)
+    eager_time, eager = timed(lambda: parse_voicings(text))
+    probe = next(iter(eager))
+    print(f"\nSynthetic library: {len(eager)} voicings")
+    print(f"  parse_voicings (eager, whole text)       {eager_time * 1e3:8.2f} ms")
+
+    store = VoicingStore.from_text(text)
+    first, _ = timed(lambda: store[probe])
+    second, _ = timed(lambda: store[probe])
+    print(f"  VoicingStore.from_text, first lookup     {first * 1e3:8.2f} ms")
+    print(f"  VoicingStore.from_text, repeat lookup    {second * 1e6:8.2f} us")
+
+    with tempfile.TemporaryDirectory() as directory:
+        export_voicings(eager, directory)
+        store = VoicingStore.from_directory(directory)
+        first, _ = timed(lambda: store[probe])
+        print(f"  VoicingStore.from_directory, first lookup {first * 1e3:7.2f} ms"
+              f"  (loaded {len(store.loaded_groups())}/{len(store.groups)} groups)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Load generator for Chords.server: p50/p99 latency and requests/sec.
+
+Each simulated learner opens a keep-alive connection, creates a session and
+then loops question -> answer -> next (fetching the option diagrams in play
+mode, the audio clip in ear mode). By default the server runs in-process; pass --url to target a running
+one. Run from the repository root:
+
+    python -m benchmarks.load_api --clients 50 --seconds 10 --mode play
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from urllib.parse import urlsplit
+
+from Chords.atlas import DEFAULT_AUDIO_BANK
+from Chords.build_assets import load_current_atlas
+from Chords.server import QuizAPI, serve
+
+
+class Client:
+    def __init__(self, host, port):
+        self.host, self.port = host, port
+        self.reader = self.writer = None
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method, path, payload=None):
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Length: {len(body)}\r\n\r\n".encode("latin-1")
+            + body
+        )
+        status_line = await self.reader.readline()
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        data = await self.reader.readexactly(length)
+        status = int(status_line.split()[1])
+        if status >= 400:
+            raise RuntimeError(f"{method} {path} -> {status}: {data!r}")
+        return data
+
+    async def close(self):
+        self.writer.close()
+
+
+async def learner(host, port, mode, deadline, latencies, rng):
+    client = Client(host, port)
+    await client.connect()
+
+    async def timed(method, path, payload=None):
+        start = time.perf_counter()
+        data = await client.request(method, path, payload)
+        latencies.append(time.perf_counter() - start)
+        return data
+
+    created = json.loads(await timed("POST", "/sessions", {"mode": mode, "bases": ["C major", "A minor", "G major",
+                                                                                   "E minor", "D major"]}))
+    session = created["session"]
+    question = created["question"]
+    while time.perf_counter() < deadline:
+        if mode == "play":
+            for url in question["options"]:
+                await timed("GET", url)
+            answer = rng.randrange(len(question["options"]))
+        elif mode == "ear":
+            await timed("GET", question["audio"])
+            answer = rng.choice([label for labels in question["options"].values() for label in labels])
+        else:
+            answer = rng.choice([name for names in question["options"].values() for name in names])
+        await timed("POST", f"/sessions/{session}/answer", {"answer": answer})
+        question = json.loads(await timed("POST", f"/sessions/{session}/next"))
+    await client.close()
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+async def run(args):
+    server = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname, parts.port or 80
+    else:
+        server = await serve("127.0.0.1", 0, QuizAPI(audio_bank=load_current_atlas(args.audio_bank)))
+        host, port = server.sockets[0].getsockname()[:2]
+
+    latencies = []
+    start = time.perf_counter()
+    deadline = start + args.seconds
+    await asyncio.gather(*(
+        learner(host, port, args.mode, deadline, latencies, random.Random(i)) for i in range(args.clients)
+    ))
+    elapsed = time.perf_counter() - start
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+
+    latencies.sort()
+    print(f"{args.clients} clients, mode={args.mode}, {elapsed:.1f}s")
+    print(f"  requests   {len(latencies)}")
+    print(f"  req/sec    {len(latencies) / elapsed:10.0f}")
+    print(f"  p50        {percentile(latencies, 0.50) * 1e3:10.2f} ms")
+    print(f"  p99        {percentile(latencies, 0.99) * 1e3:10.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="target a running server, e.g. http://127.0.0.1:8000")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--mode", choices=["identify", "play", "ear"], default="play")
+    parser.add_argument("--audio-bank", default=DEFAULT_AUDIO_BANK, help="for the in-process server")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
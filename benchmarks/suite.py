@@ -0,0 +1,162 @@
+"""Headless benchmark suite: data loading, grouping, rendering and quiz logic, written to JSON.
+
+Run from the repository root (no Streamlit needed):
+
+    python -m benchmarks.suite --output bench.json
+    python -m benchmarks.suite --output new.json --compare bench.json [--threshold 0.1] [--fail-on-regression]
+
+Every result is a time ("seconds", lower is better) or a rate ("per_second",
+higher is better), so runs can be compared metric by metric. --compare
+prints the change against an earlier file and flags regressions beyond
+--threshold; with --fail-on-regression the exit status is 1 if there are any.
+The per-topic scripts next to this one go deeper into each area.
+"""
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+
+from benchmarks._timing import best_of
+from benchmarks.bench_quiz import run_identify, run_play
+from benchmarks.bench_voicings_import import import_seconds, synthetic_library
+from Chords.catalogue import Catalogue
+from Chords.chords import CHORDS
+from Chords.keyboard import generate_keyboard_image
+from Chords.model import COMPILED_CHORDS, VOICED_CHORDS
+from Chords.quiz import IdentifyQuiz, PlayQuiz
+from Chords.renderer import KeyboardRenderer
+from Chords.voicings import CHORD_VOICINGS, parse_voicings
+
+IMPORT_MODULES = ("Chords.chords", "Chords.voicings")
+# Keyboard ranges, one octave to the full 88 keys.
+RANGES = (("C4", "C5"), ("C3", "C6"), ("C2", "C7"), ("A0", "C8"))
+
+
+# --- Benchmarks: each returns {name: (value, unit)} ---
+def bench_imports(args):
+    return {f"import.{module}": (import_seconds(module, args.repeat), "seconds") for module in IMPORT_MODULES}
+
+
+def bench_parse_voicings(args):
+    text = synthetic_library(args.scale)
+    lines = text.count("\n") + 1
+    elapsed = best_of(lambda: parse_voicings(text), args.repeat)
+    return {
+        "parse_voicings.seconds": (elapsed, "seconds"),
+        "parse_voicings.lines": (lines / elapsed, "per_second"),
+    }
+
+
+def bench_grouping(args):
+    return {"catalogue.build": (best_of(lambda: Catalogue(CHORDS, COMPILED_CHORDS), args.repeat), "seconds")}
+
+
+def bench_keyboard(args):
+    voicings = list(CHORD_VOICINGS.values())[:args.diagrams]
+    results = {}
+    for low, high in RANGES:
+        renderer = KeyboardRenderer()
+        layer = best_of(lambda: renderer.layer(low, high), 1)  # the first call builds the layer
+        pil = best_of(lambda: [generate_keyboard_image(v, low, high) for v in voicings], args.repeat)
+        composited = best_of(lambda: [renderer.render(v, low, high) for v in voicings], args.repeat)
+        key = f"keyboard.{low}-{high}"
+        results[f"{key}.generate_keyboard_image"] = (pil / len(voicings), "seconds")
+        results[f"{key}.composited"] = (composited / len(voicings), "seconds")
+        results[f"{key}.layer_build"] = (layer, "seconds")
+    return results
+
+
+def bench_questions(args):
+    chords = tuple(CHORDS)
+    voiced = [name for name in chords if name in VOICED_CHORDS]
+    n = args.questions
+    identify = best_of(lambda: run_identify(IdentifyQuiz(chords, rng=random.Random(0)), n), args.repeat)
+    play = best_of(lambda: run_play(PlayQuiz(voiced, rng=random.Random(0)), n), args.repeat)
+    return {
+        "questions.identify": (n / identify, "per_second"),
+        "questions.play": (n / play, "per_second"),
+    }
+
+
+BENCHMARKS = {
+    "imports": bench_imports,
+    "parse_voicings": bench_parse_voicings,
+    "grouping": bench_grouping,
+    "keyboard": bench_keyboard,
+    "questions": bench_questions,
+}
+
+
+# --- Reporting ---
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short=12", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def compare(results, baseline, threshold):
+    """Print each metric's change against baseline; returns the names that regressed beyond threshold."""
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None or not old["value"]:
+            print(f"  {name:<48} new")
+            continue
+        change = result["value"] / old["value"] - 1
+        worse = change > threshold if result["unit"] == "seconds" else change < -threshold
+        if worse:
+            regressions.append(name)
+        print(f"  {name:<48} {change:+8.1%}{'  REGRESSION' if worse else ''}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", action="append", choices=sorted(BENCHMARKS), help="run only these (repeatable)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=int, default=50, help="copies of RAW_VOICINGS to parse")
+    parser.add_argument("--diagrams", type=int, default=100, help="voicings drawn per keyboard range")
+    parser.add_argument("--questions", type=int, default=20000)
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative change counted as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    results = {}
+    for group in args.only or BENCHMARKS:
+        for name, (value, unit) in BENCHMARKS[group](args).items():
+            results[name] = {"value": value, "unit": unit}
+            shown = f"{value * 1e3:10.3f} ms" if unit == "seconds" else f"{value:10.0f} /s"
+            print(f"  {name:<48} {shown}")
+
+    report = {
+        "meta": {
+            "timestamp": time.time(),
+            "commit": git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "args": {k: v for k, v in vars(args).items() if k not in ("output", "compare")},
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"Against {args.compare} ({baseline['meta'].get('commit') or 'unknown commit'}):")
+        regressions = compare(results, baseline["results"], args.threshold)
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from Chords import analytics
+from Chords.analytics import AnswerStats
+from Chords.progress import DAY, ProgressStore
+from Chords.quiz import EAR_MODE, EarQuiz
+
+ANSWERS = [
+    # chord, answer, first, elapsed seconds
+    ("C major root", "C major root", True, 1.0),
+    ("C major root", "A minor root", True, 3.0),
+    ("C major root", "C major root", False, 1.0),
+    ("A minor root", "C major root", True, 2.0),
+    ("A minor root", "C major root", True, 2.0),
+    ("A minor root", "A minor root", True, 1.5),
+]
+
+
+def summarize(db, tmp_path):
+    output = str(tmp_path / "summary.npz")
+    analytics.main(["--db", db, "--output", output])
+    return AnswerStats.load(output)
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = str(tmp_path / "progress.sqlite3")
+    store = ProgressStore(path, clock=lambda: DAY + 60)
+    for chord, answer, first, elapsed in ANSWERS:
+        store.record("s1", "identify", chord, answer, chord == answer, first, elapsed)
+    store.flush()
+    yield path, store
+    store.close()
+
+
+def test_compaction_keeps_accuracy_and_confusions(db, tmp_path):
+    path, store = db
+    before = summarize(path, tmp_path)
+    assert before.chord_accuracy() == {"C major root": (2, 1, 2.0), "A minor root": (3, 1, 5.5 / 3)}
+    assert before.top_confusions() == [("A minor root", "C major root", 2), ("C major root", "A minor root", 1)]
+
+    assert store.compact(before=3 * DAY) == len(ANSWERS)
+    after = summarize(path, tmp_path)
+    assert after.chord_accuracy() == before.chord_accuracy()
+    assert after.top_confusions() == before.top_confusions()
+    assert np.array_equal(after.confusion, before.confusion)
+    assert after.by_attribute("quality") == before.by_attribute("quality")
+
+
+def test_medians_cover_uncompacted_answers_only(db, tmp_path):
+    path, store = db
+    assert summarize(path, tmp_path).median_seconds("A minor root") == 2.0
+    store.compact(before=3 * DAY)
+    assert summarize(path, tmp_path).median_seconds("A minor root") is None
+
+
+def test_database_compacted_without_confusion_days(db, tmp_path):
+    path, store = db
+    store.compact(before=3 * DAY)
+    store._writer.execute("DROP TABLE confusion_days")
+    stats = summarize(path, tmp_path)
+    assert stats.chord_accuracy()["A minor root"][:2] == (3, 1)
+    assert stats.top_confusions() == []
+
+
+def test_ear_mode_answers_are_summarized(tmp_path):
+    path = str(tmp_path / "progress.sqlite3")
+    store = ProgressStore(path)
+    quiz = EarQuiz(["C major root", "C major 1st inversion"], recorder=store.recorder("s1"))
+    quiz.submit_answer("major root")
+    store.close()
+
+    output = str(tmp_path / "ear.npz")
+    analytics.main(["--db", path, "--mode", "ear", "--output", output])
+    stats = AnswerStats.load(output)
+    assert stats.mode == EAR_MODE
+    assert sum(n for n, _, _ in stats.chord_accuracy().values()) == 1
+    assert stats.skipped == 0
+
+
+def test_stale_summary_skips_removed_chords(tmp_path):
+    stats = AnswerStats(names=["C major root", "Q removed root"])
+    stats.update([("identify", "C major root", "C major root", True, True, 1000),
+                  ("identify", "Q removed root", "C major root", False, True, 1000)])
+    path = str(tmp_path / "stale.npz")
+    stats.save(path)
+    assert AnswerStats.load(path).by_attribute("inversion") == {0: (1, 1, 1.0)}
+
+
+def test_unreadable_summaries_raise_value_error(tmp_path):
+    other_bins = str(tmp_path / "bins.npz")
+    AnswerStats().save(other_bins)
+    with np.load(other_bins) as data:
+        arrays = dict(data)
+    arrays["time_bins_ms"] = arrays["time_bins_ms"][:-1]
+    np.savez(other_bins, **arrays)
+    del arrays["names"]
+    np.savez(str(tmp_path / "missing.npz"), **arrays)
+    (tmp_path / "garbage.npz").write_bytes(b"PK\x03\x04 not really a zip")
+    for name in ("bins.npz", "missing.npz", "garbage.npz"):
+        with pytest.raises(ValueError):
+            AnswerStats.load(str(tmp_path / name))
@@ -0,0 +1,19 @@
+import pytest
+
+from Chords.batch import _encode_chunk, render_batch_parallel
+from Chords.encoding import encode_diagram
+
+VOICINGS = [(60, 64, 67), (57, 60, 64)]
+
+
+@pytest.mark.parametrize("fmt", ["png", "webp", "svg"])
+def test_batch_matches_single_encodes(fmt):
+    assert render_batch_parallel(VOICINGS, fmt, workers=1) == [encode_diagram(v, fmt) for v in VOICINGS]
+
+
+@pytest.mark.parametrize("fmt", ["PNG", "jpeg", "", None])
+def test_unknown_format_is_rejected(fmt):
+    with pytest.raises(ValueError):
+        render_batch_parallel(VOICINGS, fmt, workers=1)
+    with pytest.raises(ValueError):
+        _encode_chunk((VOICINGS, fmt, "C3", "C6", (700, 150), "light"))
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from Chords.keyboard import (AUTO_RANGE, generate_keyboard_image, keyboard_layout, parse_keyboard_range, resolve_range,
+                             shared_range, to_sharp)
+from Chords.pitch import note_to_midi
+from Chords.renderer import KeyboardRenderer
+from Chords.voicings import CHORD_VOICINGS
+
+YELLOW = (255, 255, 0)
+
+
+def lit_keys(img, low_note="C3", high_note="C6", size=(700, 150)):
+    """Keys whose centre pixel (below the black keys, for white ones) is the highlight colour."""
+    rgb = np.asarray(img.convert("RGB"))
+    lit = set()
+    for note, is_black, (x0, y0, x1, y1) in keyboard_layout(low_note, high_note, size):
+        y = int((y0 + y1) / 2) if is_black else int(y1) - 5
+        if tuple(rgb[y, int((x0 + x1) / 2)]) == YELLOW:
+            lit.add(note)
+    return lit
+
+
+@pytest.mark.parametrize("note, expected", [("Eb4", "D#4"), ("E#3", "F3"), ("Bbb4", "A4"), ("Cb4", "B3"),
+                                            ("F##3", "G3"), ("C4", "C4")])
+def test_to_sharp(note, expected):
+    assert to_sharp(note) == expected
+
+
+def test_diminished_chord_with_double_flat_is_fully_highlighted():
+    notes = CHORD_VOICINGS["Eb diminished root"]
+    assert "Bbb4" in notes
+    img = generate_keyboard_image(notes)
+    assert lit_keys(img) == {"D#4", "F#4", "A4"}
+    composited = KeyboardRenderer().render(notes)
+    assert np.array_equal(np.asarray(img.convert("RGB")), np.asarray(composited.convert("RGB")))
+    assert generate_keyboard_image([note_to_midi(n) for n in notes]).tobytes() == img.tobytes()
+
+
+@pytest.mark.parametrize("text, expected", [("auto", AUTO_RANGE), (" C3-C6 ", ("C3", "C6")), ("Cb4-E#5", ("B3", "F5")),
+                                            ("A0-C8", ("A0", "C8"))])
+def test_parse_keyboard_range(text, expected):
+    assert parse_keyboard_range(text) == expected
+
+
+@pytest.mark.parametrize("text", ["C#3-C6", "C3-Bb5", "C6-C3", "C3", "C3-C3"])
+def test_parse_keyboard_range_rejects(text):
+    with pytest.raises(ValueError):
+        parse_keyboard_range(text)
+
+
+def test_shared_range_covers_every_option():
+    root, inversion = CHORD_VOICINGS["C major root"], CHORD_VOICINGS["C major 2nd inversion"]
+    assert resolve_range(root) != resolve_range(inversion)
+    low, high = shared_range([root, inversion])
+    for notes in (root, inversion):
+        assert resolve_range(notes, (low, high)) == (low, high)
+    assert shared_range([root, inversion], ("C3", "C6")) == ("C3", "C6")
@@ -0,0 +1,46 @@
+from Chords.audio import AudioCache
+from Chords.diagram_cache import DiagramCache
+from Chords.lru import ByteLRU
+
+
+def test_evicts_least_recently_used_down_to_max_bytes():
+    lru = ByteLRU(max_bytes=10)
+    lru.put("a", b"1234")
+    lru.put("b", b"1234")
+    assert lru.get("a") == b"1234"  # "b" is now the least recently used
+    lru.put("c", b"1234")
+    assert lru.get("b") is None
+    assert lru.get("a") == b"1234" and lru.get("c") == b"1234"
+    assert lru.stats() == {"entries": 2, "bytes": 8, "max_bytes": 10, "hits": 3, "misses": 1, "evictions": 1,
+                           "hit_rate": 0.75}
+
+
+def test_keeps_an_oversized_newest_entry():
+    lru = ByteLRU(max_bytes=4, sizeof=lambda value: value)
+    lru.put("small", 3)
+    lru.put("big", 100)
+    assert len(lru) == 1 and lru.get("big") == 100
+
+
+def test_put_of_an_existing_key_keeps_the_first_value():
+    lru = ByteLRU(max_bytes=100)
+    lru.put("k", b"first")
+    lru.put("k", b"second!")
+    assert lru.get("k") == b"first"
+    assert lru.stats()["bytes"] == 5
+
+
+def test_caches_share_the_accounting():
+    renders = []
+    audio = AudioCache(max_bytes=1, render=lambda *key: renders.append(key) or b"wav")
+    assert audio.get([60, 64, 67]) == audio.get(["C4", "E4", "G4"]) == b"wav"
+    assert len(renders) == 1
+    assert audio.stats()["hits"] == 1 and audio.max_bytes == 1
+
+    diagrams = DiagramCache()
+    diagrams.get_encoded([60, 64, 67])
+    diagrams.get_encoded(["C4", "E4", "G4"])
+    stats = diagrams.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 1, 1)
+    diagrams.clear()
+    assert len(diagrams) == 0
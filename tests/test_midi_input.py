@@ -0,0 +1,23 @@
+from Chords.midi_input import ChordListener, ChordRecognizer, MidiEvent, NOTE_OFF, NOTE_ON
+
+
+def test_matches_agrees_with_identify():
+    recognizer = ChordRecognizer()
+    notes = [60, 64, 67]
+    mask = sum(1 << (n % 12) for n in set(notes))
+    assert recognizer.matches(mask, min(notes), notes) == recognizer.identify(notes)
+    assert "C major root" in [m.name for m in recognizer.matches(mask, 60, notes)]
+    assert recognizer.matches(mask, 62, notes) == []
+
+
+def test_listener_goes_through_public_matches():
+    recognizer = ChordRecognizer()
+    calls = []
+    real = recognizer.matches
+    recognizer.matches = lambda *args: calls.append(args) or real(*args)
+    listener = ChordListener(recognizer)
+    for t, note in enumerate([57, 60, 64]):
+        listener.feed(MidiEvent(t, NOTE_ON, note, 80))
+    played = listener.feed(MidiEvent(3, NOTE_OFF, 60, 0))
+    assert len(calls) == 1
+    assert "A minor root" in [m.name for m in played[0]]
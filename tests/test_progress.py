@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from Chords import progress
+from Chords.progress import DAY, ProgressStore, user_data_dir
+
+
+@pytest.fixture
+def store():
+    store = ProgressStore(":memory:", clock=lambda: 10 * DAY)
+    yield store
+    store.close()
+
+
+def test_in_memory_stores_are_separate(store):
+    other = ProgressStore(":memory:")
+    try:
+        store.record("s1", "identify", "C major root", "C major root", True, True, 1.0)
+        store.flush()
+        other.flush()
+        assert store.chord_accuracy() == {"C major root": (1, 1, 1.0)}
+        assert other.chord_accuracy() == {}
+    finally:
+        other.close()
+
+
+def test_compact_keeps_accuracy(store):
+    for correct in (True, False, True):
+        store.record("s1", "identify", "C major root", "C major root" if correct else "A minor root", correct, True, 2.0)
+    store.flush()
+    before = store.chord_accuracy()
+    assert store.compact(before=11 * DAY) == 3
+    assert store.chord_accuracy() == before
+
+
+def test_rejected_batch_is_dropped_and_the_writer_keeps_going(store):
+    store._writer.execute("ALTER TABLE answers RENAME TO answers_moved")
+    store.record("s1", "identify", "C major root", "C major root", True, True, 1.0)
+    store.flush()
+    assert store.dropped == 1
+    store._writer.execute("ALTER TABLE answers_moved RENAME TO answers")
+    store.record("s1", "identify", "A minor root", "A minor root", True, True, 1.0)
+    store.flush()
+    assert store.chord_accuracy() == {"A minor root": (1, 1, 1.0)}
+
+
+def test_stopped_writer_raises_instead_of_blocking(store, monkeypatch):
+    def fail(rows):
+        raise TypeError("bad row")
+
+    monkeypatch.setattr(store, "_write_batch", fail)
+    store.record("s1", "identify", "C major root", "C major root", True, True, 1.0)
+    with pytest.raises(RuntimeError):
+        store.flush()
+    with pytest.raises(RuntimeError):
+        store.record("s1", "identify", "C major root", "C major root", True, True, 1.0)
+    store._thread.join(timeout=5)
+    assert not store._thread.is_alive()
+
+
+def test_learner_data_defaults_outside_the_package(monkeypatch, tmp_path):
+    package = os.path.dirname(os.path.abspath(progress.__file__))
+    assert not os.path.abspath(progress.DEFAULT_PROGRESS_DB).startswith(package)
+    monkeypatch.delenv(progress.DATA_DIR_ENV_VAR, raising=False)
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "xdg"))
+    assert user_data_dir() == str(tmp_path / "xdg" / "chord-trainer")
+    monkeypatch.setenv(progress.DATA_DIR_ENV_VAR, str(tmp_path / "custom"))
+    assert user_data_dir() == str(tmp_path / "custom")
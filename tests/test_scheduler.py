@@ -0,0 +1,103 @@
+import json
+import random
+
+import pytest
+
+from Chords.catalogue import get_catalogue
+from Chords.quiz import IdentifyQuiz
+from Chords.scheduler import BOX_INTERVALS, LeitnerScheduler, dump_schedules, load_schedules
+from Chords.sessions import deep_sizeof
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_next_follows_due_time_then_error_rate():
+    clock = Clock()
+    scheduler = LeitnerScheduler(range(4), clock=clock)
+    scheduler.record(0, True)
+    scheduler.record(1, False)
+    scheduler.record(2, True)
+    clock.now = 1.0
+    # 3 is unseen and due at 0; 1 was wrong (box 0) and is due at 0 too, with the higher error rate.
+    assert scheduler.next() == 1
+    assert scheduler.next(exclude=1) == 3
+    clock.now = BOX_INTERVALS[1]
+    scheduler.record(1, True)
+    scheduler.record(3, True)
+    assert scheduler.next() == 0
+    assert scheduler.stats(1) == {"box": 1, "due": 2.0 * BOX_INTERVALS[1], "reviews": 2, "errors": 1}
+
+
+def test_exclude_matches_a_full_pop_order():
+    clock = Clock()
+    rng = random.Random(0)
+    scheduler = LeitnerScheduler(range(50), clock=clock)
+    current = None
+    for _ in range(500):
+        ranked = sorted(range(50), key=scheduler._key)
+        expected = ranked[1] if ranked[0] == current else ranked[0]
+        current = scheduler.next(exclude=current)
+        assert current == expected
+        scheduler.record(current, rng.random() < 0.7)
+        clock.now += 5
+
+
+def test_pool_changes_keep_cards():
+    scheduler = LeitnerScheduler(range(3), clock=Clock())
+    scheduler.record(2, False)
+    scheduler.set_pool([0, 1])
+    assert scheduler.next(exclude=0) == 1
+    assert scheduler.stats(2)["errors"] == 1
+    assert scheduler.stats(7) is None
+    scheduler.set_pool([2])
+    assert scheduler.next() == 2
+
+
+def test_state_round_trips_by_chord_name():
+    names = get_catalogue().names
+    scheduler = LeitnerScheduler(range(10), clock=Clock())
+    scheduler.record(3, True)
+    scheduler.record(5, False)
+    data = scheduler.dumps()
+    assert set(json.loads(data)["cards"]) == {names[3], names[5]}
+    loaded = LeitnerScheduler.loads(data, range(10), clock=Clock())
+    assert loaded.dumps() == data
+    assert loaded.next() == 5
+
+
+def test_scheduled_quiz_stays_small():
+    pool = get_catalogue().names
+    scheduler = LeitnerScheduler()
+    quiz = IdentifyQuiz(pool, rng=random.Random(0), scheduler=scheduler)
+    seen = set()
+    for _ in range(20):
+        seen.add(quiz.current)
+        quiz.submit_answer(pool[0])
+        quiz.next_question()
+    assert len(seen) > 1
+    assert deep_sizeof(scheduler) < 25 * len(pool) + 1024
+
+
+def test_saved_schedules_round_trip():
+    scheduler = LeitnerScheduler(range(5), clock=Clock())
+    scheduler.record(2, False)
+    loaded = load_schedules(dump_schedules({"identify": scheduler}), ("identify", "play"))
+    assert loaded["identify"].dumps() == scheduler.dumps()
+    assert loaded["play"].dumps() == LeitnerScheduler().dumps()
+
+
+@pytest.mark.parametrize("data", [
+    b"", b'{"identify": "{\\"v\\":1', b"[1, 2]", b'{"identify": "{\\"v\\":2,\\"cards\\":{}}"}',
+    b'{"identify": "{\\"v\\":1}"}', b'{"identify": 5}', b"\xff\xfe",
+    b'{"identify": "{\\"v\\":1,\\"cards\\":{\\"C major root\\":[1,2]}}"}',
+    b'{"identify": "{\\"v\\":1,\\"cards\\":{\\"C major root\\":[999,0,1,0]}}"}',
+])
+def test_bad_saved_schedules_raise_value_error(data):
+    with pytest.raises(ValueError):
+        load_schedules(data, ("identify", "play"))
@@ -0,0 +1,106 @@
+import asyncio
+import io
+import json
+
+import pytest
+from PIL import Image
+
+from Chords.keyboard import parse_keyboard_range
+from Chords.server import QuizAPI, make_handler
+
+
+@pytest.fixture(scope="module")
+def api():
+    return QuizAPI()
+
+
+async def _exchange(api, raw):
+    srv = await asyncio.start_server(make_handler(api), "127.0.0.1", 0)
+    port = srv.sockets[0].getsockname()[1]
+    async with srv:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(raw)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    if body and b"application/json" in head:
+        body = json.loads(body)
+    return int(head.split()[1]), body or None
+
+
+def request(api, method, path, body=b"", headers=()):
+    lines = [f"{method} {path} HTTP/1.1", "Host: test", "Connection: close", *headers]
+    if body and not any(h.lower().startswith("content-length") for h in headers):
+        lines.append(f"Content-Length: {len(body)}")
+    raw = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+    return asyncio.run(_exchange(api, raw))
+
+
+def post_json(api, path, payload):
+    return request(api, "POST", path, json.dumps(payload).encode("utf-8"))
+
+
+@pytest.mark.parametrize("length", ["abc", "-1", "1.5", "²"])
+def test_bad_content_length_is_400(api, length):
+    status, body = request(api, "POST", "/sessions", b"{}", headers=[f"Content-Length: {length}"])
+    assert status == 400
+    assert "Content-Length" in body["error"]
+
+
+@pytest.mark.parametrize("bases", [5, "Major", [["x"]], [1, 2], {"a": 1}])
+def test_bad_bases_is_400(api, bases):
+    status, body = post_json(api, "/sessions", {"mode": "identify", "bases": bases})
+    assert status == 400
+    assert "bases" in body["error"]
+
+
+def test_bool_is_not_a_play_option_index(api):
+    status, created = post_json(api, "/sessions", {"mode": "play"})
+    assert status == 201
+    for answer in (True, False):
+        status, body = post_json(api, f"/sessions/{created['session']}/answer", {"answer": answer})
+        assert status == 400
+    status, body = post_json(api, f"/sessions/{created['session']}/answer", {"answer": 0})
+    assert status == 200
+
+
+def test_unexpected_error_is_500(api, monkeypatch, capsys):
+    def boom(payload):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(api, "create_session", boom)
+    status, body = post_json(api, "/sessions", {})
+    assert status == 500
+    assert body == {"error": "Internal Server Error"}
+    assert "RuntimeError: boom" in capsys.readouterr().err
+
+
+def test_routes_still_work(api):
+    status, body = request(api, "GET", "/health")
+    assert status == 200 and body["status"] == "ok"
+
+
+def test_play_options_share_one_range(api):
+    status, created = post_json(api, "/sessions", {"mode": "play", "bases": ["C major", "A minor", "G major"]})
+    assert status == 201
+    options = created["question"]["options"]
+    ranges = {url.split("/")[2] for url in options}
+    assert len(ranges) == 1
+    low, high = parse_keyboard_range(ranges.pop())
+    sizes = set()
+    for url in options:
+        status, png = request(api, "GET", url)
+        assert status == 200
+        sizes.add(Image.open(io.BytesIO(png)).size)
+    assert len(sizes) == 1
+
+
+def test_diagram_range_must_be_one_a_question_could_use(api):
+    status, created = post_json(api, "/sessions", {"mode": "play", "bases": ["C major"]})
+    token = created["question"]["options"][0].rsplit("/", 1)[1]
+    for key_range in ("D3-C6", "C#3-C6", "C7-C8", "nonsense"):
+        status, _ = request(api, "GET", f"/diagrams/{key_range}/{token}")
+        assert status == 404
+    status, _ = request(api, "GET", f"/diagrams/{token}")
+    assert status == 200
@@ -0,0 +1,29 @@
+import gc
+import weakref
+
+from Chords.model import VOICED_CHORDS
+from Chords.similarity import RESTRICTED_CACHE_SIZE, SimilarityIndex
+
+NAMES = list(VOICED_CHORDS)[:40]
+
+
+def test_restricted_is_cached_per_pool():
+    index = SimilarityIndex({name: VOICED_CHORDS[name] for name in NAMES})
+    pool = frozenset(NAMES[:10])
+    restricted = index.restricted(pool)
+    assert index.restricted(frozenset(NAMES[:10])) is restricted
+    assert set(restricted.neighbours) == pool
+    assert all(set(ranked) <= pool for ranked in restricted.neighbours.values())
+
+
+def test_cache_is_bounded_and_dropped_with_its_index():
+    index = SimilarityIndex({name: VOICED_CHORDS[name] for name in NAMES})
+    first = index.restricted(frozenset(NAMES[:2]))
+    for i in range(RESTRICTED_CACHE_SIZE):
+        index.restricted(frozenset(NAMES[i:i + 3]))
+    assert index.restricted(frozenset(NAMES[:2])) is not first
+
+    ref = weakref.ref(index)
+    del index, first
+    gc.collect()
+    assert ref() is None
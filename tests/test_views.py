@@ -0,0 +1,27 @@
+from streamlit.testing.v1 import AppTest
+
+
+def grid_script():
+    import streamlit as st
+
+    from Chords.catalogue import get_catalogue
+    from Chords.quiz import IdentifyQuiz
+    from Chords.views import identify_grid
+
+    catalogue = get_catalogue()
+    bases = ["A minor", "C major"]
+    if "quiz" not in st.session_state:
+        st.session_state.quiz = IdentifyQuiz(catalogue.selected_chords(bases))
+    identify_grid(st.session_state.quiz, bases, catalogue.options)
+
+
+def test_identify_grid_grades_clicks():
+    at = AppTest.from_function(grid_script, default_timeout=60).run()
+    quiz = at.session_state.quiz
+    wrong = next(name for name in quiz.pool if name != quiz.current)
+    at.button(key=f"identify_{wrong}").click().run()
+    # Streamlit turns a leading emoji into the element's icon.
+    assert [e.value for e in at.error] == [f"{wrong} ❌", "Incorrect. Try again!"]
+    at.button(key=f"identify_{quiz.current}").click().run()
+    assert at.success[-1].value == f"Correct! It was {quiz.current}"
+    assert quiz.current_attempts() == [wrong, quiz.current]
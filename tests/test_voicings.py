@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+
+from Chords.chords import CHORDS
+from Chords.model import compile_chords
+from Chords.voicings import VOICINGS_DIR_ENV_VAR, export_voicings, load_chord_voicings
+
+OVERRIDES = {
+    "C major root": ["C3", "G3", "E4"],
+    "A minor 1st inversion": ["C4", "E4", "A4"],
+    "C augmented root": ["C4", "E4", "G#4"],
+}
+
+
+def test_overrides_replace_generated_voicings(tmp_path):
+    export_voicings(OVERRIDES, str(tmp_path))
+    generated = load_chord_voicings()
+    layered = load_chord_voicings(str(tmp_path))
+
+    assert layered["C major root"] == ["C3", "G3", "E4"]
+    assert layered["D major root"] == generated["D major root"]
+    assert "C augmented root" not in layered
+    assert list(layered) == list(generated)
+
+    compiled = compile_chords(CHORDS, layered)
+    assert compiled["C major root"].midi == (48, 55, 64)
+    assert compiled["A minor 1st inversion"].midi == (60, 64, 69)
+
+
+def test_lookup_loads_only_its_group(tmp_path):
+    export_voicings(OVERRIDES, str(tmp_path))
+    layered = load_chord_voicings(str(tmp_path))
+    layered["C major root"]
+    assert layered.overrides.loaded_groups() == ["major"]
+
+
+def test_environment_variable_applies_overrides(tmp_path):
+    export_voicings(OVERRIDES, str(tmp_path))
+    env = dict(os.environ, **{VOICINGS_DIR_ENV_VAR: str(tmp_path)})
+    out = subprocess.run(
+        [sys.executable, "-c", "from Chords.model import VOICED_CHORDS; print(VOICED_CHORDS['C major root'].midi)"],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    assert out.stdout.strip() == "(48, 55, 64)"